@@ -0,0 +1,102 @@
+"""Micro-benchmark of the validation of a single file or folder name.
+
+Compares the previous implementation, which validated a name with a first regular
+expression and parsed it with a split in a second pass, with the single match
+extracting the fields through named groups. The previous implementation parsed the
+date with datetime.strptime and compared it to datetime.now() for every file, while
+the current one compares the memoized date to a reference date captured once.
+
+Usage: python benchmarks/bench_names.py
+"""
+
+import re
+import timeit
+from datetime import datetime
+from functools import partial
+
+from fcbg_ruff.check._regex import (
+    _reference_date,
+    _validate_file_name,
+    _validate_folder_name,
+)
+from fcbg_ruff.check.config import _FORBIDDEN_NAME_CHARACTERS, _USERCODE_LENGTH
+
+_LEGACY_FILE_STEM = re.compile(
+    r"F\d+[a-z]*_\d{6}_[^_]{1}.*_[A-Z]{"
+    + ",".join([str(i) for i in _USERCODE_LENGTH])
+    + "}"
+)
+_LEGACY_FOLDER_NAME = re.compile(r"_F\d+[a-z]*_[^_]{1}.*")
+
+
+def _legacy_file_name(name: str, parent: str) -> dict[str, list[int]]:
+    """Validate a file name with a match followed by a split."""
+    stem = name.rsplit(".", 1)[0]
+    if re.fullmatch(_LEGACY_FILE_STEM, stem) is None:
+        return {"primary": [1], "secondary": []}
+    elts = stem.split("_")
+    code, date, name_ = elts[0], elts[1], "_".join(elts[2:-1])
+    error_codes = dict(primary=[], secondary=[])
+    if any(elt in name_ for elt in _FORBIDDEN_NAME_CHARACTERS):
+        error_codes["primary"].append(3)
+    if re.fullmatch(_LEGACY_FOLDER_NAME, parent) is None:
+        error_codes["secondary"].append(101)
+    elif parent[1:].split("_")[0] != code:
+        error_codes["primary"].append(11)
+    if datetime.now() < datetime.strptime(date, "%y%m%d"):
+        error_codes["primary"].append(21)
+    return error_codes
+
+
+def _legacy_folder_name(name: str, parent: str) -> dict[str, list[int]]:
+    """Validate a folder name with a match followed by a split."""
+    if re.fullmatch(_LEGACY_FOLDER_NAME, name) is None:
+        return {"primary": [2], "secondary": []}
+    elts = name[1:].split("_")
+    code, name_ = elts[0], "_".join(elts[1:])
+    error_codes = dict(primary=[], secondary=[])
+    if any(elt in name_ for elt in _FORBIDDEN_NAME_CHARACTERS):
+        error_codes["primary"].append(3)
+    if re.fullmatch(_LEGACY_FOLDER_NAME, parent) is None:
+        if len(re.compile(r"_F\d+([a-z]*)").match(name).group(1)) != 0:
+            error_codes["secondary"].append(101)
+    elif parent[1:].split("_")[0] != code[:-1]:
+        error_codes["primary"].append(11)
+    return error_codes
+
+
+# arguments of the previous and of the current implementation, which receives the
+# code of the parent folder parsed beforehand.
+_CASES = {
+    "file": (
+        ("F1a_220101_Some_file_name_ABC.txt", "_F1a_Some_folder"),
+        ("F1a_220101_Some_file_name_ABC.txt", "F1a", _reference_date()),
+        _legacy_file_name,
+        _validate_file_name,
+    ),
+    "folder": (
+        ("_F1ab_Some_folder_name", "_F1a_Some_folder"),
+        ("_F1ab_Some_folder_name", "F1a"),
+        _legacy_folder_name,
+        _validate_folder_name,
+    ),
+}
+
+
+def main(number: int = 200_000, repeat: int = 5) -> None:
+    """Print the per-name cost of both implementations."""
+    for kind, (legacy_args, args, legacy, current) in _CASES.items():
+        errors = current(*args)
+        assert legacy(*legacy_args) == (errors if kind == "file" else errors[0])
+        for label, func, args_ in (
+            ("before", legacy, legacy_args),
+            ("after", current, args),
+        ):
+            best = min(
+                timeit.repeat(partial(func, *args_), number=number, repeat=repeat)
+            )
+            print(f"{kind:<6} {label:<6} {best / number * 1e6:8.2f} us/name")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""Benchmark suite of the validation, from a single name to the check command.
+
+The suite generates synthetic trees of increasing size with
+:func:`fcbg_ruff.bench.generate_tree` and times:
+
+- ``names``: :func:`~fcbg_ruff.check._regex.validate_file_name` and
+  :func:`~fcbg_ruff.check._regex.validate_folder_name` on the names of the tree.
+- ``rules``: :func:`~fcbg_ruff.check.validate_folder` on the tree loaded in memory
+  in a :class:`~fcbg_ruff.check.DictSource`, i.e. the cost of the rules without
+  the I/O.
+- ``validate_folder``: :func:`~fcbg_ruff.check.validate_folder` for each number of
+  jobs.
+- ``check``: the ``check`` command end-to-end in a new interpreter, output file
+  included.
+
+Each case runs in a fresh process and reports the best time over the repetitions.
+Its peak resident set size is sampled by the parent process, summed over the case
+process and its children, e.g. the workers. The peak reported by the kernel is not
+used: on Linux, a process inherits the peak of its parent across fork and exec,
+thus every case would report at least the peak of this script. The results are saved
+to a JSON file, which can be compared to the results of a previous run to spot a
+regression.
+
+Usage:
+    python benchmarks/bench_suite.py --output results.json
+    python benchmarks/bench_suite.py --sizes small medium --jobs 1 4
+    python benchmarks/bench_suite.py --output new.json --compare old.json
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import platform
+import queue
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+import psutil
+
+# (depth, fanout, files per folder) of the generated trees
+_SIZES = {
+    "tiny": (2, 2, 2),  # ~20 entries, to test the suite
+    "small": (3, 4, 10),  # ~1k entries
+    "medium": (4, 6, 20),  # ~40k entries
+    "large": (4, 10, 80),  # ~10^6 entries
+}
+# interval between two samples of the memory usage, in seconds
+_INTERVAL = 0.01
+
+
+def _rss(process: psutil.Process) -> int:
+    """Resident set size of a process and of its children, recursively."""
+    rss = 0
+    for elt in [process, *process.children(recursive=True)]:
+        try:
+            rss += elt.memory_info().rss
+        except psutil.Error:
+            pass  # the child exited
+    return rss
+
+
+def _names(tree: str, repeat: int) -> dict[str, float]:
+    """Time the validation of the name of each entry of a tree, listed beforehand."""
+    from fcbg_ruff.check._regex import validate_file_name, validate_folder_name
+
+    files = []
+    folders = []
+    for root, dirnames, filenames in os.walk(tree):
+        folders.extend(os.path.join(root, name) for name in dirnames)
+        files.extend(os.path.join(root, name) for name in filenames)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for path in files:
+            validate_file_name(path)
+        for path in folders:
+            validate_folder_name(path)
+        best = min(best, time.perf_counter() - start)
+    return {"seconds": best}
+
+
+def _rules(tree: str, repeat: int) -> dict[str, float]:
+    """Time the validation of a tree loaded in memory beforehand."""
+    from fcbg_ruff.check import DictSource, validate_folder
+
+    def _load(folder: str) -> dict:
+        with os.scandir(folder) as entries:
+            return {
+                entry.name: _load(entry.path) if entry.is_dir() else None
+                for entry in entries
+            }
+
+    root, name = os.path.split(tree)
+    source = DictSource({name: _load(tree)})
+    os.chdir(root)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        validate_folder(name, source=source)
+        best = min(best, time.perf_counter() - start)
+    return {"seconds": best}
+
+
+def _validate_folder(tree: str, repeat: int, n_jobs: int) -> dict[str, float]:
+    """Time the validation of a tree."""
+    from fcbg_ruff.check import validate_folder
+
+    warnings.filterwarnings("ignore", "The number of requested jobs")
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        validate_folder(tree, n_jobs=n_jobs)
+        best = min(best, time.perf_counter() - start)
+    return {"seconds": best}
+
+
+def _check(tree: str, repeat: int, n_jobs: int) -> dict[str, float]:
+    """Time the check command in a new interpreter, output file included."""
+    best = float("inf")
+    with tempfile.TemporaryDirectory() as tmp:
+        command = [
+            sys.executable,
+            "-c",
+            "from fcbg_ruff.commands.main import run; run()",
+            "check",
+            tree,
+            "--output",
+            os.path.join(tmp, "output.txt"),
+            "--jobs",
+            str(n_jobs),
+        ]
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run(command, check=True, capture_output=True)
+            best = min(best, time.perf_counter() - start)
+    return {"seconds": best}
+
+
+_CASES = {
+    "names": _names,
+    "rules": _rules,
+    "validate_folder": _validate_folder,
+    "check": _check,
+}
+
+
+def _target(results: mp.Queue, case: str, args: tuple) -> None:
+    """Run a benchmark case and send its result."""
+    results.put(_CASES[case](*args))
+
+
+def _run(case: str, *args) -> dict[str, float]:
+    """Run a benchmark case in a fresh process and sample its memory usage."""
+    context = mp.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=_target, args=(results, case, args))
+    process.start()
+    tree = psutil.Process(process.pid)
+    peak = 0
+    while True:
+        try:
+            peak = max(peak, _rss(tree))
+        except psutil.Error:
+            pass  # the process exited
+        alive = process.is_alive()
+        try:
+            # the result is sent before the process exits
+            result = results.get(timeout=_INTERVAL if alive else 1)
+            break
+        except queue.Empty:
+            if not alive:
+                raise RuntimeError(
+                    f"The benchmark case '{case}' exited with code {process.exitcode}."
+                ) from None
+    process.join()
+    result["peak_rss"] = peak
+    return result
+
+
+def _metadata() -> dict[str, str | int]:
+    """Describe the environment of the benchmark."""
+    from fcbg_ruff import __version__
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "version": __version__,
+        "commit": commit,
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _key(result: dict) -> tuple:
+    """Identify a benchmark case across runs."""
+    return (result["benchmark"], result["size"], result.get("n_jobs"))
+
+
+def _compare(results: list[dict], fname: Path) -> None:
+    """Print the throughput relative to a previous run."""
+    with open(fname) as fid:
+        previous = {_key(result): result for result in json.load(fid)["results"]}
+    print(f"\nCompared to '{fname}' (throughput ratio, < 1 is slower):")
+    for result in results:
+        if _key(result) not in previous:
+            continue
+        ratio = (
+            result["entries_per_second"] / previous[_key(result)]["entries_per_second"]
+        )
+        flag = "  <-- slower" if ratio < 0.9 else ""
+        print(f"  {' '.join(str(elt) for elt in _key(result)):<32} {ratio:6.2f}{flag}")
+
+
+def main() -> None:
+    """Generate the trees, run the benchmark cases and save the results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", nargs="+", choices=_SIZES, default=list(_SIZES))
+    parser.add_argument("--jobs", nargs="+", type=int, default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="JSON file to save the results.")
+    parser.add_argument("--compare", type=Path, help="JSON file of a previous run.")
+    parser.add_argument("--tmp", type=Path, help="Folder where the trees are written.")
+    args = parser.parse_args()
+
+    from fcbg_ruff.bench import generate_tree
+
+    results = []
+    with tempfile.TemporaryDirectory(dir=args.tmp) as tmp:
+        for size in args.sizes:
+            depth, fanout, n_files = _SIZES[size]
+            tree = os.path.join(tmp, size)
+            counts = generate_tree(
+                tree,
+                depth=depth,
+                fanout=fanout,
+                n_files=n_files,
+                n_jobs=min(4, os.cpu_count()),
+            )
+            entries = counts["folders"] + counts["files"]
+            print(f"{size}: {entries} entries")
+            cases = [("names", None), ("rules", None)]
+            cases += [("validate_folder", n_jobs) for n_jobs in args.jobs]
+            cases += [("check", n_jobs) for n_jobs in args.jobs]
+            for case, n_jobs in cases:
+                params = (
+                    (tree, args.repeat)
+                    if n_jobs is None
+                    else (tree, args.repeat, n_jobs)
+                )
+                result = _run(case, *params)
+                results.append(
+                    {
+                        "benchmark": case,
+                        "size": size,
+                        "n_jobs": n_jobs,
+                        "entries": entries,
+                        "seconds": result["seconds"],
+                        "entries_per_second": entries / result["seconds"],
+                        "peak_rss": result["peak_rss"],
+                    }
+                )
+                print(
+                    f"  {case:<16} jobs={n_jobs or '-':<2} "
+                    f"{results[-1]['entries_per_second']:>12,.0f} entries/s "
+                    f"{result['peak_rss'] / 2**20:>8.1f} MiB"
+                )
+    if args.output is not None:
+        with open(args.output, "w") as fid:
+            json.dump({"metadata": _metadata(), "results": results}, fid, indent=2)
+    if args.compare is not None:
+        _compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
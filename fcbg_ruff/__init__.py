@@ -1,4 +1,23 @@
-from . import check, utils
-from ._version import __version__
-from .utils.config import sys_info
-from .utils.logs import add_file_handler, set_log_level
+from typing import TYPE_CHECKING
+
+from .utils._lazy import lazy_attach
+
+# the submodules, the version read from the package metadata and the system
+# information are imported on first access, thus the command line and the worker
+# processes only import what they use.
+__getattr__, __dir__, __all__ = lazy_attach(
+    __name__,
+    submodules=("bench", "check", "utils"),
+    attributes={
+        "__version__": "_version",
+        "add_file_handler": "utils.logs",
+        "set_log_level": "utils.logs",
+        "sys_info": "utils.config",
+    },
+)
+
+if TYPE_CHECKING:
+    from . import bench, check, utils
+    from ._version import __version__
+    from .utils.config import sys_info
+    from .utils.logs import add_file_handler, set_log_level
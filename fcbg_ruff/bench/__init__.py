@@ -0,0 +1 @@
+from ._tree import generate_tree
@@ -0,0 +1,291 @@
+from __future__ import annotations  # c.f. PEP 563, PEP 649
+
+import multiprocessing as mp
+import os
+import random
+import string
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+from ..check.config import _USERCODE_LENGTH
+from ..check.validator import _ensure_n_jobs
+from ..utils._checks import check_type, ensure_int, ensure_path
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+_ALPHABET: str = string.ascii_letters + string.digits
+# dates in the past with a 2-digit year, encoded as in the file names
+_DATES: tuple[str, ...] = tuple(
+    (date(2019, 1, 1) + timedelta(days=k)).strftime("%y%m%d") for k in range(5 * 365)
+)
+_EXTENSIONS: tuple[str, ...] = (".txt", ".pdf", ".docx", ".xlsx", ".png")
+# error codes injected in the names, see fcbg_ruff.check.config.ERRORS
+_FILE_VIOLATIONS: tuple[int, ...] = (1, 3, 11, 21)
+_FOLDER_VIOLATIONS: tuple[int, ...] = (2, 3, 11)
+# the walk is split in tasks until each worker has a few subtrees to generate
+_TASKS_PER_JOB: int = 4
+
+
+def generate_tree(
+    folder: Path | str,
+    *,
+    depth: int = 4,
+    fanout: int = 4,
+    n_files: int = 5,
+    old_ratio: float = 0.3,
+    violation_rate: float = 0.01,
+    seed: int = 0,
+    n_jobs: int = 1,
+) -> dict[str, int]:
+    """Generate a synthetic documentary structure.
+
+    The content of each folder is drawn from a random generator seeded from ``seed``
+    and the relative path of the folder, thus the generated tree does not depend on
+    the number of jobs or on the order in which the folders are written. The files
+    are empty.
+
+    Parameters
+    ----------
+    folder : Path | str
+        Path to the folder in which the tree is generated. The folder is created if
+        it does not exist, and must be empty otherwise.
+    depth : int
+        Number of nested levels of folders below ``folder``.
+    fanout : int
+        Number of subfolders in each folder, between 1 and 26 since each subfolder
+        appends a letter to the code of its parent.
+    n_files : int
+        Number of files in each folder, except ``folder`` itself.
+    old_ratio : float
+        Ratio of the folders containing an ``__Old`` folder, which holds ``n_files``
+        files and is excluded from the validation.
+    violation_rate : float
+        Ratio of the files and folders with an injected violation of the naming
+        convention. The entries below an invalid folder are not counted as injected
+        violations, even if they are reported by the validation.
+    seed : int
+        Seed of the random generators.
+    n_jobs : int
+        Number of processes writing the tree in parallel.
+
+    Returns
+    -------
+    counts : dict
+        Number of ``"folders"`` and ``"files"`` generated, ``__Old`` folders and
+        their content included, and number of injected ``"violations"``.
+
+    Examples
+    --------
+    >>> counts = generate_tree("tree", depth=4, fanout=10, n_files=80, n_jobs=4)
+    >>> sum(counts.values()) - counts["violations"]  # about 10^6 entries
+    """
+    folder = ensure_path(folder, must_exist=False)
+    layout = _Layout(depth, fanout, n_files, old_ratio, violation_rate, seed)
+    n_jobs = ensure_int(n_jobs, "n_jobs")
+    n_jobs = _ensure_n_jobs(n_jobs) if n_jobs != 1 else 1
+    folder.mkdir(parents=True, exist_ok=True)
+    if any(folder.iterdir()):
+        raise FileExistsError(f"The folder '{folder}' is not empty.")
+    root = str(folder)
+    counts = dict(folders=0, files=0, violations=0)
+    # the root only contains the top-level folders, one per top-level code
+    rng = random.Random(f"{layout.seed}:")
+    tasks = []
+    for k in range(layout.fanout):
+        code, name, violation = _folder_name(rng, f"F{k + 1}", layout)
+        os.mkdir(os.path.join(root, name))
+        _add(counts, 1, 0, violation)
+        tasks.append((name, code, 1))
+    # expand the top of the tree in the main process until every worker has a few
+    # subtrees to generate, then distribute the subtrees.
+    while len(tasks) < _TASKS_PER_JOB * n_jobs and any(
+        level < layout.depth for _, _, level in tasks
+    ):
+        relpath, code, level = tasks.pop(0)
+        tasks.extend(_generate_folder(root, relpath, code, level, layout, counts))
+    if n_jobs == 1:
+        for task in tasks:
+            _generate_subtree(root, *task, layout, counts)
+        return counts
+    with mp.get_context().Pool(processes=n_jobs) as pool:
+        results = pool.starmap(
+            _subtree_task, [(root, *task, layout) for task in tasks], chunksize=1
+        )
+    for result in results:
+        _add(counts, result["folders"], result["files"], result["violations"])
+    return counts
+
+
+class _Layout:
+    """Parameters of a synthetic tree, shared with the workers."""
+
+    __slots__ = ("depth", "fanout", "n_files", "old_ratio", "violation_rate", "seed")
+
+    def __init__(
+        self,
+        depth: int,
+        fanout: int,
+        n_files: int,
+        old_ratio: float,
+        violation_rate: float,
+        seed: int,
+    ) -> None:
+        self.depth = ensure_int(depth, "depth")
+        if self.depth < 1:
+            raise ValueError("The depth must be an integer greater or equal to 1.")
+        self.fanout = ensure_int(fanout, "fanout")
+        if not 1 <= self.fanout <= len(string.ascii_lowercase):
+            raise ValueError(
+                "The fanout must be an integer between 1 and "
+                f"{len(string.ascii_lowercase)}."
+            )
+        self.n_files = ensure_int(n_files, "n_files")
+        if self.n_files < 0:
+            raise ValueError("The number of files must be a positive integer.")
+        for var, name in ((old_ratio, "old_ratio"), (violation_rate, "violation_rate")):
+            check_type(var, ("numeric",), name)
+            if not 0 <= var <= 1:
+                raise ValueError(f"The {name} must be a ratio between 0 and 1.")
+        self.old_ratio = old_ratio
+        self.violation_rate = violation_rate
+        self.seed = ensure_int(seed, "seed")
+
+    def __getstate__(self) -> dict[str, int | float]:
+        """Pickle the parameters."""
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state: dict[str, int | float]) -> None:
+        """Restore the parameters."""
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+
+def _subtree_task(
+    root: str, relpath: str, code: str | None, level: int, layout: _Layout
+) -> dict[str, int]:
+    """Generate a subtree in a worker and return its counts."""
+    counts = dict(folders=0, files=0, violations=0)
+    _generate_subtree(root, relpath, code, level, layout, counts)
+    return counts
+
+
+def _generate_subtree(
+    root: str,
+    relpath: str,
+    code: str | None,
+    level: int,
+    layout: _Layout,
+    counts: dict[str, int],
+) -> None:
+    """Generate the content of a folder and of its subfolders."""
+    stack = [(relpath, code, level)]
+    while len(stack) != 0:
+        stack.extend(_generate_folder(root, *stack.pop(), layout, counts))
+
+
+def _generate_folder(
+    root: str,
+    relpath: str,
+    code: str | None,
+    level: int,
+    layout: _Layout,
+    counts: dict[str, int],
+) -> list[tuple[str, str | None, int]]:
+    """Generate the files and subfolders of a folder.
+
+    The folder is already created. The subfolders are created empty and returned
+    with their code and level, to be generated in turn.
+    """
+    rng = random.Random(f"{layout.seed}:{relpath}")
+    folder = os.path.join(root, relpath)
+    n_violations = 0
+    for _ in range(layout.n_files):
+        name, violation = _file_name(rng, code, layout)
+        _touch(os.path.join(folder, name))
+        n_violations += violation
+    n_folders = 0
+    n_files = layout.n_files
+    if rng.random() < layout.old_ratio:
+        old = os.path.join(folder, "__Old")
+        os.mkdir(old)
+        for _ in range(layout.n_files):
+            _touch(os.path.join(old, _file_name(rng, code, layout)[0]))
+        n_folders += 1
+        n_files += layout.n_files
+    subfolders = []
+    if level < layout.depth:
+        for letter in string.ascii_lowercase[: layout.fanout]:
+            # an invalid folder has no code to propagate, in which case the code of
+            # its parent is used to generate its content
+            subcode, name, violation = _folder_name(
+                rng, f"{'F0' if code is None else code}{letter}", layout
+            )
+            os.mkdir(os.path.join(folder, name))
+            n_violations += violation
+            subfolders.append((os.path.join(relpath, name), subcode, level + 1))
+        n_folders += layout.fanout
+    _add(counts, n_folders, n_files, n_violations)
+    return subfolders[::-1]
+
+
+def _file_name(
+    rng: random.Random, code: str | None, layout: _Layout
+) -> tuple[str, bool]:
+    """Draw a file name, and whether a violation was injected."""
+    code = "F0" if code is None else code
+    date_ = rng.choice(_DATES)
+    name = _name(rng)
+    usercode = "".join(rng.choices(string.ascii_uppercase, k=_USERCODE_LENGTH[0]))
+    extension = rng.choice(_EXTENSIONS)
+    violation = rng.random() < layout.violation_rate
+    if violation:
+        error = rng.choice(_FILE_VIOLATIONS)
+        if error == 1:
+            return f"{name}{extension}", True
+        if error == 3:
+            name = f"{name} {_name(rng)}"
+        elif error == 11:
+            code = f"{code}z"
+        elif error == 21:
+            date_ = f"4{date_[1:]}"  # 2040s
+    return f"{code}_{date_}_{name}_{usercode}{extension}", violation
+
+
+def _folder_name(
+    rng: random.Random, code: str, layout: _Layout
+) -> tuple[str | None, str, bool]:
+    """Draw a folder name with a code, and whether a violation was injected.
+
+    The code of the folder is returned along its name, or None if the name does not
+    match the pattern of a folder name.
+    """
+    name = _name(rng)
+    violation = rng.random() < layout.violation_rate
+    if violation:
+        error = rng.choice(_FOLDER_VIOLATIONS)
+        if error == 2:
+            return None, name, True
+        if error == 3:
+            name = f"{name}-{_name(rng)}"
+        elif error == 11:
+            code = f"{code}z"
+    return code, f"_{code}_{name}", violation
+
+
+def _name(rng: random.Random) -> str:
+    """Draw the name field of a file or folder name."""
+    return "".join(rng.choices(_ALPHABET, k=rng.randint(4, 12)))
+
+
+def _touch(path: str) -> None:
+    """Create an empty file."""
+    os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+
+
+def _add(counts: dict[str, int], folders: int, files: int, violations: int) -> None:
+    """Add to the number of generated folders, files and injected violations."""
+    counts["folders"] += folders
+    counts["files"] += files
+    counts["violations"] += violations
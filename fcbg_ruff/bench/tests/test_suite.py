@@ -0,0 +1,32 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_SUITE = Path(__file__).parents[3] / "benchmarks" / "bench_suite.py"
+
+
+@pytest.mark.skipif(not _SUITE.exists(), reason="Requires the source tree.")
+def test_bench_suite(tmp_path: Path):
+    """Test the benchmark suite on a tiny tree."""
+    subprocess.run(
+        [sys.executable, str(_SUITE), "--sizes", "tiny", "--jobs", "1", "2"]
+        + ["--repeat", "1", "--output", str(tmp_path / "results.json")]
+        + ["--tmp", str(tmp_path)],
+        check=True,
+        capture_output=True,
+    )
+    with open(tmp_path / "results.json") as fid:
+        results = json.load(fid)["results"]
+    assert [(result["benchmark"], result["n_jobs"]) for result in results] == [
+        ("names", None),
+        ("rules", None),
+        ("validate_folder", 1),
+        ("validate_folder", 2),
+        ("check", 1),
+        ("check", 2),
+    ]
+    assert all(0 < result["seconds"] for result in results)
+    assert all(0 < result["peak_rss"] for result in results)
@@ -0,0 +1,65 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from fcbg_ruff.bench import generate_tree
+from fcbg_ruff.check import validate_folder
+
+
+def _listing(folder: Path) -> list[str]:
+    """List the relative paths of the entries in a tree."""
+    return sorted(
+        os.path.relpath(os.path.join(root, name), folder)
+        for root, folders, files in os.walk(folder)
+        for name in folders + files
+    )
+
+
+@pytest.mark.filterwarnings("ignore:The number of requested jobs.*:RuntimeWarning")
+def test_generate_tree(tmp_path: Path):
+    """Test the generation of a synthetic tree."""
+    kwargs = dict(depth=3, fanout=3, n_files=4, old_ratio=0.5, violation_rate=0)
+    counts = generate_tree(tmp_path / "tree", seed=101, **kwargs)
+    listing = _listing(tmp_path / "tree")
+    assert counts["folders"] + counts["files"] == len(listing)
+    assert counts["folders"] == 3 + 9 + 27 + sum(
+        Path(elt).name == "__Old" for elt in listing
+    )
+    assert counts["violations"] == 0
+    assert validate_folder(tmp_path / "tree" / Path(listing[0]).parts[0]) == {
+        "primary": {},
+        "secondary": {},
+    }
+    # the tree is deterministic and does not depend on the number of jobs
+    assert generate_tree(tmp_path / "tree2", seed=101, n_jobs=2, **kwargs) == counts
+    assert _listing(tmp_path / "tree2") == listing
+    generate_tree(tmp_path / "tree3", seed=102, **kwargs)
+    assert _listing(tmp_path / "tree3") != listing
+
+
+def test_generate_tree_violations(tmp_path: Path):
+    """Test the injection of violations."""
+    counts = generate_tree(tmp_path, depth=2, fanout=4, n_files=20, violation_rate=0.2)
+    assert 0 < counts["violations"]
+    violations = validate_folder(tmp_path)
+    # the root folder is not a documentary folder, and the entries below an invalid
+    # folder are reported as well
+    assert counts["violations"] <= len(violations["primary"]) - 1 + len(
+        violations["secondary"]
+    )
+
+
+def test_generate_tree_invalid(tmp_path: Path):
+    """Test the validation of the parameters."""
+    with pytest.raises(ValueError, match="fanout must be an integer between"):
+        generate_tree(tmp_path, fanout=27)
+    with pytest.raises(ValueError, match="depth must be"):
+        generate_tree(tmp_path, depth=0)
+    with pytest.raises(ValueError, match="ratio between 0 and 1"):
+        generate_tree(tmp_path, violation_rate=2)
+    with pytest.raises(TypeError, match="must be an instance of"):
+        generate_tree(tmp_path, old_ratio="0.5")
+    (tmp_path / "file.txt").write_text("")
+    with pytest.raises(FileExistsError, match="is not empty"):
+        generate_tree(tmp_path)
@@ -1,2 +1,28 @@
+from typing import TYPE_CHECKING
+
+from ..utils._lazy import lazy_attach
 from . import config, validator
-from .validator import validate_folder
+from ._archive import iter_archive_violations
+from ._filters import Exclude
+from ._listing import iter_listing_violations
+from ._profile import Profile
+from ._sources import DictSource, FileSystemSource, PathsSource, TreeSource
+from ._store import ViolationStore
+from .validator import Validator, iter_violations, validate_folder
+
+# asyncio, numpy and ctypes are only imported when the asynchronous validation, the
+# bulk validation or the watcher are used.
+__getattr__, __dir__, _ = lazy_attach(
+    __name__,
+    attributes={
+        "aiter_violations": "_async",
+        "avalidate_folder": "_async",
+        "validate_names": "_bulk",
+        "Watcher": "_watch",
+    },
+)
+
+if TYPE_CHECKING:
+    from ._async import aiter_violations, avalidate_folder
+    from ._bulk import validate_names
+    from ._watch import Watcher
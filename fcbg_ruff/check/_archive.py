@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ..utils._checks import ensure_path
+from ..utils._docs import fill_doc
+from ..utils._imports import import_optional_dependency
+from ..utils.logs import _WarningCollector
+from ._filters import Exclude, _Filters
+from ._listing import _iter_listing
+from ._regex import _folder_code, _reference_date, _validate_folder_name
+
+if TYPE_CHECKING:
+    import tarfile
+    from collections.abc import Generator, Sequence
+    from datetime import date
+
+
+_ZIP_SUFFIXES: tuple[str, ...] = (".zip",)
+_ZSTD_SUFFIXES: tuple[str, ...] = (".tar.zst", ".tzst")
+_ARCHIVE_SUFFIXES: tuple[str, ...] = (
+    *_ZIP_SUFFIXES,
+    ".tar",
+    ".tar.gz",
+    ".tgz",
+    ".tar.bz2",
+    ".tar.xz",
+    *_ZSTD_SUFFIXES,
+)
+
+
+@fill_doc
+def iter_archive_violations(
+    fname: Path | str,
+    *,
+    ignore: Sequence[str] | None = None,
+    exclude: Exclude | None = None,
+    as_of: date | str | None = None,
+) -> Generator[tuple[Path, str, list[int]], None, None]:
+    """Iterate over the violations in a ZIP or TAR archive, without extraction.
+
+    Only the metadata of the archive is read: the central directory of a ZIP
+    archive, or the headers of a TAR archive, read one after the other. The content
+    of the members is never extracted. A compressed TAR archive is decompressed as a
+    stream to reach its headers, without writing or keeping the content of the
+    members.
+
+    The members are validated as they are read, like the entries of a listing (see
+    :func:`~fcbg_ruff.check.iter_listing_violations`), thus the memory usage depends
+    on the depth of the tree and not on the number of members. The members of a TAR
+    archive must be ordered depth-first, i.e. the content of a folder must be stored
+    contiguously, as produced by ``tar``. The members of a ZIP archive are sorted,
+    the central directory is held in memory by :mod:`zipfile` anyway.
+
+    The root of the archive is the folder ``"."``, whose name is not validated, e.g.
+    a backup of the folder ``_F1_department`` holds the members
+    ``_F1_department/...``.
+
+    Parameters
+    ----------
+    fname : Path | str
+        Path to the archive, ``.zip``, ``.tar``, ``.tar.gz``, ``.tgz``,
+        ``.tar.bz2``, ``.tar.xz`` or ``.tar.zst``. The Zstandard compression
+        requires the package ``zstandard``.
+    %(ignore)s
+    %(exclude)s
+    %(as_of)s
+
+    Yields
+    ------
+    %(violation_record)s
+
+    Examples
+    --------
+    >>> violations = list(iter_archive_violations("backup.tar.gz"))
+    """
+    fname = ensure_path(fname, must_exist=True)
+    if not _is_archive(fname):
+        raise ValueError(
+            f"The file '{fname}' is not a supported archive, the supported "
+            f"extensions are {', '.join(_ARCHIVE_SUFFIXES)}."
+        )
+    folder = Path(os.curdir)
+    filters = _Filters(() if ignore is None else ignore, exclude, folder)
+    today = _reference_date(as_of)
+    _, code = _validate_folder_name(folder.name, _folder_code(folder.parent.name))
+    if filters.pruned(os.curdir):
+        return  # every member is ignored
+    # the warnings of the rules are counted while reading and summarized once
+    warnings = _WarningCollector()
+    entries = _iter_members(fname)
+    yield from _iter_listing(entries, folder, code, filters, today, warnings)
+    warnings.emit()
+
+
+def _is_archive(fname: Path | str) -> bool:
+    """Check if a file is a supported archive, from its extension."""
+    return os.fspath(fname).lower().endswith(_ARCHIVE_SUFFIXES)
+
+
+def _iter_members(fname: Path) -> Generator[tuple[str, bool], None, None]:
+    """Iterate over the relative paths of the members of an archive.
+
+    Yields the path of each member, with the separator of the platform, and whether
+    the member is a folder. The archive modules are imported on first use, they are
+    not needed to validate a folder.
+    """
+    name = fname.name.lower()
+    if name.endswith(_ZIP_SUFFIXES):
+        import zipfile
+
+        with zipfile.ZipFile(fname) as archive:
+            # the central directory is parsed on opening, the members are sorted to
+            # list the content of each folder contiguously.
+            members = sorted(
+                (info.filename.split("/"), info.is_dir()) for info in archive.infolist()
+            )
+        for parts, is_dir in members:
+            yield os.sep.join(parts), is_dir
+        return
+    import tarfile
+
+    try:
+        if name.endswith(_ZSTD_SUFFIXES):
+            zstandard = import_optional_dependency(
+                "zstandard", extra="Reading a TAR archive compressed with Zstandard."
+            )
+            with (
+                open(fname, "rb") as fid,
+                zstandard.ZstdDecompressor().stream_reader(fid) as stream,
+                tarfile.open(fileobj=stream, mode="r|") as archive,
+            ):
+                yield from _iter_tar_members(archive)
+        else:
+            # a plain TAR archive is read by seeking from header to header, while a
+            # compressed TAR archive is decompressed as a stream.
+            mode = "r:" if name.endswith(".tar") else "r|*"
+            with tarfile.open(fname, mode=mode) as archive:
+                yield from _iter_tar_members(archive)
+    except tarfile.TarError as error:
+        raise ValueError(
+            f"The file '{fname}' is not a valid TAR archive: {error}"
+        ) from None
+
+
+def _iter_tar_members(archive: tarfile.TarFile) -> Generator[tuple[str, bool]]:
+    """Iterate over the members of a TAR archive open with :mod:`tarfile`."""
+    while (member := archive.next()) is not None:
+        # tarfile keeps every member read, which is not needed to walk the archive
+        archive.members.clear()
+        path = member.name if os.sep == "/" else member.name.replace("/", os.sep)
+        yield path, member.isdir()
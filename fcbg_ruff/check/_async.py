@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from ..utils._checks import check_type, ensure_int, ensure_path
+from ..utils._docs import fill_doc
+from ._regex import _folder_code, _reference_date, _validate_folder_name
+from .validator import _collect, _records, _scan_folder
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from datetime import date
+    from pathlib import Path
+
+
+@fill_doc
+async def avalidate_folder(
+    folder: Path | str,
+    *,
+    max_concurrency: int = 64,
+    thread_pool: Executor | None = None,
+    as_of: date | str | None = None,
+) -> dict[str, dict[Path, list[int]]]:
+    """Validate a folder from the documentary system and its content recursively.
+
+    Asynchronous version of :func:`~fcbg_ruff.check.validate_folder`. The directory
+    listings are offloaded to threads, thus the event loop is not blocked and can
+    validate several folders concurrently.
+
+    Parameters
+    ----------
+    folder : Path | str
+        Path to the folder to validate.
+    %(max_concurrency)s
+    %(thread_pool)s
+    %(as_of)s
+
+    Returns
+    -------
+    %(violations)s
+    """
+    return _collect(
+        [
+            record
+            async for record in aiter_violations(
+                folder,
+                max_concurrency=max_concurrency,
+                thread_pool=thread_pool,
+                as_of=as_of,
+            )
+        ]
+    )
+
+
+@fill_doc
+async def aiter_violations(
+    folder: Path | str,
+    *,
+    max_concurrency: int = 64,
+    thread_pool: Executor | None = None,
+    as_of: date | str | None = None,
+) -> AsyncGenerator[tuple[Path, str, list[int]], None]:
+    """Iterate asynchronously over the violations in a folder and its content.
+
+    The walk is paused while the consumer does not keep up: at most
+    ``max_concurrency`` listings are held waiting to be yielded.
+
+    Parameters
+    ----------
+    folder : Path | str
+        Path to the folder to validate.
+    %(max_concurrency)s
+    %(thread_pool)s
+    %(as_of)s
+
+    Yields
+    ------
+    %(violation_record)s
+    """
+    folder = ensure_path(folder, must_exist=True)
+    max_concurrency = ensure_int(max_concurrency, "max_concurrency")
+    if max_concurrency < 1:
+        raise ValueError(
+            "The maximum concurrency must be an integer greater or equal to 1."
+        )
+    check_type(thread_pool, (Executor, None), "thread_pool")
+    today = _reference_date(as_of)
+    errors, code = _validate_folder_name(folder.name, _folder_code(folder.parent.name))
+    for record in _records(folder, errors):
+        yield record
+
+    loop = asyncio.get_running_loop()
+    executor = (
+        ThreadPoolExecutor(max_workers=max_concurrency)
+        if thread_pool is None
+        else thread_pool
+    )
+    folders = asyncio.Queue()
+    # bounded, the workers wait for the consumer instead of listing ahead of it
+    results = asyncio.Queue(maxsize=max_concurrency)
+
+    async def worker() -> None:
+        """Pull folders from the queue, list them and push their subfolders."""
+        while True:
+            folder, code = await folders.get()
+            try:
+                records = []
+                subfolders = await loop.run_in_executor(
+                    executor, _scan_folder, folder, code, records, None, today
+                )
+                for subfolder in subfolders:
+                    folders.put_nowait(subfolder)
+                await results.put(records)
+            except Exception as error:
+                await results.put(error)
+            finally:
+                folders.task_done()
+
+    async def join() -> None:
+        """Wait for all folders to be walked and signal the end of the walk."""
+        await folders.join()
+        await results.put(None)
+
+    folders.put_nowait((folder, code))
+    tasks = [asyncio.create_task(worker()) for _ in range(max_concurrency)]
+    tasks.append(asyncio.create_task(join()))
+    try:
+        while (records := await results.get()) is not None:
+            if isinstance(records, BaseException):
+                raise records
+            for record in records:
+                yield record
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if thread_pool is None:
+            executor.shutdown(wait=False, cancel_futures=True)
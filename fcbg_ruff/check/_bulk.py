@@ -0,0 +1,275 @@
+"""Vectorized validation of names with NumPy string operations.
+
+The patterns matched by the regular expressions in ``_regex.py`` are decomposed in
+partitions on the separators, followed by character class checks, which NumPy applies
+on entire arrays of names at once.
+"""
+
+from __future__ import annotations
+
+import string
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..utils._docs import fill_doc
+from ..utils.logs import _warn_bulk
+from ._regex import _reference_date
+from .config import _FORBIDDEN_NAME_CHARACTERS, _USERCODE_LENGTH, ERRORS_BITS
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import date
+
+    from numpy.typing import NDArray
+
+
+# NumPy >= 2.2 partitions into 3 separate arrays while np.char stacks them in a copy
+_STRINGS = getattr(np, "strings", None)
+if not hasattr(_STRINGS, "partition"):
+    _STRINGS = None
+# number of days per month, for non-leap years
+_DAYS_IN_MONTH = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+
+@fill_doc
+def validate_names(
+    names: NDArray[np.str_] | Sequence[str],
+    parents: NDArray[np.str_] | Sequence[str] | str,
+    *,
+    is_dir: NDArray[np.bool_] | Sequence[bool] | bool = False,
+    as_of: date | str | None = None,
+) -> NDArray[np.uint16]:
+    """Validate file and folder names in bulk.
+
+    The names are validated with NumPy string operations applied on entire arrays
+    instead of one regular expression per name, which suits exported listings of
+    millions of names. The file system is never accessed.
+
+    Parameters
+    ----------
+    names : array of str | list of str
+        Names of the files and folders, without their parent folders.
+    parents : array of str | list of str | str
+        Names of the parent folders, broadcasted against ``names``.
+    is_dir : array of bool | list of bool | bool
+        Flag indicating whether the name is a folder name, broadcasted against
+        ``names``.
+    %(as_of)s
+
+    Returns
+    -------
+    masks : array of uint16
+        Bitmask of the error codes of each name, aligned with ``names``. The bit
+        associated to each error code is given by
+        :data:`fcbg_ruff.check.config.ERRORS_BITS`. A valid name has a mask of 0.
+
+    Examples
+    --------
+    >>> masks = validate_names(
+    ...     ["F1_220101_file_ABC.txt", "F2_220101_file_ABC.txt", "_F1a_folder"],
+    ...     "_F1_parent",
+    ...     is_dir=[False, False, True],
+    ... )
+    >>> masks & ERRORS_BITS[11] != 0
+    array([False,  True, False])
+    """
+    today = _reference_date(as_of)
+    names, parents, is_dir = np.broadcast_arrays(
+        _as_str_array(names), _as_str_array(parents), np.asarray(is_dir, dtype=bool)
+    )
+    shape = names.shape
+    names, parents, is_dir = names.ravel(), parents.ravel(), is_dir.ravel()
+    masks = np.zeros(names.size, dtype=np.uint16)
+    if names.size == 0:
+        return masks.reshape(shape)
+    # parse each distinct parent once, listings share few parents for many names
+    uniques, inverse = np.unique(parents, return_inverse=True)
+    valid, codes, _, _ = _parse_folder_names(uniques)
+    parent_codes = np.where(valid, codes, "")[inverse.ravel()]
+    parent_valid = valid[inverse.ravel()]
+    # files
+    idx = np.flatnonzero(~is_dir)
+    if idx.size != 0:
+        masks[idx] = _validate_file_names(
+            names[idx], parent_codes[idx], parent_valid[idx], today
+        )
+    # folders
+    idx = np.flatnonzero(is_dir)
+    if idx.size != 0:
+        masks[idx] = _validate_folder_names(
+            names[idx], parent_codes[idx], parent_valid[idx]
+        )
+    return masks.reshape(shape)
+
+
+def _validate_file_names(
+    names: NDArray[np.str_],
+    parent_codes: NDArray[np.str_],
+    parent_valid: NDArray[np.bool_],
+    today: int,
+) -> NDArray[np.uint16]:
+    """Validate file names against the code of their parent folder.
+
+    The dates are compared to the reference date, an integer YYYYMMDD.
+    """
+    masks = np.zeros(names.size, dtype=np.uint16)
+    valid, codes, dates, fields = _parse_file_stems(_stems(names))
+    masks[~valid] |= ERRORS_BITS[1]
+    masks[valid & _has_forbidden_characters(fields)] |= ERRORS_BITS[3]
+    masks[valid & ~parent_valid] |= ERRORS_BITS[101]
+    masks[valid & parent_valid & (codes != parent_codes)] |= ERRORS_BITS[11]
+    # dates, compared as integers YYYYMMDD
+    idx = np.flatnonzero(valid)
+    if idx.size != 0:
+        dates = _parse_dates(dates[idx], names[idx])
+        masks[idx[dates > today]] |= ERRORS_BITS[21]
+    return masks
+
+
+def _validate_folder_names(
+    names: NDArray[np.str_],
+    parent_codes: NDArray[np.str_],
+    parent_valid: NDArray[np.bool_],
+) -> NDArray[np.uint16]:
+    """Validate folder names against the code of their parent folder."""
+    masks = np.zeros(names.size, dtype=np.uint16)
+    valid, codes, n_letters, fields = _parse_folder_names(names)
+    masks[~valid] |= ERRORS_BITS[2]
+    masks[valid & _has_forbidden_characters(fields)] |= ERRORS_BITS[3]
+    masks[valid & ~parent_valid & (n_letters != 0)] |= ERRORS_BITS[101]
+    # the folder code is the parent code followed by one character
+    child = (np.char.str_len(codes) == np.char.str_len(parent_codes) + 1) & (
+        np.char.startswith(codes, parent_codes)
+    )
+    masks[valid & parent_valid & ~child] |= ERRORS_BITS[11]
+    return masks
+
+
+def _parse_file_stems(
+    stems: NDArray[np.str_],
+) -> tuple[NDArray[np.bool_], NDArray[np.str_], NDArray[np.str_], NDArray[np.str_]]:
+    """Parse file stems 'CODE_DATE_NAME_USERCODE'.
+
+    Returns the mask of the stems matching the pattern, the codes, the dates and the
+    names. The fields of the stems which do not match the pattern are meaningless.
+    """
+    codes, sep1, rest = _partition(stems, "_")
+    dates, sep2, rest = _partition(rest, "_")
+    fields, sep3, usercodes = _rpartition(rest, "_")
+    valid = (sep1 == "_") & (sep2 == "_") & (sep3 == "_")
+    valid &= _is_code(codes)[0]
+    valid &= (np.char.str_len(dates) == 6) & np.char.isdecimal(dates)
+    valid &= _is_name(fields)
+    valid &= np.isin(np.char.str_len(usercodes), _USERCODE_LENGTH)
+    valid &= np.char.strip(usercodes, string.ascii_uppercase) == ""
+    return valid, codes, dates, fields
+
+
+def _parse_folder_names(
+    names: NDArray[np.str_],
+) -> tuple[NDArray[np.bool_], NDArray[np.str_], NDArray[np.int_], NDArray[np.str_]]:
+    """Parse folder names '_CODE_NAME'.
+
+    Returns the mask of the names matching the pattern, the codes, the number of
+    letters in the codes and the names. The fields of the names which do not match
+    the pattern are meaningless.
+    """
+    head, sep1, rest = _partition(names, "_")
+    codes, sep2, fields = _partition(rest, "_")
+    valid, n_letters = _is_code(codes)
+    valid &= (head == "") & (sep1 == "_") & (sep2 == "_") & _is_name(fields)
+    return valid, codes, n_letters, fields
+
+
+def _is_code(codes: NDArray[np.str_]) -> tuple[NDArray[np.bool_], NDArray[np.int_]]:
+    """Match codes against 'F\\d+[a-z]*' and count their trailing letters."""
+    head, sep, rest = _partition(codes, "F")
+    digits = np.char.rstrip(rest, string.ascii_lowercase)
+    valid = (head == "") & (sep == "F") & np.char.isdecimal(digits)
+    return valid, np.char.str_len(rest) - np.char.str_len(digits)
+
+
+def _is_name(fields: NDArray[np.str_]) -> NDArray[np.bool_]:
+    """Match name fields against '[^_].*', where '.' does not match a new line."""
+    return (
+        (np.char.str_len(fields) != 0)
+        & ~np.char.startswith(fields, "_")
+        & (np.char.find(fields, "\n", 1) == -1)
+    )
+
+
+def _has_forbidden_characters(fields: NDArray[np.str_]) -> NDArray[np.bool_]:
+    """Check if the name fields contain forbidden characters."""
+    forbidden = np.zeros(fields.shape, dtype=bool)
+    for char in sorted(_FORBIDDEN_NAME_CHARACTERS):
+        forbidden |= np.char.find(fields, char) != -1
+    return forbidden
+
+
+def _parse_dates(dates: NDArray[np.str_], names: NDArray[np.str_]) -> NDArray[np.int_]:
+    """Convert dates 'YYMMDD' to integers YYYYMMDD, following datetime.strptime.
+
+    The dates which can not be parsed are set to 0.
+    """
+    values = np.zeros(dates.size, dtype=np.int64)
+    ascii_ = np.char.strip(dates, string.digits) == ""
+    values[ascii_] = dates[ascii_].astype(np.int64)
+    year, month, day = values // 10000, values // 100 % 100, values % 100
+    # %y maps 69-99 to 1969-1999 and 00-68 to 2000-2068
+    year = np.where(year < 69, 2000 + year, 1900 + year)
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    valid = ascii_ & (1 <= month) & (month <= 12)
+    days = _DAYS_IN_MONTH[np.where(valid, month, 0)] + (leap & (month == 2))
+    valid &= (1 <= day) & (day <= days)
+    values = np.where(valid, year * 10000 + month * 100 + day, 0)
+    # other decimal characters are rare and left to datetime.strptime
+    for k in np.flatnonzero(~ascii_):
+        try:
+            date = datetime.strptime(str(dates[k]), "%y%m%d")
+        except ValueError:
+            continue
+        values[k] = date.year * 10000 + date.month * 100 + date.day
+        valid[k] = True
+    if not valid.all():
+        _warn_bulk(
+            "{} file name(s) have a date which could not be parsed, e.g. '{}'.",
+            np.count_nonzero(~valid),
+            names[~valid][0],
+        )
+    return values
+
+
+def _stems(names: NDArray[np.str_]) -> NDArray[np.str_]:
+    """Return the stems of file names, following the rules of pathlib.PurePath.stem."""
+    head, _, tail = _rpartition(names, ".")
+    return np.where((head != "") & (tail != ""), head, names)
+
+
+def _partition(
+    array: NDArray[np.str_], sep: str
+) -> tuple[NDArray[np.str_], NDArray[np.str_], NDArray[np.str_]]:
+    """Split each element at the first occurrence of sep."""
+    if _STRINGS is not None:
+        return _STRINGS.partition(array, sep)
+    out = np.char.partition(array, sep)
+    return out[..., 0], out[..., 1], out[..., 2]
+
+
+def _rpartition(
+    array: NDArray[np.str_], sep: str
+) -> tuple[NDArray[np.str_], NDArray[np.str_], NDArray[np.str_]]:
+    """Split each element at the last occurrence of sep."""
+    if _STRINGS is not None:
+        return _STRINGS.rpartition(array, sep)
+    out = np.char.rpartition(array, sep)
+    return out[..., 0], out[..., 1], out[..., 2]
+
+
+def _as_str_array(array: NDArray[np.str_] | Sequence[str] | str) -> NDArray[np.str_]:
+    """Convert an array-like of strings to an array of unicode strings."""
+    array = np.asarray(array)
+    if array.dtype.kind != "U":
+        array = array.astype(str)
+    return array
@@ -0,0 +1,227 @@
+"""Persistent cache of the validation results of folders.
+
+The results of a folder only depend on the names of its entries and on its own name.
+The names of the entries are covered by the modification time of the folder, which
+changes when an entry is created, removed or renamed, and the name of the folder and
+of its parents are covered by the path used as key. A renamed parent thus changes the
+key of every folder below it.
+
+The cache of a root folder is stored in a SQLite database. Workers only read the
+database of the previous run, while the calling process writes a new database which
+replaces the previous one once the entire tree has been walked. Folders which do not
+exist anymore are thus dropped from the cache.
+"""
+
+from __future__ import annotations  # c.f. PEP 563, PEP 649
+
+import json
+import os
+import threading
+from hashlib import sha1
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import sqlite3
+    from pathlib import Path
+    from typing import Any
+
+
+_SCHEMA: str = "2"
+
+
+def _cache_fname(cache_dir: Path, folder: Path) -> Path:
+    """Get the path to the database caching the results of a root folder."""
+    digest = sha1(str(folder.absolute()).encode("utf-8")).hexdigest()
+    return cache_dir / f"{digest}.sqlite"
+
+
+def _settings(**kwargs: Any) -> str:
+    """Serialize the settings which invalidate the cache when changed."""
+    from .._version import __version__
+
+    return json.dumps(
+        dict(version=__version__, schema=_SCHEMA, **kwargs), sort_keys=True
+    )
+
+
+class _CacheReader:
+    """Read-only access to the database of the previous run.
+
+    The reader is picklable and opens one connection per thread, thus it can be used
+    by worker processes and threads. The connections are closed with :meth:`close`,
+    from any thread, before the database is replaced.
+
+    Parameters
+    ----------
+    fname : Path
+        Path to the database.
+    settings : str
+        Serialized settings of the current run. If the database was written with
+        different settings, every lookup misses.
+    """
+
+    def __init__(self, fname: Path, settings: str) -> None:
+        self._fname = fname
+        self._settings = settings
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop the connections when pickled."""
+        return {"_fname": self._fname, "_settings": self._settings}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the reader without connections."""
+        self.__init__(state["_fname"], state["_settings"])
+
+    def close(self) -> None:
+        """Close the connections of every thread.
+
+        A database held open can not be replaced on Windows, thus the connections
+        must be closed before the database of the current run is committed. The
+        reader can be used again afterwards, the connections are re-opened.
+        """
+        with self._lock:
+            connections, self._connections = self._connections, []
+            # the threads of a pool outlive the call, drop their connections
+            self._local = threading.local()
+        for connection in connections:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection | None:
+        """Open a connection in the calling thread, or None if the cache is unusable."""
+        import sqlite3
+
+        local = self._local
+        if hasattr(local, "connection"):
+            return local.connection
+        connection = None
+        if self._fname.exists():
+            try:
+                # the connections are closed by the thread calling close()
+                connection = sqlite3.connect(
+                    f"{self._fname.as_uri()}?mode=ro",
+                    uri=True,
+                    check_same_thread=False,
+                )
+                with self._lock:
+                    self._connections.append(connection)
+                row = connection.execute(
+                    "SELECT value FROM meta WHERE key = 'settings'"
+                ).fetchone()
+                if row is None or row[0] != self._settings:
+                    connection = None
+            except sqlite3.DatabaseError:
+                connection = None
+        local.connection = connection
+        return connection
+
+    def get(self, key: str, inode: int, mtime: int) -> tuple[str, str] | None:
+        """Get the cached results of a folder.
+
+        Parameters
+        ----------
+        key : str
+            Path to the folder.
+        inode : int
+            Inode number of the folder.
+        mtime : int
+            Modification time of the folder, in nanoseconds.
+
+        Returns
+        -------
+        results : tuple of str | None
+            The JSON-encoded violation records and subfolders of the folder, or None
+            if the folder is not cached or if it changed since it was cached.
+        """
+        connection = self._connect()
+        if connection is None:
+            return None
+        return connection.execute(
+            "SELECT records, folders FROM folders "
+            "WHERE path = ? AND inode = ? AND mtime = ?",
+            (key, inode, mtime),
+        ).fetchone()
+
+
+class _CacheWriter:
+    """Write the database of the current run.
+
+    The database is written to a temporary file which replaces the database of the
+    previous run on :meth:`commit`.
+
+    Parameters
+    ----------
+    fname : Path
+        Path to the database.
+    settings : str
+        Serialized settings of the current run.
+    """
+
+    def __init__(self, fname: Path, settings: str) -> None:
+        import sqlite3
+
+        self._fname = fname
+        self._tmp = fname.with_name(f"{fname.name}.{os.getpid()}.tmp")
+        self._tmp.unlink(missing_ok=True)
+        self._connection = sqlite3.connect(self._tmp)
+        self._connection.execute("PRAGMA journal_mode = OFF")
+        self._connection.execute("PRAGMA synchronous = OFF")
+        self._connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._connection.execute(
+            "CREATE TABLE folders (path TEXT PRIMARY KEY, inode INTEGER, "
+            "mtime INTEGER, records TEXT, folders TEXT)"
+        )
+        self._connection.execute("INSERT INTO meta VALUES ('settings', ?)", (settings,))
+
+    def add(self, rows: list[tuple[str, int, int, str, str]]) -> None:
+        """Add the results of folders to the database."""
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO folders VALUES (?, ?, ?, ?, ?)", rows
+        )
+
+    def commit(self) -> None:
+        """Write the database and replace the database of the previous run."""
+        self._connection.commit()
+        self._connection.close()
+        os.replace(self._tmp, self._fname)
+
+    def abort(self) -> None:
+        """Discard the database of the current run."""
+        self._connection.close()
+        self._tmp.unlink(missing_ok=True)
+
+
+def _encode(
+    folder: Path,
+    stat: os.stat_result,
+    records: list[tuple[Path, str, list[int]]],
+    folders: list[tuple[Path, str | None]],
+) -> tuple[str, int, int, str, str] | None:
+    """Encode the results of a folder as a database row.
+
+    Returns None if the results can not be cached, i.e. if they depend on the current
+    date because a file name has a date in the future.
+    """
+    if any(21 in codes for _, _, codes in records):
+        return None
+    return (
+        str(folder),
+        stat.st_ino,
+        stat.st_mtime_ns,
+        json.dumps([(path.name, severity, codes) for path, severity, codes in records]),
+        json.dumps([(elt.name, code) for elt, code in folders]),
+    )
+
+
+def _decode(
+    folder: Path, results: tuple[str, str]
+) -> tuple[list[tuple[Path, str, list[int]]], list[tuple[Path, str | None]]]:
+    """Decode the cached results of a folder."""
+    records = [
+        (folder / name, severity, codes)
+        for name, severity, codes in json.loads(results[0])
+    ]
+    folders = [(folder / name, code) for name, code in json.loads(results[1])]
+    return records, folders
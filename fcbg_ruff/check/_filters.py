@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import os
+import re
+from fnmatch import translate
+from pathlib import PurePath
+from typing import TYPE_CHECKING
+
+from ..utils._checks import check_type
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+    from typing import Any
+
+
+class Exclude:
+    """Set of folders excluded from the walk, matched on their names.
+
+    An excluded folder is neither validated nor walked. The names and patterns are
+    compiled in a single regular expression.
+
+    Parameters
+    ----------
+    names : list of str
+        Folder names excluded, e.g. ``"@eaDir"``.
+    inames : list of str
+        Folder names excluded regardless of their case, e.g. ``"$RECYCLE.BIN"``. By
+        default, the ``"__old"`` folders are excluded.
+    patterns : list of str
+        Glob patterns matched against the folder names with
+        :func:`fnmatch.fnmatchcase`, e.g. ``".Trash-*"``.
+
+    Examples
+    --------
+    >>> exclude = Exclude(
+    ...     names=["@eaDir"],
+    ...     inames=["__old", "$RECYCLE.BIN"],
+    ...     patterns=["~snapshot", ".Trash-*"],
+    ... )
+    >>> violations = validate_folder(folder, exclude=exclude)
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str] = (),
+        inames: Sequence[str] = ("__old",),
+        patterns: Sequence[str] = (),
+    ) -> None:
+        for var, name in ((names, "names"), (inames, "inames"), (patterns, "patterns")):
+            check_type(var, (list, tuple), name)
+            for elt in var:
+                check_type(elt, (str,), name[:-1])
+        self._names = tuple(names)
+        self._inames = tuple(inames)
+        self._patterns = tuple(patterns)
+        regex = "|".join(
+            [re.escape(name) for name in self._names]
+            + [f"(?i:{re.escape(name)})" for name in self._inames]
+            + [translate(pattern) for pattern in self._patterns]
+        )
+        self._match = None if len(regex) == 0 else re.compile(regex).fullmatch
+
+    def __getstate__(self) -> dict[str, tuple[str, ...]]:
+        """Pickle the names and patterns."""
+        return {
+            "names": self._names,
+            "inames": self._inames,
+            "patterns": self._patterns,
+        }
+
+    def __setstate__(self, state: dict[str, tuple[str, ...]]) -> None:
+        """Compile the names and patterns."""
+        self.__init__(**state)
+
+    def __repr__(self) -> str:
+        """String representation of the excluded folders."""
+        return (
+            f"Exclude(names={list(self._names)}, inames={list(self._inames)}, "
+            f"patterns={list(self._patterns)})"
+        )
+
+    def match(self, name: str) -> bool:
+        """Check if a folder is excluded.
+
+        Parameters
+        ----------
+        name : str
+            Name of the folder.
+
+        Returns
+        -------
+        excluded : bool
+            True if the folder is excluded from the walk.
+        """
+        return self._match is not None and self._match(name) is not None
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Folder names excluded.
+
+        :type: tuple of str
+        """
+        return self._names
+
+    @property
+    def inames(self) -> tuple[str, ...]:
+        """Folder names excluded regardless of their case.
+
+        :type: tuple of str
+        """
+        return self._inames
+
+    @property
+    def patterns(self) -> tuple[str, ...]:
+        """Glob patterns matched against the folder names.
+
+        :type: tuple of str
+        """
+        return self._patterns
+
+
+class _Filters:
+    """Rules selecting the folders walked and the violations reported.
+
+    The rules are compiled once and sent to the workers along the folders to walk.
+
+    Parameters
+    ----------
+    ignore : list of str
+        Glob patterns, matched with the semantic of :func:`fnmatch.fnmatch` against
+        two POSIX forms of each path: the path as walked, below ``root`` as provided,
+        and the path relative to ``root``, prefixed with ``./``. The violations of a
+        path matching either form are not reported. A folder is not walked if every
+        path below it matches, i.e. if a pattern ending with ``*`` matches the folder
+        path followed by ``/``, e.g. ``*/Archive_2010/*``.
+    exclude : Exclude | None
+        Folders excluded from the walk. If None, the ``"__old"`` folders are
+        excluded.
+    root : Path | None
+        Path to the validated folder, below which the paths are built. The root
+        itself is matched as ``"."`` and the paths below as ``"./<path>"``. If None,
+        the current folder is the root.
+    """
+
+    __slots__ = (
+        "ignore",
+        "exclude",
+        "root",
+        "_ignore",
+        "_prune",
+        "_walked",
+        "_walked_prefix",
+    )
+
+    def __init__(
+        self,
+        ignore: Sequence[str] = (),
+        exclude: Exclude | None = None,
+        root: Path | None = None,
+    ) -> None:
+        check_type(ignore, (list, tuple), "ignore")
+        for pattern in ignore:
+            check_type(pattern, (str,), "pattern")
+        check_type(exclude, (Exclude, None), "exclude")
+        self.exclude = Exclude() if exclude is None else exclude
+        self.ignore = tuple(ignore)
+        self.root = os.curdir if root is None else str(root)
+        self._ignore = _compile(self.ignore)
+        # a pattern ending with '*' which matches 'folder/' matches every path below
+        self._prune = _compile([elt for elt in self.ignore if elt.endswith("*")])
+        # POSIX form of the root as provided, to match the paths as walked
+        self._walked = PurePath(self.root).as_posix()
+        self._walked_prefix = (
+            "" if self._walked == os.curdir else f"{self._walked.rstrip('/')}/"
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the patterns, cheaper than the compiled regular expressions."""
+        return {"ignore": self.ignore, "exclude": self.exclude, "root": self.root}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Compile the patterns."""
+        self.__init__(**state)
+
+    def excluded(self, name: str) -> bool:
+        """Check if a folder is excluded from the walk, from its name."""
+        return self.exclude.match(name)
+
+    def relpath(self, path: Path) -> str:
+        """Express a path below the root in the form matched by the patterns.
+
+        The paths are joined below the root during the walk, thus slicing the root
+        off replaces a path computation. The root is ``"."`` and the paths below are
+        ``"./<path>"``, as listed by ``find .``.
+        """
+        path = str(path)
+        if path == self.root:
+            return os.curdir
+        if self.root != os.curdir:
+            path = path[len(self.root) :].lstrip(os.sep)
+        if os.sep != "/":
+            path = path.replace(os.sep, "/")
+        return f"./{path}"
+
+    def prefix(self, folder: Path) -> str:
+        """Get the prefix of the matched form of the entries of a folder."""
+        return f"{self.relpath(folder)}/"
+
+    def ignored(self, path: str) -> bool:
+        """Check if the violations of a path are ignored, from its relative path."""
+        return self._ignore is not None and self._match(self._ignore, path)
+
+    def pruned(self, folder: str) -> bool:
+        """Check if every path below a folder is ignored, from its relative path."""
+        return self._prune is not None and self._match(self._prune, f"{folder}/")
+
+    def _match(self, regex: re.Pattern, path: str) -> bool:
+        """Match a path in its relative form, and in its form as walked."""
+        if regex.match(os.path.normcase(path)):
+            return True
+        if path == os.curdir:
+            walked = self._walked
+        elif path.startswith("./"):
+            walked = self._walked_prefix + path[2:]
+        else:
+            return False
+        return bool(regex.match(os.path.normcase(walked)))
+
+
+def _compile(patterns: Sequence[str]) -> re.Pattern | None:
+    """Compile glob patterns in a single regular expression, or None if empty."""
+    if len(patterns) == 0:
+        return None
+    return re.compile(
+        "|".join(f"(?:{translate(os.path.normcase(pattern))})" for pattern in patterns)
+    )
+
+
+_DEFAULT_FILTERS: _Filters = _Filters()
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import os
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from ..utils._checks import check_value, ensure_path
+from ..utils._docs import fill_doc
+from ..utils.logs import _WarningCollector
+from ._filters import Exclude, _Filters
+from ._regex import (
+    _folder_code,
+    _reference_date,
+    _validate_file_name,
+    _validate_folder_name,
+)
+from .validator import _records
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable, Sequence
+    from datetime import date
+    from pathlib import Path
+
+
+# number of entries of the listing validated between two yields of the records
+_CHUNK: int = 1024
+_FORMATS: tuple[str, ...] = ("find", "paths")
+
+
+@fill_doc
+def iter_listing_violations(
+    fname: Path | str,
+    folder: Path | str = ".",
+    *,
+    fmt: str = "find",
+    ignore: Sequence[str] | None = None,
+    exclude: Exclude | None = None,
+    as_of: date | str | None = None,
+) -> Generator[tuple[Path, str, list[int]], None, None]:
+    """Iterate over the violations in a listing of a folder from the documentary system.
+
+    The listing is read line by line and the folder is never accessed, e.g. to
+    validate a share from a nightly export of its content. Only the folders from the
+    root of the listing to the current entry are kept in memory, thus the memory
+    usage depends on the depth of the tree and not on its size. The rules are the
+    same as for :func:`~fcbg_ruff.check.iter_violations`, the ``"__old"`` folders
+    included.
+
+    The listing must be ordered depth-first, i.e. the content of a folder must be
+    listed contiguously, as produced by ``find``. The parent folders of an entry do
+    not need to be listed, e.g. a listing produced with ``find -type f``.
+
+    Parameters
+    ----------
+    fname : Path | str
+        Path to the listing, encoded in UTF-8.
+    folder : Path | str
+        Path to the folder from which the listing was produced, used to validate the
+        name of the folder and to report the violations. The paths of the listing
+        are relative to this folder. The folder does not need to exist.
+    fmt : ``"find"`` | ``"paths"``
+        Format of the listing:
+
+        - ``"find"``: the output of ``find <folder> -printf '%%y %%P\\n'``, i.e. the
+          type of the entry, a space and its relative path. The entries of type
+          ``d`` are folders.
+        - ``"paths"``: one relative path per line. A path is a folder if it ends with
+          a separator or if it is followed by a path below it.
+    %(ignore)s
+    %(exclude)s
+    %(as_of)s
+
+    Yields
+    ------
+    %(violation_record)s
+
+    Examples
+    --------
+    >>> violations = list(
+    ...     iter_listing_violations("listing.txt", "/mnt/share/_F1_department")
+    ... )
+    """
+    fname = ensure_path(fname, must_exist=True)
+    folder = ensure_path(folder, must_exist=False)
+    check_value(fmt, _FORMATS, "fmt")
+    filters = _Filters(() if ignore is None else ignore, exclude, folder)
+    today = _reference_date(as_of)
+    errors, code = _validate_folder_name(folder.name, _folder_code(folder.parent.name))
+    if not filters.ignored(os.curdir):
+        yield from _records(folder, errors)
+    if filters.pruned(os.curdir):
+        return  # every path below the folder is ignored
+    # the warnings of the rules are counted while reading and summarized once
+    warnings = _WarningCollector()
+    with open(fname, encoding="utf-8", errors="surrogateescape") as fid:
+        entries = _parse_find(fid, fname) if fmt == "find" else _parse_paths(fid)
+        yield from _iter_listing(entries, folder, code, filters, today, warnings)
+    warnings.emit()
+
+
+class _Frame:
+    """Folder open on the stack of the walk of a listing."""
+
+    __slots__ = ("name", "path", "code", "prefix", "skip", "folders")
+
+    def __init__(
+        self,
+        name: str,
+        path: Path,
+        code: str | None,
+        prefix: str | None,
+        skip: bool,
+    ) -> None:
+        self.name = name
+        self.path = path
+        self.code = code
+        # prefix of the relative POSIX paths of the entries, or None if nothing is
+        # ignored
+        self.prefix = prefix
+        # True if the content of the folder is not validated, excluded or ignored
+        self.skip = skip
+        # names of the subfolders listed so far, to detect a listing out of order
+        self.folders: set[str] = set()
+
+
+def _iter_listing(
+    entries: Iterable[tuple[str, bool]],
+    folder: Path,
+    code: str | None,
+    filters: _Filters,
+    today: int,
+    warnings: _WarningCollector,
+) -> Generator[tuple[Path, str, list[int]], None, None]:
+    """Validate the entries of a listing, ordered depth-first.
+
+    Parameters
+    ----------
+    entries : iterable of tuple
+        Relative path of each entry, and whether the entry is a folder.
+    folder : Path
+        Path to the folder from which the listing was produced. The folder name
+        itself is not validated.
+    code : str | None
+        Code of the folder, or None if the folder name is invalid.
+    filters : _Filters
+        Rules selecting the folders walked and the violations reported.
+    today : int
+        Reference date of the validation, as an integer YYYYMMDD.
+    warnings : _WarningCollector
+        Collector of the warnings emitted while validating the names. The collector
+        is only active while a chunk of the listing is validated, not while the
+        records are consumed.
+    """
+    prefix = None if len(filters.ignore) == 0 else filters.prefix(folder)
+    # stack[k] is the open folder at depth k, the root of the listing at depth 0
+    stack = [_Frame("", folder, code, prefix, False)]
+    records = []
+    # path of the folder on top of the stack, as written in the listing, to validate
+    # the consecutive files of a folder without splitting their paths
+    current = ""
+    entries = iter(entries)
+    while len(chunk := list(islice(entries, _CHUNK))) != 0:
+        with warnings:
+            for path, is_dir in chunk:
+                parent, _, name = path.rpartition(os.sep)
+                if not is_dir and parent == current and name not in ("", "."):
+                    _validate_file(stack[-1], name, records, filters, today)
+                    continue
+                _validate_entry(stack, _split(path), is_dir, records, filters, today)
+                if is_dir:
+                    current = path.rstrip(os.sep)
+                else:
+                    current = parent if name not in ("", ".") else None
+        yield from records
+        records.clear()
+
+
+def _validate_entry(
+    stack: list[_Frame],
+    parts: list[str],
+    is_dir: bool,
+    records: list[tuple[Path, str, list[int]]],
+    filters: _Filters,
+    today: int,
+) -> None:
+    """Validate an entry of a listing, below the folders open on the stack."""
+    # close the folders which are not parents of the entry
+    depth = 0
+    n_open = min(len(stack) - 1, len(parts))
+    while depth < n_open and stack[depth + 1].name == parts[depth]:
+        depth += 1
+    del stack[depth + 1 :]
+    if depth == len(parts):
+        return  # folder already open, e.g. listed after its content
+    # the parents which are not listed are validated when first met
+    for name in parts[depth:-1]:
+        _open_folder(stack, name, records, filters)
+    if is_dir:
+        _open_folder(stack, parts[-1], records, filters)
+    else:
+        _validate_file(stack[-1], parts[-1], records, filters, today)
+
+
+def _validate_file(
+    parent: _Frame,
+    name: str,
+    records: list[tuple[Path, str, list[int]]],
+    filters: _Filters,
+    today: int,
+) -> None:
+    """Validate a file in the folder on top of the stack."""
+    if parent.skip:
+        return
+    errors = _validate_file_name(name, parent.code, today)
+    if len(errors["primary"]) == 0 and len(errors["secondary"]) == 0:
+        return
+    if parent.prefix is None or not filters.ignored(parent.prefix + name):
+        records.extend(_records(parent.path / name, errors))
+
+
+def _open_folder(
+    stack: list[_Frame],
+    name: str,
+    records: list[tuple[Path, str, list[int]]],
+    filters: _Filters,
+) -> None:
+    """Validate a folder and push it on the stack of open folders."""
+    parent = stack[-1]
+    if parent.skip:
+        stack.append(_Frame(name, parent.path, None, None, True))
+        return
+    if name in parent.folders:
+        raise ValueError(
+            f"The folder '{parent.path / name}' is listed in several places. The "
+            "entries must be ordered depth-first, with the content of each folder "
+            "listed contiguously as produced by 'find' or 'tar'."
+        )
+    parent.folders.add(name)
+    path = parent.path / name
+    if filters.excluded(name):
+        stack.append(_Frame(name, path, None, None, True))
+        return
+    errors, code = _validate_folder_name(name, parent.code)
+    prefix = None if parent.prefix is None else parent.prefix + name
+    if (len(errors["primary"]) != 0 or len(errors["secondary"]) != 0) and (
+        prefix is None or not filters.ignored(prefix)
+    ):
+        records.extend(_records(path, errors))
+    skip = prefix is not None and filters.pruned(prefix)
+    stack.append(
+        _Frame(name, path, code, None if prefix is None else f"{prefix}/", skip)
+    )
+
+
+def _parse_find(
+    lines: Iterable[str], fname: Path
+) -> Generator[tuple[str, bool], None, None]:
+    """Parse a listing produced with ``find -printf '%y %P\\n'``."""
+    for k, line in enumerate(lines, start=1):
+        line = line.rstrip("\n")
+        if len(line) == 0:
+            continue
+        if len(line) < 2 or line[1] != " ":
+            raise ValueError(
+                f"The line {k} of the listing '{fname}' is not formatted as "
+                f"'<type> <path>', got '{line}'."
+            )
+        path = line[2:]
+        if os.altsep is not None:
+            path = path.replace(os.altsep, os.sep)
+        yield path, line[0] == "d"
+
+
+def _parse_paths(lines: Iterable[str]) -> Generator[tuple[str, bool], None, None]:
+    """Parse a listing of relative paths.
+
+    A path which does not end with a separator is a folder if the next path is below
+    it, thus each path is yielded once the next one is read.
+    """
+    previous = None
+    for line in lines:
+        path = line.rstrip("\n")
+        if len(path) == 0:
+            continue
+        if os.altsep is not None:
+            path = path.replace(os.altsep, os.sep)
+        if previous is not None:
+            yield (
+                previous,
+                previous.endswith(os.sep) or path.startswith(previous + os.sep),
+            )
+        previous = path
+    if previous is not None:
+        yield previous, previous.endswith(os.sep)
+
+
+def _split(path: str) -> list[str]:
+    """Split a relative path into its parts, without the empty and current parts."""
+    return [part for part in path.split(os.sep) if part not in ("", ".")]
@@ -1,3 +1,6 @@
+from ._regex import PATTERN_FILE_STEM, PATTERN_FOLDER_NAME
+
+
 def parse_folder_name(folder: str) -> tuple[str, str]:
     """Parse the folder name.
 
@@ -13,6 +16,11 @@ def parse_folder_name(folder: str) -> tuple[str, str]:
     name : str
         Folder name.
 
+    Raises
+    ------
+    ValueError
+        If the folder name does not match the expected pattern.
+
     Examples
     --------
     >>> parse_folder_name("_F1_My_folder")
@@ -21,10 +29,12 @@ def parse_folder_name(folder: str) -> tuple[str, str]:
     >>> parse_folder_name("_F2b_My_second_folder")
     ("F2b", "My_second_folder")
     """
-    elts = folder[1:].split("_")
-    code = elts[0]
-    name = "_".join(elts[1:])
-    return code, name
+    match = PATTERN_FOLDER_NAME.fullmatch(folder)
+    if match is None:
+        raise ValueError(
+            f"The folder name '{folder}' does not match the expected pattern."
+        )
+    return match["code"], match["name"]
 
 
 def parse_file_stem(stem: str) -> tuple[str, str, str, str]:
@@ -47,6 +57,11 @@ def parse_file_stem(stem: str) -> tuple[str, str, str, str]:
     usercode : str
         File user code.
 
+    Raises
+    ------
+    ValueError
+        If the file name stem does not match the expected pattern.
+
     Examples
     --------
     >>> parse_file_stem("F1_220101_file_ABC")
@@ -55,9 +70,9 @@ def parse_file_stem(stem: str) -> tuple[str, str, str, str]:
     >>> parse_file_stem("F2b_220101_My_second_file_DEF")
     ("F2b", "220101", "My_second_file", "DEF")
     """
-    elts = stem.split("_")
-    code = elts[0]
-    date = elts[1]
-    name = "_".join(elts[2:-1])
-    usercode = elts[-1]
-    return code, date, name, usercode
+    match = PATTERN_FILE_STEM.fullmatch(stem)
+    if match is None:
+        raise ValueError(
+            f"The file name stem '{stem}' does not match the expected pattern."
+        )
+    return match["code"], match["date"], match["name"], match["usercode"]
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import json
+import multiprocessing as mp
+import threading
+from time import perf_counter_ns
+from typing import TYPE_CHECKING
+
+from ..utils._checks import ensure_path
+from ._regex import (
+    _validate_file_name_code,
+    _validate_file_name_date,
+    _validate_file_name_pattern,
+    _validate_folder_name_code,
+    _validate_folder_name_pattern,
+    _validate_name_content,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+
+# phases timed, in the order of the summary table
+_PHASES: tuple[str, ...] = (
+    "list",
+    "stat",
+    "cache",
+    "folder_pattern",
+    "file_pattern",
+    "name_content",
+    "code",
+    "date",
+    "wait",
+    "merge",
+    "output",
+    "total",
+)
+_COUNTERS: tuple[str, ...] = ("listings", "folders", "files", "stats", "cache_hits")
+
+
+class Profile:
+    """Counters and timers of the phases of a validation.
+
+    A profile is filled during the validation when it is provided to
+    :func:`~fcbg_ruff.check.iter_violations`, or returned by
+    :func:`~fcbg_ruff.check.validate_folder` with ``profile=True``. The rules are
+    then applied one by one between timers, thus the validation without profile is
+    not slowed down.
+
+    The phases are:
+
+    - ``list``: listing of the folders and iteration over their entries, rules
+      excluded.
+    - ``stat``: stat calls on the folders, only issued when the results are cached.
+    - ``cache``: look-up, encoding and decoding of the cached results.
+    - ``folder_pattern``, ``file_pattern``: match of the folder and file names.
+    - ``name_content``, ``code``, ``date``: rules applied to the fields of a name.
+    - ``wait``: time spent by the calling process waiting on the workers.
+    - ``merge``: time spent by the calling process merging the results of the
+      workers.
+    - ``output``: writing of the violations, measured by the ``check`` command.
+    - ``total``: wall-clock time of the validation.
+
+    With workers, the phases measured in the workers are summed across workers and
+    can exceed the wall-clock time.
+    """
+
+    __slots__ = ("_counts", "_times", "_workers", "_rules")
+
+    def __init__(self) -> None:
+        self._counts = dict.fromkeys(_COUNTERS, 0)
+        self._times = dict.fromkeys(_PHASES, 0)  # nanoseconds
+        # tasks, folders listed and busy time in nanoseconds of each worker
+        self._workers: dict[str, list[int]] = dict()
+        self._rules = 0  # time spent in the rules, nanoseconds
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the counters and timers."""
+        return {
+            "counts": self._counts,
+            "times": self._times,
+            "workers": self._workers,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the counters and timers."""
+        self._counts = state["counts"]
+        self._times = state["times"]
+        self._workers = state["workers"]
+        self._rules = 0
+
+    def __repr__(self) -> str:
+        """String representation of the profile."""
+        return (
+            f"<Profile | {self._counts['listings']} listing(s), "
+            f"{self._times['total'] / 1e9:.3f} s>"
+        )
+
+    def summary(self) -> str:
+        """Format the profile as a table.
+
+        Returns
+        -------
+        summary : str
+            Table of the time spent per phase, of the counters and of the time spent
+            per worker.
+        """
+        lines = [f"{'Phase':<16}{'Seconds':>12}"]
+        lines += [f"{phase:<16}{self._times[phase] / 1e9:>12.3f}" for phase in _PHASES]
+        lines += ["", f"{'Counter':<16}{'Count':>12}"]
+        lines += [f"{key:<16}{self._counts[key]:>12}" for key in _COUNTERS]
+        lines += ["", f"{'Worker':<24}{'Tasks':>8}{'Folders':>10}{'Seconds':>12}"]
+        lines += [
+            f"{worker:<24}{tasks:>8}{folders:>10}{busy / 1e9:>12.3f}"
+            for worker, (tasks, folders, busy) in sorted(self._workers.items())
+        ]
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict[str, dict]:
+        """Convert the profile to a dictionary, serializable to JSON.
+
+        Returns
+        -------
+        profile : dict
+            Dictionary with the ``"seconds"`` spent per phase, the ``"counts"`` and
+            the ``"workers"`` totals.
+        """
+        return {
+            "seconds": {phase: self._times[phase] / 1e9 for phase in _PHASES},
+            "counts": dict(self._counts),
+            "workers": {
+                worker: {"tasks": tasks, "folders": folders, "seconds": busy / 1e9}
+                for worker, (tasks, folders, busy) in self._workers.items()
+            },
+        }
+
+    def save(self, fname: Path | str) -> None:
+        """Save the profile to a JSON file.
+
+        Parameters
+        ----------
+        fname : Path | str
+            Path to the JSON file.
+        """
+        fname = ensure_path(fname, must_exist=False)
+        with open(fname, "w") as fid:
+            json.dump(self.to_dict(), fid, indent=2)
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """Number of folders listed, folder and file names validated and stat calls.
+
+        :type: dict
+        """
+        return dict(self._counts)
+
+    @property
+    def seconds(self) -> dict[str, float]:
+        """Time spent per phase, in seconds.
+
+        :type: dict
+        """
+        return {phase: self._times[phase] / 1e9 for phase in _PHASES}
+
+    def _add(self, phase: str, ns: int) -> None:
+        """Add time to a phase."""
+        self._times[phase] += ns
+
+    def _count(self, key: str, n: int = 1) -> None:
+        """Increment a counter."""
+        self._counts[key] += n
+
+    def _worker(self, tasks: int, folders: int, ns: int) -> None:
+        """Add to the totals of the current worker."""
+        process = mp.current_process().name
+        name = threading.current_thread().name if process == "MainProcess" else process
+        totals = self._workers.setdefault(name, [0, 0, 0])
+        totals[0] += tasks
+        totals[1] += folders
+        totals[2] += ns
+
+    def _merge(self, other: Profile) -> None:
+        """Merge the profile of a task run in a worker."""
+        for key, value in other._counts.items():
+            self._counts[key] += value
+        for phase, ns in other._times.items():
+            self._times[phase] += ns
+        for worker, (tasks, folders, ns) in other._workers.items():
+            totals = self._workers.setdefault(worker, [0, 0, 0])
+            totals[0] += tasks
+            totals[1] += folders
+            totals[2] += ns
+
+    def _file_name(
+        self, name: str, parent_code: str | None, today: int
+    ) -> dict[str, list[int]]:
+        """Validate a file name, timing each rule.
+
+        Applies the rules of :func:`~fcbg_ruff.check._regex._validate_file_name`.
+        """
+        times = self._times
+        self._counts["files"] += 1
+        start = perf_counter_ns()
+        match, error_codes = _validate_file_name_pattern(name)
+        pattern = perf_counter_ns()
+        times["file_pattern"] += pattern - start
+        if match is None:
+            self._rules += pattern - start
+            return error_codes
+        _validate_name_content(match["name"], name, "file", error_codes)
+        content = perf_counter_ns()
+        _validate_file_name_code(match["code"], parent_code, error_codes)
+        code = perf_counter_ns()
+        _validate_file_name_date(match["date"], name, today, error_codes)
+        end = perf_counter_ns()
+        times["name_content"] += content - pattern
+        times["code"] += code - content
+        times["date"] += end - code
+        self._rules += end - start
+        return error_codes
+
+    def _folder_name(
+        self, name: str, parent_code: str | None
+    ) -> tuple[dict[str, list[int]], str | None]:
+        """Validate a folder name, timing each rule.
+
+        Applies the rules of :func:`~fcbg_ruff.check._regex._validate_folder_name`.
+        """
+        times = self._times
+        self._counts["folders"] += 1
+        start = perf_counter_ns()
+        match, error_codes = _validate_folder_name_pattern(name)
+        pattern = perf_counter_ns()
+        times["folder_pattern"] += pattern - start
+        if match is None:
+            self._rules += pattern - start
+            return error_codes, None
+        _validate_name_content(match["name"], name, "folder", error_codes)
+        content = perf_counter_ns()
+        _validate_folder_name_code(match, parent_code, error_codes)
+        end = perf_counter_ns()
+        times["name_content"] += content - pattern
+        times["code"] += end - content
+        self._rules += end - start
+        return error_codes, match["code"]
@@ -1,103 +1,172 @@
 from __future__ import annotations
 
+import os
 import re
-from datetime import datetime
+from datetime import date, datetime
 from typing import TYPE_CHECKING
 
+from ..utils._checks import check_type
 from ..utils._docs import fill_doc
-from ..utils.logs import logger, warn
-from ._parser import parse_file_stem, parse_folder_name
+from ..utils.logs import _warn_bulk
 from .config import _FORBIDDEN_NAME_CHARACTERS, _USERCODE_LENGTH
 
 if TYPE_CHECKING:
-    from pathib import Path
+    from os import PathLike
 
 
+# the named groups parse the fields of a name in the same pass as the validation
 PATTERN_FILE_STEM = re.compile(
-    r"F\d+[a-z]*_\d{6}_[^_]{1}.*_[A-Z]{%s}"
-    % ",".join([str(i) for i in _USERCODE_LENGTH])
+    r"(?P<code>F\d+[a-z]*)_(?P<date>\d{6})_(?P<name>[^_].*)"
+    r"_(?P<usercode>[A-Z]{%s})" % ",".join([str(i) for i in _USERCODE_LENGTH])
 )
-PATTERN_FOLDER_NAME = re.compile(r"_F\d+[a-z]*_[^_]{1}.*")
+PATTERN_FOLDER_NAME = re.compile(r"_(?P<code>F\d+(?P<letters>[a-z]*))_(?P<name>[^_].*)")
+# number of days per month, for non-leap years
+_DAYS_IN_MONTH: tuple[int, ...] = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+# valid dates 'YYMMDD' parsed so far, as integers YYYYMMDD, filled on first use
+_DATES: dict[str, int] = dict()
 
 
 @fill_doc
-def validate_file_name(fname: Path) -> dict[str, list[int]]:
+def validate_file_name(
+    fname: str | PathLike, *, as_of: date | str | None = None
+) -> dict[str, list[int]]:
     """Validate a file name.
 
     Parameters
     ----------
-    fname : Path
-        Full path to the file name to validate.
+    fname : str | PathLike
+        Path to the file, absolute or relative. Only the file name and the name of
+        its parent folder are used, e.g. ``"_F1_folder/F1_220101_file_ABC.txt"``.
+    %(as_of)s
 
     Returns
     -------
     %(error_codes)s
+
+    Notes
+    -----
+    The file system is never accessed, thus the file does not need to exist.
+    """
+    name, parent = _split(fname)
+    return _validate_file_name(name, _folder_code(parent), _reference_date(as_of))
+
+
+def _validate_file_name(
+    name: str, parent_code: str | None, today: int
+) -> dict[str, list[int]]:
+    """Validate a file name from its name and the code of its parent folder.
+
+    The code of the parent folder is None if the parent folder name is invalid. The
+    reference date is an integer YYYYMMDD, see _reference_date.
     """
-    assert fname.is_file()  # sanity-check
-    match = re.fullmatch(PATTERN_FILE_STEM, fname.stem)
+    match, error_codes = _validate_file_name_pattern(name)
     if match is None:
-        return {"primary": [1], "secondary": []}
-    # parse the file name and validate its content based on context
-    try:
-        fname_code, date, name, _ = parse_file_stem(fname.stem)
-    except Exception as error:  # pragma: no cover
-        warn(
-            f"File name stem '{fname.stem}' could not be parsed. Please report this "
-            "warning on the issue tracker."
-        )
-        logger.exception(error)
-    error_codes = dict(primary=[], secondary=[])
-    _validate_name_content(name, fname, error_codes)
-    _validate_file_name_code(fname_code, fname, error_codes)
-    _validate_file_name_date(date, fname, error_codes)
+        return error_codes
+    # validate the parsed fields of the file name based on context
+    _validate_name_content(match["name"], name, "file", error_codes)
+    _validate_file_name_code(match["code"], parent_code, error_codes)
+    _validate_file_name_date(match["date"], name, today, error_codes)
     return error_codes
 
 
+def _validate_file_name_pattern(
+    name: str,
+) -> tuple[re.Match | None, dict[str, list[int]]]:
+    """Match a file name against the pattern and create its error codes.
+
+    The match is None if the file name does not follow the pattern, in which case no
+    other rule applies.
+    """
+    match = PATTERN_FILE_STEM.fullmatch(_stem(name))
+    if match is None:
+        return None, {"primary": [1], "secondary": []}
+    return match, {"primary": [], "secondary": []}
+
+
 def _validate_file_name_code(
-    fname_code: str, fname: Path, error_codes: dict[str, list[int]]
+    fname_code: str, parent_code: str | None, error_codes: dict[str, list[int]]
 ) -> None:
     """Validate the code in a file name."""
-    match = re.fullmatch(PATTERN_FOLDER_NAME, fname.parent.name)
-    if match is None:
+    if parent_code is None:
         error_codes["secondary"].append(101)
         return
-    try:
-        folder_code, _ = parse_folder_name(fname.parent.name)
-        if folder_code != fname_code:
-            error_codes["primary"].append(11)
-    except Exception as error:  # pragma: no cover
-        warn(
-            f"Folder name '{fname.parent.name}' could not be parsed. Please report "
-            "this warning on the issue tracker."
-        )
-        logger.exception(error)
+    if parent_code != fname_code:
+        error_codes["primary"].append(11)
 
 
 def _validate_file_name_date(
-    date: str, fname: Path, error_codes: dict[str, list[int]]
+    date: str, fname: str, today: int, error_codes: dict[str, list[int]]
 ) -> None:
-    """Validate the date in a file name."""
-    try:
-        date = datetime.strptime(date, "%y%m%d")
-        if datetime.now() < date:
-            error_codes["primary"].append(21)
-    except Exception as error:  # pragma: no cover
-        warn(
-            f"Date '{date}' in file name '{fname.name}' could not be parsed. Please "
-            "report this warning on the issue tracker."
+    """Validate the date in a file name against the reference date YYYYMMDD."""
+    value = _DATES.get(date) or _parse_date(date)
+    if value is None:
+        _warn_bulk(
+            "Date '{}' in file name '{}' could not be parsed. Please report this "
+            "warning on the issue tracker.",
+            date,
+            fname,
         )
-        logger.exception(error)
+        return
+    if today < value:
+        error_codes["primary"].append(21)
+
+
+def _parse_date(date: str) -> int | None:
+    """Convert a date 'YYMMDD' to an integer YYYYMMDD, following datetime.strptime.
+
+    Returns None if the date is invalid. The valid dates are memoized in _DATES, thus
+    each distinct date is parsed once per process.
+    """
+    if date.isascii():
+        value = int(date)
+        year, month, day = value // 10000, value // 100 % 100, value % 100
+        # %y maps 69-99 to 1969-1999 and 00-68 to 2000-2068
+        year += 2000 if year < 69 else 1900
+        leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+        if not 1 <= month <= 12:
+            return None
+        if not 1 <= day <= _DAYS_IN_MONTH[month] + (leap and month == 2):
+            return None
+    else:
+        # other decimal characters are rare and left to datetime.strptime
+        try:
+            parsed = datetime.strptime(date, "%y%m%d")
+        except ValueError:
+            return None
+        year, month, day = parsed.year, parsed.month, parsed.day
+    _DATES[date] = value = year * 10000 + month * 100 + day
+    return value
+
+
+def _reference_date(as_of: date | str | None = None) -> int:
+    """Convert the reference date of a validation to an integer YYYYMMDD.
+
+    The reference date is captured once per run, thus every file name is compared to
+    the same date. If None, the date of the day is used.
+    """
+    if as_of is None:
+        as_of = date.today()
+    elif isinstance(as_of, str):
+        try:
+            as_of = date.fromisoformat(as_of)
+        except ValueError:
+            raise ValueError(
+                f"The reference date must be formatted as 'YYYY-MM-DD', got '{as_of}'."
+            ) from None
+    check_type(as_of, (date,), "as_of")
+    return as_of.year * 10000 + as_of.month * 100 + as_of.day
 
 
 def _validate_name_content(
-    name: str, path: Path, error_codes: dict[str, list[int]]
+    name: str, fullname: str, kind: str, error_codes: dict[str, list[int]]
 ) -> None:
     """Validate the file/folder name content."""
     if len(name) == 0:  # pragma: no cover
-        warn(
-            f"The {'file' if path.is_file() else 'folder'} name '{path.name}' has an "
-            "empty parsed 'name' field. Please report this warning on the issue "
-            "tracker."
+        _warn_bulk(
+            "The {} name '{}' has an empty parsed 'name' field. Please report this "
+            "warning on the issue tracker.",
+            kind,
+            fullname,
         )
         return
     if any(elt in name for elt in _FORBIDDEN_NAME_CHARACTERS):
@@ -105,58 +174,90 @@ def _validate_name_content(
 
 
 @fill_doc
-def validate_folder_name(folder: Path) -> dict[str, list[int]]:
+def validate_folder_name(folder: str | PathLike) -> dict[str, list[int]]:
     """Validate a folder name.
 
     Parameters
     ----------
-    folder : Path
-        Full path to the folder name to validate.
+    folder : str | PathLike
+        Path to the folder, absolute or relative. Only the folder name and the name
+        of its parent folder are used, e.g. ``"_F1_folder/_F1a_subfolder"``.
 
     Returns
     -------
     %(error_codes)s
+
+    Notes
+    -----
+    The file system is never accessed, thus the folder does not need to exist.
+    """
+    name, parent = _split(folder)
+    return _validate_folder_name(name, _folder_code(parent))[0]
+
+
+def _validate_folder_name(
+    name: str, parent_code: str | None
+) -> tuple[dict[str, list[int]], str | None]:
+    """Validate a folder name from its name and the code of its parent folder.
+
+    The code of the parent folder is None if the parent folder name is invalid. The
+    code of the folder is returned along the error codes, to be propagated to the
+    validation of its entries, or None if the folder name is invalid.
     """
-    assert folder.is_dir()  # sanity-check
-    match = re.fullmatch(PATTERN_FOLDER_NAME, folder.name)
+    match, error_codes = _validate_folder_name_pattern(name)
     if match is None:
-        return {"primary": [2], "secondary": []}
-    # parse the folder name and validate its content based on context
-    try:
-        folder_code, name = parse_folder_name(folder.name)
-    except Exception as error:  # pragma: no cover
-        warn(
-            f"Folder name '{folder.name}' could not be parsed. Please report this "
-            "warning on the issue tracker."
-        )
-        logger.exception(error)
-    error_codes = dict(primary=[], secondary=[])
-    _validate_name_content(name, folder, error_codes)
-    _validate_folder_name_code(folder_code, folder, error_codes)
-    return error_codes
+        return error_codes, None
+    # validate the parsed fields of the folder name based on context
+    _validate_name_content(match["name"], name, "folder", error_codes)
+    _validate_folder_name_code(match, parent_code, error_codes)
+    return error_codes, match["code"]
+
+
+def _validate_folder_name_pattern(
+    name: str,
+) -> tuple[re.Match | None, dict[str, list[int]]]:
+    """Match a folder name against the pattern and create its error codes.
+
+    The match is None if the folder name does not follow the pattern, in which case
+    no other rule applies.
+    """
+    match = PATTERN_FOLDER_NAME.fullmatch(name)
+    if match is None:
+        return None, {"primary": [2], "secondary": []}
+    return match, {"primary": [], "secondary": []}
 
 
 def _validate_folder_name_code(
-    folder_code: str, folder: Path, error_codes: dict[str, list[int]]
+    match: re.Match, parent_code: str | None, error_codes: dict[str, list[int]]
 ) -> None:
     """Validate the code in a folder name."""
-    if folder.parent is None:  # we might be at the root of a file system
-        return
-    match = re.fullmatch(PATTERN_FOLDER_NAME, folder.parent.name)
     # check folder code against parent folder code
-    if match is None:
-        pattern = re.compile(r"_F\d+([a-z]*)")  # select letters from the folder code
-        letters = re.match(pattern, folder.name).group(1)
-        if len(letters) != 0:
+    if parent_code is None:
+        if len(match["letters"]) != 0:
             error_codes["secondary"].append(101)
         return
-    try:
-        parent_folder_code, _ = parse_folder_name(folder.parent.name)
-        if parent_folder_code != folder_code[:-1]:
-            error_codes["primary"].append(11)
-    except Exception as error:  # pragma: no cover
-        warn(
-            f"Folder name '{folder.parent.name}' could not be parsed. Please report "
-            "this warning on the issue tracker."
-        )
-        logger.exception(error)
+    if parent_code != match["code"][:-1]:
+        error_codes["primary"].append(11)
+
+
+def _folder_code(name: str) -> str | None:
+    """Parse the code of a folder name, or None if the folder name is invalid."""
+    match = PATTERN_FOLDER_NAME.fullmatch(name)
+    return None if match is None else match["code"]
+
+
+def _split(path: str | PathLike) -> tuple[str, str]:
+    """Split a path into its name and the name of its parent folder."""
+    path = os.fspath(path)
+    if os.altsep is not None:
+        path = path.replace(os.altsep, os.sep)
+    head, _, name = path.rstrip(os.sep).rpartition(os.sep)
+    return name, head.rstrip(os.sep).rpartition(os.sep)[2]
+
+
+def _stem(name: str) -> str:
+    """Return the stem of a file name, following the rules of pathlib.PurePath.stem."""
+    idx = name.rfind(".")
+    if 0 < idx < len(name) - 1:
+        return name[:idx]
+    return name
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import os
+from contextlib import nullcontext
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ..utils._checks import check_type
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from contextlib import AbstractContextManager
+    from os import PathLike
+    from typing import Any
+
+
+class TreeSource:
+    """Source of the entries of a tree walked by the validation.
+
+    A source lists the entries of a folder, in the same fashion as
+    :func:`os.scandir`: each entry exposes its name in the attribute ``name`` and
+    whether it is a folder with the method ``is_dir()``. The validation rules are
+    applied unchanged to the entries of any source.
+
+    See Also
+    --------
+    FileSystemSource
+    DictSource
+    PathsSource
+    """
+
+    def is_dir(self, folder: Path) -> bool:
+        """Check if a folder exists in the tree.
+
+        Parameters
+        ----------
+        folder : Path
+            Path to the folder.
+
+        Returns
+        -------
+        exists : bool
+            True if the folder exists.
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def scandir(self, folder: Path) -> AbstractContextManager[Iterable[Any]]:
+        """List the entries of a folder.
+
+        Parameters
+        ----------
+        folder : Path
+            Path to the folder.
+
+        Returns
+        -------
+        entries : context manager
+            Context manager returning an iterable of entries, with a ``name``
+            attribute and an ``is_dir()`` method.
+        """
+        raise NotImplementedError  # pragma: no cover
+
+
+class FileSystemSource(TreeSource):
+    """Tree read from the file system with :func:`os.scandir`.
+
+    This is the default source of the validation.
+    """
+
+    def __repr__(self) -> str:
+        """String representation of the source."""
+        return "<FileSystemSource>"
+
+    def is_dir(self, folder: Path) -> bool:
+        """Check if a folder exists on the file system."""
+        return os.path.isdir(folder)
+
+    def scandir(self, folder: Path) -> AbstractContextManager[Iterable[Any]]:
+        """List the entries of a folder with :func:`os.scandir`."""
+        return os.scandir(folder)
+
+
+class DictSource(TreeSource):
+    """Tree held in memory as nested dictionaries.
+
+    Listing a folder does not access the disk, thus the validation of an in-memory
+    tree measures the cost of the rules alone.
+
+    Parameters
+    ----------
+    tree : dict
+        Nested dictionary in which each key is the name of an entry and each value is
+        either a dictionary, for a folder, or None, for a file. The top-level
+        dictionary is the folder ``"."``.
+
+    Examples
+    --------
+    >>> source = DictSource(
+    ...     {"_F1_folder": {"F1_220101_file_ABC.txt": None, "_F1a_subfolder": {}}}
+    ... )
+    >>> violations = validate_folder("_F1_folder", source=source)
+    """
+
+    def __init__(self, tree: dict[str, dict | None]) -> None:
+        check_type(tree, (dict,), "tree")
+        self._tree = tree
+
+    def __repr__(self) -> str:
+        """String representation of the source."""
+        return f"<{type(self).__name__} | {len(self._tree)} top-level entries>"
+
+    def is_dir(self, folder: Path) -> bool:
+        """Check if a folder exists in the tree."""
+        return self._node(folder) is not None
+
+    def scandir(self, folder: Path) -> AbstractContextManager[Iterable[Any]]:
+        """List the entries of a folder from its dictionary."""
+        node = self._node(folder)
+        if node is None:
+            raise FileNotFoundError(f"The folder '{folder}' does not exist.")
+        return nullcontext(
+            [_Entry(name, isinstance(child, dict)) for name, child in node.items()]
+        )
+
+    def _node(self, folder: Path) -> dict[str, dict | None] | None:
+        """Get the dictionary of a folder, or None if the folder does not exist."""
+        node = self._tree
+        for part in Path(folder).parts:
+            node = node.get(part)
+            if not isinstance(node, dict):
+                return None
+        return node
+
+
+class PathsSource(DictSource):
+    """Tree described by the relative paths of its entries.
+
+    The paths are inserted in a prefix tree held in memory. The parents of each path
+    are folders, and a path is a folder if it ends with a separator or if it is the
+    parent of another path, e.g. a listing of a share exported with
+    ``find . -type f``.
+
+    Parameters
+    ----------
+    paths : iterable of str | PathLike
+        Paths to the entries, relative to the folder ``"."``.
+
+    Examples
+    --------
+    >>> source = PathsSource(
+    ...     ["_F1_folder/F1_220101_file_ABC.txt", "_F1_folder/_F1a_subfolder/"]
+    ... )
+    >>> violations = validate_folder("_F1_folder", source=source)
+    """
+
+    def __init__(self, paths: Iterable[str | PathLike]) -> None:
+        tree = dict()
+        for path in paths:
+            path = os.fspath(path)
+            if os.altsep is not None:
+                path = path.replace(os.altsep, os.sep)
+            parts = [part for part in path.split(os.sep) if part not in ("", ".")]
+            if len(parts) == 0:
+                continue
+            node = tree
+            for part in parts[:-1]:
+                child = node.get(part)
+                if child is None:
+                    child = node[part] = dict()
+                node = child
+            if path.endswith(os.sep):
+                node.setdefault(parts[-1], dict())
+            elif parts[-1] not in node:
+                node[parts[-1]] = None
+        super().__init__(tree)
+
+
+class _Entry:
+    """Entry of an in-memory tree, with the interface of os.DirEntry used to walk."""
+
+    __slots__ = ("name", "_is_dir")
+
+    def __init__(self, name: str, is_dir: bool) -> None:
+        self.name = name
+        self._is_dir = is_dir
+
+    def is_dir(self) -> bool:
+        """Check if the entry is a folder."""
+        return self._is_dir
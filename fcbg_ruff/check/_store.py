@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import os
+from array import array
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ..utils._checks import check_value, ensure_int
+from ..utils._docs import fill_doc
+from .config import ERRORS_BITS, ERRORS_CODES
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+    from typing import Any
+
+    import numpy as np
+    from numpy.typing import NDArray
+
+
+class ViolationStore:
+    """Compact container of violations.
+
+    The violations are stored in columns instead of one :class:`~pathlib.Path` and
+    one list of error codes per violation: a prefix tree of the parent folders, in
+    which each folder is stored once as its name and the index of its own parent, the
+    index of the parent folder and the name of each violating file or folder, and a
+    ``uint16`` bitmask over the error codes (see
+    :data:`~fcbg_ruff.check.config.ERRORS_BITS`). The names are concatenated in a
+    single string indexed by offsets. The :class:`~pathlib.Path` objects are only
+    created on access, and the container pickles to a few buffers.
+
+    Iterating over the container yields the violation records ``(path, severity,
+    codes)``, in the order they were added.
+
+    Parameters
+    ----------
+    records : iterable of tuple | None
+        Violation records ``(path, severity, codes)`` to add to the container.
+    """
+
+    def __init__(
+        self, records: Iterable[tuple[Path, str, list[int]]] | None = None
+    ) -> None:
+        self._folders = _Folders()
+        self._parent_ids = array("I")
+        self._offsets = array("Q", [0])
+        self._masks = array("H")
+        self._buffer = ""
+        self._chunks: list[str] = []
+        self._last: tuple[int, str] | None = None
+        if records is not None:
+            self.extend(records)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the columns."""
+        self._flush()
+        return {
+            "folders": self._folders,
+            "parent_ids": self._parent_ids,
+            "offsets": self._offsets,
+            "masks": self._masks,
+            "buffer": self._buffer,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the columns."""
+        self._folders = state["folders"]
+        self._parent_ids = state["parent_ids"]
+        self._offsets = state["offsets"]
+        self._masks = state["masks"]
+        self._buffer = state["buffer"]
+        self._chunks = []
+        self._last = None
+
+    def __len__(self) -> int:
+        """Number of violating files and folders."""
+        return len(self._masks)
+
+    def __iter__(self) -> Generator[tuple[Path, str, list[int]], None, None]:
+        """Iterate over the violation records."""
+        for k in range(len(self)):
+            path = self._folders.path(self._parent_ids[k]) / self._name(k)
+            primary, secondary = _decode(self._masks[k])
+            if len(primary) != 0:
+                yield (path, "primary", list(primary))
+            if len(secondary) != 0:
+                yield (path, "secondary", list(secondary))
+
+    def __repr__(self) -> str:
+        """String representation of the container."""
+        return (
+            f"<ViolationStore | {len(self)} violation(s) in "
+            f"{len(set(self._parent_ids))} folder(s)>"
+        )
+
+    def add(self, path: Path, severity: str, codes: list[int]) -> None:
+        """Add a violation record.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the file or folder violating the naming convention.
+        severity : str
+            Severity of the violation, ``"primary"`` or ``"secondary"``. The severity
+            is retrieved from the error codes.
+        codes : list of int
+            Error codes associated to the violation.
+        """
+        mask = 0
+        for code in codes:
+            mask |= ERRORS_BITS[code]
+        self._add(self._folders.intern(str(path.parent)), path.name, mask)
+
+    def extend(self, records: Iterable[tuple[Path, str, list[int]]]) -> None:
+        """Add violation records.
+
+        Parameters
+        ----------
+        records : iterable of tuple
+            Violation records ``(path, severity, codes)``.
+        """
+        for record in records:
+            self.add(*record)
+
+    def path(self, idx: int) -> Path:
+        """Get the path of a violating file or folder.
+
+        Parameters
+        ----------
+        idx : int
+            Index of the violation.
+
+        Returns
+        -------
+        path : Path
+            Path to the file or folder.
+        """
+        idx = ensure_int(idx, "idx")
+        if not -len(self) <= idx < len(self):
+            raise IndexError(f"Index {idx} is out of range.")
+        idx %= len(self)
+        return self._folders.path(self._parent_ids[idx]) / self._name(idx)
+
+    def paths(self) -> Generator[Path, None, None]:
+        """Iterate over the paths of the violating files and folders.
+
+        Yields
+        ------
+        path : Path
+            Path to the file or folder.
+        """
+        for k in range(len(self)):
+            yield self.path(k)
+
+    def filter(
+        self, code: int | None = None, *, severity: str | None = None
+    ) -> ViolationStore:
+        """Select the violations with a given error code or severity.
+
+        Parameters
+        ----------
+        code : int | None
+            Error code to select. If None, the violations are not filtered by code.
+        severity : ``"primary"`` | ``"secondary"`` | None
+            Severity to select. If None, the violations are not filtered by severity.
+
+        Returns
+        -------
+        store : ViolationStore
+            New container with the selected violations. The violations keep all
+            their error codes.
+        """
+        import numpy as np
+
+        selected = np.ones(len(self), dtype=bool)
+        if code is not None:
+            check_value(code, ERRORS_BITS, "code")
+            selected &= (self.masks & ERRORS_BITS[code]) != 0
+        if severity is not None:
+            check_value(severity, ("primary", "secondary"), "severity")
+            bits = _PRIMARY if severity == "primary" else _SECONDARY
+            selected &= (self.masks & bits) != 0
+        return self._take(np.flatnonzero(selected))
+
+    def counts(self) -> dict[int, int]:
+        """Count the violations per error code.
+
+        Returns
+        -------
+        counts : dict
+            Number of violating files and folders per error code.
+        """
+        import numpy as np
+
+        masks = self.masks
+        return {
+            code: int(np.count_nonzero(masks & bit))
+            for code, bit in ERRORS_BITS.items()
+        }
+
+    @fill_doc
+    def to_dict(self) -> dict[str, dict[Path, list[int]]]:
+        """Convert the container to a dictionary of violations.
+
+        Returns
+        -------
+        %(violations)s
+        """
+        violations = {"primary": dict(), "secondary": dict()}
+        for path, severity, codes in self:
+            violations[severity][path] = codes
+        return violations
+
+    @property
+    def masks(self) -> NDArray[np.uint16]:
+        """Bitmask of the error codes of each violation.
+
+        :type: array of uint16
+        """
+        import numpy as np
+
+        return np.array(self._masks, dtype=np.uint16)
+
+    def _name(self, idx: int) -> str:
+        """Get the name of a violating file or folder."""
+        self._flush()
+        return self._buffer[self._offsets[idx] : self._offsets[idx + 1]]
+
+    def _flush(self) -> None:
+        """Concatenate the names added since the last access to the buffer."""
+        if len(self._chunks) != 0:
+            self._buffer += "".join(self._chunks)
+            self._chunks.clear()
+
+    def _take(self, indices: NDArray[np.intp]) -> ViolationStore:
+        """Create a new container from a subset of the violations."""
+        store = ViolationStore()
+        store._folders = self._folders  # folders are only added, thus shareable
+        for k in indices:
+            store._add(self._parent_ids[k], self._name(k), self._masks[k])
+        return store
+
+    def _add(self, pid: int, name: str, mask: int) -> None:
+        """Add a violation from the index of its parent folder, name and bitmask."""
+        # the primary and secondary records of a path are consecutive
+        if self._last == (pid, name):
+            self._masks[-1] |= mask
+            return
+        self._last = (pid, name)
+        self._parent_ids.append(pid)
+        self._chunks.append(name)
+        self._offsets.append(self._offsets[-1] + len(name))
+        self._masks.append(mask)
+
+
+class _Folders:
+    """Prefix tree of folders, each stored once as its name and its parent index.
+
+    The full path of a folder is only held in transient lookup tables, which are not
+    pickled.
+    """
+
+    def __init__(self) -> None:
+        self._parents = array("i")  # -1 for the top-level folders
+        self._names: list[str] = []
+        self._index: dict[tuple[int, str], int] = dict()
+        self._lookup: dict[str, int] = dict()
+        self._paths: dict[int, Path] = dict()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the tree without the lookup tables."""
+        return {"parents": self._parents, "names": self._names}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the tree and its index."""
+        self._parents = state["parents"]
+        self._names = state["names"]
+        self._index = {
+            (pid, name): k
+            for k, (pid, name) in enumerate(
+                zip(self._parents, self._names, strict=True)
+            )
+        }
+        self._lookup = dict()
+        self._paths = dict()
+
+    def intern(self, folder: str) -> int:
+        """Get the index of a folder, adding it and its parents if needed."""
+        idx = self._lookup.get(folder)
+        if idx is not None:
+            return idx
+        head, name = os.path.split(folder)
+        if head == folder:  # anchor, e.g. '/', or empty relative path
+            pid, name = -1, folder
+        else:
+            pid = self.intern(head)
+        idx = self._index.get((pid, name))
+        if idx is None:
+            idx = self._index[(pid, name)] = len(self._names)
+            self._parents.append(pid)
+            self._names.append(name)
+        self._lookup[folder] = idx
+        return idx
+
+    def path(self, idx: int) -> Path:
+        """Get the path of a folder by walking up its parents."""
+        path = self._paths.get(idx)
+        if path is None:
+            pid = self._parents[idx]
+            name = self._names[idx]
+            path = Path(name) if pid == -1 else self.path(pid) / name
+            self._paths[idx] = path
+        return path
+
+
+# bits of the error codes reported as primary and secondary violations
+_PRIMARY: int = sum(bit for code, bit in ERRORS_BITS.items() if code < 100)
+_SECONDARY: int = sum(bit for code, bit in ERRORS_BITS.items() if 100 <= code)
+
+
+@cache
+def _decode(mask: int) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Decode a bitmask into the primary and secondary error codes."""
+    codes = [code for code in ERRORS_CODES if mask & ERRORS_BITS[code]]
+    return (
+        tuple(code for code in codes if code < 100),
+        tuple(code for code in codes if 100 <= code),
+    )
@@ -0,0 +1,427 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from ..utils._checks import check_value, ensure_path
+from ..utils._docs import fill_doc
+from ..utils.logs import logger
+from ._filters import Exclude, _Filters
+from ._regex import (
+    _folder_code,
+    _reference_date,
+    _validate_file_name,
+    _validate_folder_name,
+)
+from .validator import _records
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Sequence
+    from datetime import date
+    from pathlib import Path
+
+
+# inotify constants from <sys/inotify.h>
+_IN_CREATE: int = 0x00000100
+_IN_DELETE: int = 0x00000200
+_IN_MOVED_FROM: int = 0x00000040
+_IN_MOVED_TO: int = 0x00000080
+_IN_Q_OVERFLOW: int = 0x00004000
+_IN_IGNORED: int = 0x00008000
+_IN_ONLYDIR: int = 0x01000000
+_IN_MASK: int = _IN_CREATE | _IN_DELETE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_ONLYDIR
+_IN_EVENT = struct.Struct("iIII")
+
+
+class _Folder:
+    """State of a watched folder.
+
+    Parameters
+    ----------
+    inode : int
+        Inode number of the folder, which changes if the folder is replaced by
+        another folder with the same name.
+    mtime : int
+        Modification time of the folder when it was listed, in nanoseconds.
+    code : str | None
+        Code of the folder, or None if the folder name is invalid.
+    folders : list of str
+        Names of the subfolders walked.
+    records : list of tuple
+        Violation records ``(path, severity, codes)`` of the entries of the folder.
+    """
+
+    __slots__ = ("inode", "mtime", "code", "folders", "records")
+
+    def __init__(
+        self,
+        inode: int,
+        mtime: int,
+        code: str | None,
+        folders: list[str],
+        records: list[tuple[Path, str, list[int]]],
+    ) -> None:
+        self.inode = inode
+        self.mtime = mtime
+        self.code = code
+        self.folders = folders
+        self.records = records
+
+
+@fill_doc
+class Watcher:
+    """Keep the violations of a folder up to date with the changes on disk.
+
+    The folder is walked once on creation. Afterwards, :meth:`~Watcher.update` waits
+    for file system events and re-lists only the folders whose entries changed. The
+    new entries are validated, the violations of the removed entries are dropped, and
+    the new or renamed subfolders are walked entirely since the validation of their
+    content depends on their name.
+
+    Parameters
+    ----------
+    folder : Path | str
+        Path to the folder to watch.
+    backend : ``"auto"`` | ``"inotify"`` | ``"polling"``
+        Source of the file system events. ``"inotify"`` is only available on Linux
+        and requires one watch per folder (see ``/proc/sys/fs/inotify``).
+        ``"polling"`` compares the modification time of every folder on each update.
+        ``"auto"`` selects ``"inotify"`` on Linux and ``"polling"`` otherwise.
+    %(ignore)s
+    %(exclude)s
+    %(as_of)s
+    """
+
+    def __init__(
+        self,
+        folder: Path | str,
+        *,
+        backend: str = "auto",
+        ignore: Sequence[str] | None = None,
+        exclude: Exclude | None = None,
+        as_of: date | str | None = None,
+    ) -> None:
+        self._root = ensure_path(folder, must_exist=True)
+        check_value(backend, ("auto", "inotify", "polling"), "backend")
+        # the ignored violations are kept in the state and filtered out on output,
+        # thus an ignored folder is still walked to propagate its code.
+        self._filters = _Filters(() if ignore is None else ignore, exclude, self._root)
+        # the known violations are not validated again, thus a single reference date
+        # is used for the lifetime of the watcher.
+        self._today = _reference_date(as_of)
+        if backend == "auto":
+            backend = "inotify" if sys.platform.startswith("linux") else "polling"
+        self._backend = backend
+        self._inotify = _Inotify() if backend == "inotify" else None
+        self._folders: dict[Path, _Folder] = dict()
+        errors, code = _validate_folder_name(
+            self._root.name, _folder_code(self._root.parent.name)
+        )
+        self._root_records = (
+            [] if self._filters.ignored(os.curdir) else _records(self._root, errors)
+        )
+        for _ in self._walk(self._root, code):
+            pass
+
+    def __enter__(self) -> Watcher:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Exit the context manager and stop watching."""
+        self.close()
+
+    def close(self) -> None:
+        """Stop watching the folder."""
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def update(
+        self, timeout: float | None = None
+    ) -> list[tuple[str, Path, str, list[int]]]:
+        """Wait for changes and update the violations.
+
+        Parameters
+        ----------
+        timeout : float | None
+            Maximum time to wait for changes, in seconds. With the ``"polling"``
+            backend, the folders are compared after waiting ``timeout`` seconds. If
+            None, waits until a change occurs.
+
+        Returns
+        -------
+        events : list of tuple
+            Changes in the violations, as tuples ``(event, path, severity, codes)``
+            where ``event`` is ``"added"`` or ``"removed"``.
+        """
+        if self._inotify is None and self._backend == "inotify":
+            raise RuntimeError("The watcher is closed.")
+        while True:
+            dirty = self._wait(timeout)
+            events = []
+            # update parents first, which might drop or walk their children
+            for folder in sorted(dirty, key=lambda elt: len(elt.parts)):
+                if folder in self._folders:
+                    events.extend(
+                        event
+                        for event in self._update(folder)
+                        if not self._ignored(event[1])
+                    )
+            if len(events) != 0 or timeout is not None:
+                return events
+
+    def iter_violations(self) -> Generator[tuple[Path, str, list[int]], None, None]:
+        """Iterate over the current violations.
+
+        Yields
+        ------
+        %(violation_record)s
+        """
+        yield from self._root_records
+        for state in self._folders.values():
+            for record in state.records:
+                if not self._ignored(record[0]):
+                    yield record
+
+    @property
+    def backend(self) -> str:
+        """Source of the file system events.
+
+        :type: str
+        """
+        return self._backend
+
+    def _ignored(self, path: Path) -> bool:
+        """Check if the violations of a path below the root are ignored."""
+        return len(self._filters.ignore) != 0 and self._filters.ignored(
+            self._filters.relpath(path)
+        )
+
+    def _wait(self, timeout: float | None) -> set[Path]:
+        """Wait for file system events and return the folders which changed."""
+        if self._inotify is not None:
+            dirty = self._inotify.read(timeout)
+            if dirty is None:  # overflow of the event queue, compare every folder
+                return self._poll()
+            return dirty
+        while True:
+            if timeout is not None:
+                time.sleep(timeout)
+            dirty = self._poll()
+            if len(dirty) != 0 or timeout is not None:
+                return dirty
+            time.sleep(1)
+
+    def _poll(self) -> set[Path]:
+        """Compare the modification time of the watched folders."""
+        dirty = set()
+        for folder, state in self._folders.items():
+            try:
+                if os.stat(folder).st_mtime_ns != state.mtime:
+                    dirty.add(folder)
+            except FileNotFoundError:
+                pass  # the removal is handled when the parent is updated
+        return dirty
+
+    def _update(self, folder: Path) -> Generator[tuple[str, Path, str, list[int]]]:
+        """Re-list a folder and yield the changes in the violations."""
+        state = self._folders[folder]
+        try:
+            mtime = os.stat(folder).st_mtime_ns
+            with os.scandir(folder) as entries:
+                entries = [
+                    (entry.name, entry.is_dir(), entry.is_dir() and entry.inode())
+                    for entry in entries
+                ]
+        except FileNotFoundError:
+            return  # the removal is handled when the parent is updated
+        state.mtime = mtime
+        known = dict()
+        for record in state.records:
+            known.setdefault(record[0].name, []).append(record)
+        names = set()
+        records = []
+        folders = []
+        new_folders = dict()
+        replaced = set()
+        for name, is_dir, inode in entries:
+            if is_dir and self._filters.excluded(name):
+                continue
+            names.add(name)
+            if is_dir:
+                folders.append(name)
+                if name in state.folders and self._replaced(folder / name, inode):
+                    # deleted and created again between two updates, the known
+                    # content is dropped and the new folder is walked.
+                    replaced.add(name)
+                if name not in state.folders or name in replaced:
+                    # the folder is validated to propagate its code to its entries,
+                    # even if its violations are already known.
+                    errors, new_folders[name] = _validate_folder_name(name, state.code)
+            if name in known:
+                records.extend(known[name])
+                continue
+            if is_dir:
+                if name not in new_folders:
+                    continue  # valid folder, already walked
+            else:
+                errors = _validate_file_name(name, state.code, self._today)
+            for record in _records(folder / name, errors):
+                records.append(record)
+                yield ("added", *record)
+        for record in state.records:
+            if record[0].name not in names:
+                yield ("removed", *record)
+        for name in state.folders:
+            if name not in names or name in replaced:
+                yield from self._drop(folder / name)
+        state.records = records
+        state.folders = folders
+        for name, code in new_folders.items():
+            for record in self._walk(folder / name, code):
+                yield ("added", *record)
+
+    def _replaced(self, folder: Path, inode: int) -> bool:
+        """Check if a known folder was replaced by another folder with its name."""
+        state = self._folders.get(folder)
+        if state is None or state.inode != inode:
+            return True
+        # the inode number of a deleted folder can be reused right away, but the
+        # watch of a deleted folder is removed by the kernel.
+        return self._inotify is not None and not self._inotify.watching(folder)
+
+    def _walk(
+        self, folder: Path, code: str | None
+    ) -> Generator[tuple[Path, str, list[int]]]:
+        """Walk a new folder, start watching it and yield its violations."""
+        stack = [(folder, code)]
+        while len(stack) != 0:
+            folder, code = stack.pop()
+            # the watch is added before the listing to not miss an entry created in
+            # between.
+            if self._inotify is not None:
+                self._inotify.add(folder)
+            try:
+                stat = os.stat(folder)
+                with os.scandir(folder) as entries:
+                    entries = [(entry.name, entry.is_dir()) for entry in entries]
+            except FileNotFoundError:
+                continue
+            records = []
+            folders = dict()
+            for name, is_dir in entries:
+                if is_dir:
+                    if self._filters.excluded(name):
+                        continue
+                    errors, folders[name] = _validate_folder_name(name, code)
+                else:
+                    errors = _validate_file_name(name, code, self._today)
+                records.extend(_records(folder / name, errors))
+            self._folders[folder] = _Folder(
+                stat.st_ino, stat.st_mtime_ns, code, list(folders), records
+            )
+            yield from records
+            stack.extend(
+                (folder / name, subcode) for name, subcode in reversed(folders.items())
+            )
+
+    def _drop(self, folder: Path) -> Generator[tuple[str, Path, str, list[int]]]:
+        """Stop watching a removed folder and yield the violations removed."""
+        stack = [folder]
+        while len(stack) != 0:
+            folder = stack.pop()
+            state = self._folders.pop(folder, None)
+            if state is None:
+                continue
+            if self._inotify is not None:
+                self._inotify.remove(folder)
+            for record in state.records:
+                yield ("removed", *record)
+            stack.extend(folder / name for name in state.folders)
+
+
+class _Inotify:
+    """Minimal binding to the Linux inotify API, watching folders for new names."""
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._watches: dict[int, Path] = dict()
+        self._descriptors: dict[Path, int] = dict()
+
+    def add(self, folder: Path) -> None:
+        """Start watching a folder."""
+        wd = self._add_watch(self._fd, os.fsencode(folder), _IN_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(
+                errno,
+                f"Could not watch '{folder}': {os.strerror(errno)}. The number of "
+                "inotify watches might be insufficient, see "
+                "/proc/sys/fs/inotify/max_user_watches, or use the polling backend.",
+            )
+        self._watches[wd] = folder
+        self._descriptors[folder] = wd
+
+    def watching(self, folder: Path) -> bool:
+        """Check if a folder is watched, i.e. not deleted since it was added."""
+        return folder in self._descriptors
+
+    def remove(self, folder: Path) -> None:
+        """Stop watching a folder."""
+        wd = self._descriptors.pop(folder, None)
+        if wd is None:
+            return
+        if self._watches.get(wd) == folder:
+            del self._watches[wd]
+            # fails if the watch was already removed by the kernel with the folder
+            self._rm_watch(self._fd, wd)
+
+    def read(self, timeout: float | None) -> set[Path] | None:
+        """Wait for events and return the folders whose entries changed.
+
+        Returns None if the event queue overflowed and events were lost.
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        dirty = set()
+        if len(ready) == 0:
+            return dirty
+        while True:
+            try:
+                buffer = os.read(self._fd, 65536)
+            except BlockingIOError:
+                return dirty
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _, length = _IN_EVENT.unpack_from(buffer, offset)
+                offset += _IN_EVENT.size + length
+                if mask & _IN_Q_OVERFLOW:
+                    logger.info("The inotify event queue overflowed.")
+                    return None
+                if mask & _IN_IGNORED:
+                    # the watch was removed, e.g. with its deleted folder, the
+                    # deletion itself is reported on the parent.
+                    folder = self._watches.pop(wd, None)
+                    if folder is not None and self._descriptors.get(folder) == wd:
+                        del self._descriptors[folder]
+                    continue
+                if wd in self._watches:
+                    dirty.add(self._watches[wd])
+
+    def close(self) -> None:
+        """Close the inotify instance and all its watches."""
+        os.close(self._fd)
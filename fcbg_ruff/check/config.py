@@ -13,3 +13,6 @@ ERRORS_CODES: dict[int, str] = {
     # secondary violation, depending on a primary violation
     101: "File/Folder code could not be compared to invalid parent pattern.",
 }
+
+# bit of each error code in the uint16 bitmasks, following the order of ERRORS_CODES
+ERRORS_BITS: dict[int, int] = {code: 1 << k for k, code in enumerate(ERRORS_CODES)}
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import io
+import shutil
+import subprocess
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from fcbg_ruff.check import (
+    Exclude,
+    _archive,
+    _listing,
+    iter_archive_violations,
+    iter_violations,
+)
+
+
+def _expected(folder: Path, **kwargs) -> list[tuple[Path, str, list[int]]]:
+    """Validate the content of a folder, with the paths relative to the folder."""
+    return sorted(
+        (path.relative_to(folder), severity, codes)
+        for path, severity, codes in iter_violations(folder, **kwargs)
+        if path != folder  # the root of an archive has no name
+    )
+
+
+@pytest.mark.parametrize("fmt", ["zip", "tar", "gztar", "bztar", "xztar", "zstd"])
+def test_iter_archive_violations(
+    folder_with_invalid_files,
+    tmp_path_factory,
+    monkeypatch: pytest.MonkeyPatch,
+    fmt: str,
+):
+    """Test that an archive is validated like the folder it was created from."""
+    folder, _ = folder_with_invalid_files
+    tmp_path = tmp_path_factory.mktemp("archive")
+    if fmt == "zstd":
+        zstandard = pytest.importorskip("zstandard")
+        fname = Path(shutil.make_archive(tmp_path / "archive", "tar", folder))
+        with open(fname, "rb") as fin, open(f"{fname}.zst", "wb") as fout:
+            zstandard.ZstdCompressor().copy_stream(fin, fout)
+        fname = Path(f"{fname}.zst")
+    else:
+        fname = Path(shutil.make_archive(tmp_path / "archive", fmt, folder))
+
+    # the content of the members is never read
+    def _raise(*args, **kwargs):
+        raise AssertionError("Unexpected read of the content of a member.")
+
+    monkeypatch.setattr(zipfile.ZipFile, "open", _raise)
+    monkeypatch.setattr(tarfile.TarFile, "extractfile", _raise)
+    for kwargs in (
+        dict(),
+        dict(ignore=["*/invalid_file_name", "*/_F1a_*/*"]),
+        dict(exclude=Exclude(patterns=["_F*a_*"])),
+        dict(as_of="2000-01-01"),
+    ):
+        assert sorted(iter_archive_violations(fname, **kwargs)) == _expected(
+            folder, **kwargs
+        )
+
+
+def test_iter_archive_violations_stream(
+    folder: Path, tmp_path_factory, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that the members are validated as they are read."""
+    # tarfile adds the entries in sorted order, the violation is in the first folder
+    first = min(elt for elt in folder.iterdir() if elt.is_dir())
+    (first / "invalid_file_name").write_text("")
+    fname = shutil.make_archive(
+        tmp_path_factory.mktemp("archive") / "a", "gztar", folder
+    )
+    read = []
+    iter_members = _archive._iter_members
+
+    def _iter_members(fname):
+        for member in iter_members(fname):
+            read.append(member)
+            yield member
+
+    monkeypatch.setattr(_archive, "_iter_members", _iter_members)
+    monkeypatch.setattr(_listing, "_CHUNK", 1)
+    violations = iter_archive_violations(fname)
+    next(violations)
+    n_read = len(read)
+    list(violations)
+    assert n_read < len(read)
+
+
+@pytest.mark.parametrize(
+    "fmt", [tarfile.USTAR_FORMAT, tarfile.GNU_FORMAT, tarfile.PAX_FORMAT]
+)
+def test_iter_archive_violations_tar_formats(tmp_path: Path, fmt: int):
+    """Test the long names of the TAR formats, stored in several headers."""
+    long = "/".join(f"_F1{'a' * k}_{'b' * 40}" for k in range(3))
+    fname = tmp_path / "archive.tar"
+    with tarfile.open(fname, "w", format=fmt) as archive:
+        for name, type_, size in (
+            ("_F1_a", tarfile.DIRTYPE, 0),
+            ("_F1_a/F1_220101_file_ABC.txt", tarfile.REGTYPE, 700),
+            ("_F1_a/link", tarfile.SYMTYPE, 0),
+            (long, tarfile.DIRTYPE, 0),
+            (f"{long}/F1a_220101_{'c' * 10}_ABC.txt", tarfile.REGTYPE, 1),
+        ):
+            info = tarfile.TarInfo(name)
+            info.type = type_
+            info.size = size
+            info.linkname = "_F1_a/F1_220101_file_ABC.txt" if info.issym() else ""
+            archive.addfile(info, io.BytesIO(b"\x00" * size) if size else None)
+    assert sorted(iter_archive_violations(fname)) == [
+        (Path("_F1_a/link"), "primary", [1]),
+        (Path(long) / f"F1a_220101_{'c' * 10}_ABC.txt", "primary", [11]),
+    ]
+
+
+@pytest.mark.skipif(shutil.which("tar") is None, reason="Requires GNU tar.")
+@pytest.mark.parametrize("fmt", ["gnu", "pax"])
+def test_iter_archive_violations_gnu_tar(
+    folder_with_invalid_files, tmp_path_factory, fmt: str
+):
+    """Test archives written by GNU tar, with sparse members and long names."""
+    folder, _ = folder_with_invalid_files
+    long = folder / "_F1_a" / f"_F1a_{'b' * 120}"
+    long.mkdir(parents=True)
+    with open(long / "F1a_220101_sparse_ABC.bin", "wb") as fid:
+        fid.truncate(1 << 20)  # sparse file, stored as a sparse member
+    (long / "F1_220101_code_ABC.txt").write_text("101")
+    fname = tmp_path_factory.mktemp("archive") / "archive.tar"
+    result = subprocess.run(
+        ["tar", f"--format={fmt}", "--sparse", "-cf", str(fname), "-C", str(folder)]
+        + ["."],
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        pytest.skip(f"GNU tar is not available: {result.stderr.decode()}")
+    with tarfile.open(fname) as archive:
+        assert any(member.issparse() for member in archive)
+    violations = sorted(iter_archive_violations(fname))
+    assert violations == _expected(folder)
+    assert (long.relative_to(folder) / "F1_220101_code_ABC.txt", "primary", [11]) in (
+        violations
+    )
+
+
+def test_iter_archive_violations_invalid(tmp_path: Path):
+    """Test the validation of the arguments and of the archive."""
+    fname = tmp_path / "archive.zip"
+    with zipfile.ZipFile(fname, "w") as archive:
+        # only the files are stored, without the folder entries, in any order
+        archive.writestr("_F1_a/_F1b_c/F1a_220101_file_ABC.txt", "101")
+        archive.writestr("_F1_a/_F1a_b/F1a_220101_file_ABC.txt", "101")
+        archive.writestr("_F1_a/_F1b_c/F1b_220101_file_ABC.txt", "101")
+    assert list(iter_archive_violations(fname)) == [
+        (Path("_F1_a/_F1b_c/F1a_220101_file_ABC.txt"), "primary", [11])
+    ]
+    fname = tmp_path / "archive.txt"
+    fname.write_text("101")
+    with pytest.raises(ValueError, match="not a supported archive"):
+        list(iter_archive_violations(fname))
+    # a TAR archive is read as a stream, the content of a folder must be contiguous
+    fname = tmp_path / "archive.tar"
+    with tarfile.open(fname, "w") as archive:
+        for name in ("_F1_a/_F1b_c/a", "_F1_a/_F1a_b/b", "_F1_a/_F1b_c/c"):
+            archive.addfile(tarfile.TarInfo(name))
+    with pytest.raises(ValueError, match="listed in several places"):
+        list(iter_archive_violations(fname))
+    data = bytearray(fname.read_bytes())
+    data[0] ^= 0xFF
+    fname.write_bytes(data)
+    with pytest.raises(ValueError, match="not a valid TAR archive"):
+        list(iter_archive_violations(fname))
+    with pytest.raises(FileNotFoundError):
+        list(iter_archive_violations(tmp_path / "missing.zip"))
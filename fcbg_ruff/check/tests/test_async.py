@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from fcbg_ruff.check import _async, aiter_violations, avalidate_folder, validate_folder
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 8])
+def test_avalidate_folder(folder: Path, max_concurrency: int):
+    """Test asynchronous validation of a documentary system tree."""
+    (folder / "_F1_test test").mkdir()
+    (folder / "_F1_test test" / "invalid_file_name.txt").write_text("101")
+    violations = asyncio.run(avalidate_folder(folder, max_concurrency=max_concurrency))
+    assert violations == validate_folder(folder)
+    assert violations["primary"][folder / "_F1_test test"] == [3]
+
+
+def test_avalidate_folder_concurrent(folder: Path):
+    """Test validation of several folders on the same event loop."""
+    folders = [elt for elt in folder.iterdir() if elt.is_dir()]
+
+    async def main():
+        return await asyncio.gather(*(avalidate_folder(elt) for elt in folders))
+
+    for elt, violations in zip(folders, asyncio.run(main()), strict=True):
+        assert violations == validate_folder(elt)
+
+
+def test_aiter_violations(folder: Path):
+    """Test asynchronous iteration over the violations."""
+    (folder / "invalid_file_name.txt").write_text("101")
+
+    async def main():
+        return [record async for record in aiter_violations(folder)]
+
+    records = asyncio.run(main())
+    assert (folder / "invalid_file_name.txt", "primary", [1]) in records
+    with pytest.raises(ValueError, match="greater or equal to 1"):
+        asyncio.run(avalidate_folder(folder, max_concurrency=0))
+    with pytest.raises(TypeError, match="must be an instance of"):
+        asyncio.run(avalidate_folder(folder, thread_pool="threads"))
+
+
+def test_avalidate_folder_thread_pool(folder: Path):
+    """Test validation of several folders with a shared pool of threads."""
+    folders = [elt for elt in folder.iterdir() if elt.is_dir()]
+
+    async def main(thread_pool):
+        return await asyncio.gather(
+            *(avalidate_folder(elt, thread_pool=thread_pool) for elt in folders)
+        )
+
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="shared") as pool:
+        results = asyncio.run(main(pool))
+        # the pool is not shut down by the validation
+        assert pool.submit(lambda: 101).result() == 101
+    for elt, violations in zip(folders, results, strict=True):
+        assert violations == validate_folder(elt)
+
+
+def test_aiter_violations_slow_consumer(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that the walk waits for the consumer."""
+    folder = tmp_path / "_F1_root"
+    for k in range(50):
+        (folder / f"invalid {k}").mkdir(parents=True)
+    scanned = []
+    scan_folder = _async._scan_folder
+
+    def _scan_folder(folder, *args):
+        scanned.append(folder)
+        return scan_folder(folder, *args)
+
+    monkeypatch.setattr(_async, "_scan_folder", _scan_folder)
+
+    async def main():
+        violations = aiter_violations(folder, max_concurrency=2)
+        await anext(violations)
+        await asyncio.sleep(0.2)
+        n_scanned = len(scanned)
+        records = [record async for record in violations]
+        return n_scanned, records
+
+    n_scanned, records = asyncio.run(main())
+    # the root, the listings queued, and those waiting in the workers
+    assert n_scanned <= 1 + 2 + 2
+    assert len(scanned) == 51
+    assert len(records) == 49
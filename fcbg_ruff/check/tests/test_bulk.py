@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from fcbg_ruff.check import validate_names
+from fcbg_ruff.check._regex import (
+    _folder_code,
+    _reference_date,
+    _validate_file_name,
+    _validate_folder_name,
+)
+from fcbg_ruff.check.config import ERRORS_BITS
+from fcbg_ruff.utils.logs import _WarningCollector
+
+
+def _mask(error_codes: dict[str, list[int]]) -> int:
+    """Convert a dictionary of error codes to a bitmask."""
+    mask = 0
+    for codes in error_codes.values():
+        for code in codes:
+            mask |= ERRORS_BITS[code]
+    return mask
+
+
+def test_validate_names():
+    """Test the bulk validation against the validation of individual names."""
+    files = [
+        "F1_220101_name_ABC.txt",
+        "F1a_991231_name_with_underscores_ABC",
+        "F1_300101_name_ABC.txt",
+        "F2_220101_name_ABC.txt",
+        "F1_220101_na me_ABC.txt",
+        "F1_220101__name_ABC.txt",
+        "F1_220101_name_AB1.txt",
+        "F1_2201_name_ABC.txt",
+        ".F1_220101_name_ABC",
+        "F1_220101_name_ABC.",
+        "invalid",
+        "",
+    ]
+    folders = ["_F1a_name", "_F1ab_name", "_F2a_name", "_F1a_na-me", "_F1_", "F1a_x"]
+    parents = ["_F1_parent", "_F1a_parent", "invalid"]
+    for parent in parents:
+        masks = validate_names(
+            files + folders, parent, is_dir=[False] * 12 + [True] * 6
+        )
+        expected = [
+            _mask(_validate_file_name(name, _folder_code(parent), _reference_date()))
+            for name in files
+        ]
+        expected += [
+            _mask(_validate_folder_name(name, _folder_code(parent))[0])
+            for name in folders
+        ]
+        assert masks.dtype == np.uint16
+        assert masks.tolist() == expected
+    masks = validate_names(files, "_F1_parent")
+    assert masks[0] == 0
+    assert masks[2] == ERRORS_BITS[21]
+    assert masks[3] == ERRORS_BITS[11]
+    assert masks[-1] == ERRORS_BITS[1]
+
+
+def test_validate_names_shape():
+    """Test the alignment of the masks with the input."""
+    assert validate_names([], []).shape == (0,)
+    names = np.array([["_F1a_x", "_F1b_y"], ["_F2a_x", "_F3a_y"]])
+    masks = validate_names(names, "_F1_parent", is_dir=True)
+    assert masks.shape == (2, 2)
+    assert masks.tolist() == [[0, 0], [ERRORS_BITS[11]] * 2]
+    masks = validate_names(names, np.array([["_F1_p"], ["_F2_p"]]), is_dir=True)
+    assert masks.tolist() == [[0, 0], [0, ERRORS_BITS[11]]]
+
+
+def test_validate_names_invalid_date():
+    """Test the warning on dates which can not be parsed."""
+    with pytest.warns(RuntimeWarning, match="2 file name"):
+        masks = validate_names(
+            ["F1_220230_name_ABC", "F1_221301_name_ABC", "F1_220101_name_ABC"],
+            "_F1_parent",
+        )
+    assert masks.tolist() == [0, 0, 0]
+    # the warning is counted by a collector, like the warnings of the rules
+    with _WarningCollector() as collector:
+        validate_names(["F1_220230_name_ABC"], "_F1_parent")
+    assert len(collector) == 1
+    with pytest.warns(RuntimeWarning, match="1 file name"):
+        collector.emit()
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import os
+import random
+import sqlite3
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from fcbg_ruff.check import Validator, validate_folder
+from fcbg_ruff.check._cache import _cache_fname
+from fcbg_ruff.utils._path import walk_folders
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def scandir(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record the folders listed with os.scandir."""
+    listed = []
+    _scandir = os.scandir
+
+    def scandir(path):
+        listed.append(str(path))
+        return _scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    return listed
+
+
+@pytest.mark.parametrize(
+    ("n_jobs", "executor"),
+    [(1, "processes"), (2, "threads")],
+    ids=["serial", "threads"],
+)
+def test_cache(folder: Path, tmp_path_factory, scandir, n_jobs: int, executor: str):
+    """Test that unchanged folders are not listed again."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    kwargs = dict(n_jobs=n_jobs, executor=executor, cache_dir=cache_dir)
+    violations = validate_folder(folder, **kwargs)
+    assert _cache_fname(cache_dir, folder).exists()
+    scandir.clear()
+    assert validate_folder(folder, **kwargs) == violations
+    assert len(scandir) == 0
+    # add an invalid file in one folder
+    folders = [elt for elt in walk_folders(folder) if elt.name.lower() != "__old"]
+    changed = random.choice(folders)
+    (changed / "invalid_file_name.txt").write_text("101")
+    scandir.clear()
+    violations = validate_folder(folder, **kwargs)
+    assert scandir == [str(changed)]
+    assert violations == validate_folder(folder)
+
+
+@pytest.mark.filterwarnings("ignore:The number of requested jobs.*:RuntimeWarning")
+@pytest.mark.parametrize(
+    ("n_jobs", "executor"),
+    [(1, "processes"), (2, "threads")],
+    ids=["serial", "threads"],
+)
+def test_cache_closed(
+    folder: Path,
+    tmp_path_factory,
+    monkeypatch: pytest.MonkeyPatch,
+    n_jobs: int,
+    executor: str,
+):
+    """Test that the database of the previous run is closed before it is replaced."""
+    connections = []
+    connect = sqlite3.connect
+
+    def _connect(database, *args, **kwargs):
+        connection = connect(database, *args, **kwargs)
+        if str(database).endswith("?mode=ro"):
+            connections.append(connection)
+        return connection
+
+    replace = os.replace
+
+    def _replace(src, dst):
+        # a database held open can not be replaced on Windows
+        for connection in connections:
+            with pytest.raises(sqlite3.ProgrammingError, match="closed"):
+                connection.execute("SELECT 1")
+        replace(src, dst)
+
+    monkeypatch.setattr(sqlite3, "connect", _connect)
+    monkeypatch.setattr(os, "replace", _replace)
+    cache_dir = tmp_path_factory.mktemp("cache")
+    # the workers of the pool outlive each call
+    with Validator(n_jobs, executor=executor) as validator:
+        for _ in range(3):
+            validator.validate_folder(folder, cache_dir=cache_dir)
+    assert len(connections) != 0
+
+
+def test_cache_renamed_parent(folder: Path, tmp_path_factory):
+    """Test that the cache is invalidated when a parent folder is renamed."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    parent = next(elt for elt in folder.iterdir() if elt.is_dir())
+    validate_folder(folder, cache_dir=cache_dir)
+    renamed = parent.rename(parent.parent / "_F9_renamed")
+    violations = validate_folder(folder, cache_dir=cache_dir)
+    assert violations == validate_folder(folder)
+    # the content of the renamed folder does not match the new code anymore
+    assert any(renamed in path.parents for path in violations["primary"])
+
+
+def test_cache_future_date(tmp_path: Path, tmp_path_factory, scandir):
+    """Test that results depending on the current date are not cached."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    folder = tmp_path / "_F1_test"
+    folder.mkdir()
+    future = (date.today() + timedelta(days=365)).strftime("%y%m%d")
+    fname = folder / f"F1_{future}_test_ABC.txt"
+    fname.write_text("101")
+    violations = validate_folder(folder, cache_dir=cache_dir)
+    assert violations["primary"] == {fname: [21]}
+    scandir.clear()
+    assert validate_folder(folder, cache_dir=cache_dir) == violations
+    assert scandir == [str(folder)]  # listed again, the result was not cached
+
+
+def test_cache_as_of(tmp_path: Path, tmp_path_factory):
+    """Test that an explicit reference date invalidates the cache."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    folder = tmp_path / "_F1_test"
+    folder.mkdir()
+    (folder / "F1_220101_test_ABC.txt").write_text("101")
+    assert validate_folder(folder, cache_dir=cache_dir)["primary"] == {}
+    violations = validate_folder(folder, cache_dir=cache_dir, as_of="2021-12-31")
+    assert violations["primary"] == {folder / "F1_220101_test_ABC.txt": [21]}
+    assert validate_folder(folder, cache_dir=cache_dir)["primary"] == {}
@@ -0,0 +1,150 @@
+import os
+import pickle
+from fnmatch import fnmatch
+from pathlib import Path
+
+import pytest
+
+from fcbg_ruff.check import Exclude, iter_violations, validate_folder
+from fcbg_ruff.check._filters import _Filters
+
+
+def test_filters():
+    """Test the compiled ignore patterns."""
+    filters = _Filters(["*/.DS_Store", "*/Archive_2010/*", "data/tmp*"])
+    assert filters.ignored("a/b/.DS_Store")
+    assert not filters.ignored("a/b/.DS_Store.txt")
+    assert filters.ignored("a/Archive_2010/b/c")
+    assert not filters.ignored("a/Archive_2010")
+    assert filters.pruned("a/Archive_2010")
+    assert not filters.pruned("a/Archive_2011")
+    assert filters.pruned("data/tmp")
+    assert filters.pruned("data/tmp_2")
+    assert not filters.pruned("a/.DS_Store")
+    filters = pickle.loads(pickle.dumps(filters))
+    assert filters.ignored("a/b/.DS_Store")
+    assert not _Filters().ignored("a") and not _Filters().pruned("a")
+    assert pickle.loads(pickle.dumps(_Filters())).ignore == ()
+    with pytest.raises(TypeError, match="must be an instance of"):
+        _Filters("*/.DS_Store")
+
+
+def test_exclude():
+    """Test the compiled excluded folder names and patterns."""
+    exclude = Exclude(["@eaDir"], ["__old", "$RECYCLE.BIN"], [".Trash-*"])
+    assert exclude.match("@eaDir")
+    assert not exclude.match("@EADIR")
+    assert exclude.match("__OLD") and exclude.match("$Recycle.Bin")
+    assert exclude.match(".Trash-1000")
+    assert not exclude.match("_F1_.Trash-1000")
+    assert not exclude.match("__old_2")
+    assert Exclude().match("__Old")
+    assert not Exclude(inames=()).match("__old")
+    exclude = pickle.loads(pickle.dumps(exclude))
+    assert exclude.match(".Trash-1000")
+    assert exclude.names == ("@eaDir",)
+    assert "@eaDir" in repr(exclude)
+    with pytest.raises(TypeError, match="must be an instance of"):
+        Exclude("@eaDir")
+
+
+def test_relpath():
+    """Test the form of the paths matched by the ignore patterns."""
+    for root in (Path("."), Path("a"), Path("a/b"), Path("/"), Path("/a")):
+        filters = _Filters(root=root)
+        assert filters.relpath(root) == "."
+        assert filters.prefix(root) + "x" == filters.relpath(root / "x") == "./x"
+        assert filters.relpath(root / "x" / "y") == "./x/y"
+        assert filters.prefix(root / "x") == "./x/"
+    assert (
+        pickle.loads(pickle.dumps(_Filters(root=Path("a")))).relpath(Path("a")) == "."
+    )
+
+
+def _filter(records, folder: Path, patterns: list[str]) -> list:
+    """Filter the records on the forms of their path matched by the patterns."""
+    filtered = []
+    for record in records:
+        path = record[0].relative_to(folder).as_posix()
+        forms = (record[0].as_posix(), "." if path == "." else f"./{path}")
+        if not any(fnmatch(form, pattern) for form in forms for pattern in patterns):
+            filtered.append(record)
+    return filtered
+
+
+@pytest.mark.parametrize(
+    "patterns", [["*/__old/*"], ["*_F1*"], ["*/_F1a_*/*", "*.txt"], ["*"]]
+)
+def test_ignore(
+    folder_with_invalid_files, monkeypatch: pytest.MonkeyPatch, patterns: list[str]
+):
+    """Test that ignoring during the walk matches filtering the violations after."""
+    folder, _ = folder_with_invalid_files
+    expected = _filter(iter_violations(folder), folder, patterns)
+    assert list(iter_violations(folder, ignore=patterns)) == expected
+    monkeypatch.chdir(folder.parent)
+    folder = Path(folder.name)
+    expected = _filter(iter_violations(folder), folder, patterns)
+    assert list(iter_violations(folder, ignore=patterns)) == expected
+
+
+def test_ignore_forms(folder_with_invalid_files, monkeypatch: pytest.MonkeyPatch):
+    """Test that a pattern matches the path as walked or relative to the folder."""
+    folder, _ = folder_with_invalid_files
+    (next(folder.glob("_F1*")) / "invalid_file_name").write_text("")
+    expected = list(iter_violations(folder, ignore=["./_F1*"]))
+    assert expected != list(iter_violations(folder))
+    assert list(iter_violations(folder, ignore=[f"{folder.as_posix()}/_F1*"])) == (
+        expected
+    )
+    # the path as walked starts with the folder as provided
+    monkeypatch.chdir(folder.parent)
+    expected = [(elt.relative_to(folder.parent), *rest) for elt, *rest in expected]
+    for pattern in (f"{folder.name}/_F1*", "./_F1*"):
+        assert list(iter_violations(Path(folder.name), ignore=[pattern])) == expected
+    assert list(iter_violations(Path(folder.name), ignore=["_F1*"])) != expected
+
+
+def test_ignore_prune(folder: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that the ignored folders are not listed."""
+    folders = [elt for elt in folder.iterdir() if elt.is_dir()]
+    listed = []
+    scandir = os.scandir
+
+    def _scandir(path):
+        listed.append(Path(path))
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", _scandir)
+    validate_folder(folder, ignore=[f"*/{folders[0].name}/*"])
+    assert folder in listed
+    assert folders[0] not in listed
+    assert all(folders[0] not in elt.parents for elt in listed)
+    assert folders[1] in listed
+    listed.clear()
+    assert validate_folder(folder, ignore=["*"]) == {"primary": {}, "secondary": {}}
+    assert listed == []
+
+
+def test_exclude_walk(folder: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that the excluded folders are neither validated nor listed."""
+    folders = sorted(elt for elt in folder.iterdir() if elt.is_dir())
+    (folders[0] / "__OLD").mkdir()
+    (folders[0] / "__OLD" / "invalid").write_text("")
+    listed = []
+    scandir = os.scandir
+
+    def _scandir(path):
+        listed.append(Path(path))
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", _scandir)
+    violations = validate_folder(folder)
+    assert folders[0] / "__OLD" not in listed
+    assert validate_folder(folder, exclude=Exclude(inames=())) != violations
+    listed.clear()
+    violations = validate_folder(folder, exclude=Exclude(patterns=[folders[0].name]))
+    assert folders[0] not in listed
+    assert all(folders[0] not in elt.parents for elt in listed)
+    assert folders[0] not in violations["primary"]
+    assert folders[1] in listed
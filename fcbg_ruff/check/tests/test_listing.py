@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from fcbg_ruff.check import Exclude, iter_listing_violations, iter_violations
+
+
+def _find(folder: Path, fname: Path, fmt: str, folders: bool = True) -> None:
+    """Write a depth-first listing of a folder, as produced by find."""
+    with open(fname, "w", encoding="utf-8") as fid:
+        for root, _, filenames in os.walk(folder):
+            root = os.path.relpath(root, folder)
+            # find lists a folder before its content
+            if fmt == "find":
+                fid.write(f"d {'' if root == '.' else root}\n")
+            elif folders and root != ".":
+                fid.write(f"{root}{os.sep}\n")
+            for name in filenames:
+                path = os.path.normpath(os.path.join(root, name))
+                fid.write(f"f {path}\n" if fmt == "find" else f"{path}\n")
+
+
+@pytest.mark.parametrize("fmt", ["find", "paths"])
+def test_iter_listing_violations(
+    folder_with_invalid_files, tmp_path_factory, monkeypatch: pytest.MonkeyPatch, fmt
+):
+    """Test that a listing is validated like the folder it was produced from."""
+    folder, _ = folder_with_invalid_files
+    fname = tmp_path_factory.mktemp("listing") / "listing.txt"
+    for elt in folder.iterdir():
+        if not elt.is_dir():
+            continue
+        _find(elt, fname, fmt)
+        for kwargs in (
+            dict(),
+            dict(ignore=["*/F1*"]),
+            dict(exclude=Exclude(patterns=["_F*a_*"])),
+            dict(as_of="2000-01-01"),
+        ):
+            expected = sorted(iter_violations(elt, **kwargs))
+            assert sorted(iter_listing_violations(fname, elt, fmt=fmt, **kwargs)) == (
+                expected
+            )
+    # the root of the listing is the folder '.', which has an invalid name
+    _find(folder, fname, fmt)
+    monkeypatch.chdir(folder)
+    assert sorted(iter_listing_violations(fname, fmt=fmt)) == sorted(
+        iter_violations(".")
+    )
+    # the folders are implied by the paths of the files, e.g. find -type f
+    _find(folder, fname, "paths", folders=False)
+    assert sorted(iter_listing_violations(fname, fmt="paths")) == sorted(
+        iter_violations(".")
+    )
+
+
+def test_iter_listing_violations_stack(tmp_path: Path):
+    """Test the reconstruction of the tree from a listing ordered depth-first."""
+    fname = tmp_path / "listing.txt"
+    fname.write_text(
+        "d _F1a_b\n"
+        "f _F1a_b/F1a_220101_file_ABC.txt\n"
+        "d _F1a_b/_F1ab_c\n"
+        "f _F1a_b/_F1ab_c/F1a_220101_file_ABC.txt\n"  # code of the parent
+        "f _F1a_b/F1b_220101_file_ABC.txt\n"  # back to the parent, invalid code
+        "f _F1a_b/__OLD/invalid\n"
+        "f _F1b_d/_F1ba_e/invalid\n"  # implicit folders
+        "d _F1b_d\n",  # listed after its content
+        encoding="utf-8",
+    )
+    folder = Path("_F1_a")
+    violations = list(iter_listing_violations(fname, folder))
+    assert violations == [
+        (folder / "_F1a_b" / "_F1ab_c" / "F1a_220101_file_ABC.txt", "primary", [11]),
+        (folder / "_F1a_b" / "F1b_220101_file_ABC.txt", "primary", [11]),
+        (folder / "_F1b_d" / "_F1ba_e" / "invalid", "primary", [1]),
+    ]
+    # a folder whose content is not listed contiguously
+    with open(fname, "a", encoding="utf-8") as fid:
+        fid.write("f _F1a_b/F1a_220101_file_ABC.txt\n")
+    with pytest.raises(ValueError, match="listed in several places"):
+        list(iter_listing_violations(fname, folder))
+
+
+def test_iter_listing_violations_invalid(tmp_path: Path):
+    """Test the validation of the arguments and of the listing."""
+    fname = tmp_path / "listing.txt"
+    fname.write_text("_F1_a/F1_220101_file_ABC.txt\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="not formatted as"):
+        list(iter_listing_violations(fname))
+    with pytest.raises(ValueError, match="Invalid value for the 'fmt' parameter"):
+        list(iter_listing_violations(fname, fmt="robocopy"))
+    with pytest.raises(FileNotFoundError):
+        list(iter_listing_violations(tmp_path / "missing.txt"))
@@ -1,3 +1,5 @@
+import pytest
+
 from fcbg_ruff.check._parser import parse_file_stem, parse_folder_name
 
 
@@ -25,3 +27,11 @@ def test_parse_folder_name():
     code, name = parse_folder_name("_F1aabc_name_test")
     assert code == "F1aabc"
     assert name == "name_test"
+
+
+def test_parse_invalid():
+    """Test parsing of names which do not match the pattern."""
+    with pytest.raises(ValueError, match="does not match the expected pattern"):
+        parse_file_stem("F1_name_ABC")
+    with pytest.raises(ValueError, match="does not match the expected pattern"):
+        parse_folder_name("F1_name")
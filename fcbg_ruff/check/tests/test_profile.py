@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+import pickle
+from typing import TYPE_CHECKING
+
+import pytest
+
+from fcbg_ruff.check import Profile, iter_violations, validate_folder
+from fcbg_ruff.check._regex import (
+    _reference_date,
+    _validate_file_name,
+    _validate_folder_name,
+)
+from fcbg_ruff.check.config import ERRORS_CODES
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "F1a_220101_file_ABC.txt",
+        "F1_220101_file_ABC.txt",
+        "F1a_400101_file_ABC",
+        "F1a_220101_fi le_ABC.txt",
+        "invalid",
+    ],
+)
+def test_profile_rules_file(name: str):
+    """Test that the instrumented rules match the rules on a file name."""
+    profile = Profile()
+    today = _reference_date()
+    for parent_code in ("F1a", None):
+        assert profile._file_name(name, parent_code, today) == _validate_file_name(
+            name, parent_code, today
+        )
+    assert profile.counts["files"] == 2
+
+
+@pytest.mark.parametrize(
+    "name", ["_F1a_folder", "_F1ab_folder", "_F2a_folder", "_F1a_fol der", "invalid"]
+)
+def test_profile_rules_folder(name: str):
+    """Test that the instrumented rules match the rules on a folder name."""
+    profile = Profile()
+    for parent_code in ("F1a", None):
+        assert profile._folder_name(name, parent_code) == _validate_folder_name(
+            name, parent_code
+        )
+    assert profile.counts["folders"] == 2
+
+
+@pytest.mark.filterwarnings("ignore:The number of requested jobs.*:RuntimeWarning")
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_profile_error_codes(tmp_path: Path, n_jobs: int):
+    """Test that a profiled validation reports every error code as the rules."""
+    folder = tmp_path / "_F1_root"
+    for path in (
+        "F1_220101_file_ABC.txt",
+        "invalid.txt",  # 1
+        "F1_220101_fi le_ABC.txt",  # 3
+        "F2_220101_file_ABC.txt",  # 11
+        "F1_400101_file_ABC.txt",  # 21
+        "_F1a_fol der/F1a_220101_file_ABC.txt",  # 3
+        "_F2a_folder/F2a_220101_file_ABC.txt",  # 11
+        "invalid/F1_220101_file_ABC.txt",  # 2, 101
+        "invalid/_F1a_folder/F1a_220101_file_ABC.txt",  # 101
+    ):
+        (folder / path).parent.mkdir(parents=True, exist_ok=True)
+        (folder / path).write_text("101")
+    violations, profile = validate_folder(folder, n_jobs=n_jobs, profile=True)
+    assert violations == validate_folder(folder, n_jobs=n_jobs)
+    codes = {
+        code
+        for severity in violations.values()
+        for elt in severity.values()
+        for code in elt
+    }
+    assert codes == set(ERRORS_CODES)
+    assert profile.counts["files"] == 9
+
+
+@pytest.mark.filterwarnings("ignore:The number of requested jobs.*:RuntimeWarning")
+@pytest.mark.parametrize(
+    ("n_jobs", "executor"), [(1, "processes"), (2, "processes"), (2, "threads")]
+)
+def test_profile(folder_with_invalid_files, n_jobs: int, executor: str):
+    """Test the profile of a validation."""
+    folder, _ = folder_with_invalid_files
+    expected = validate_folder(folder)
+    violations, profile = validate_folder(
+        folder, n_jobs, executor=executor, profile=True
+    )
+    assert violations == expected
+    assert isinstance(profile, Profile)
+    # every folder walked is listed once, '__Old' excluded
+    n_folders = sum(
+        1 for elt in folder.rglob("*") if elt.is_dir() and "__Old" not in elt.parts
+    )
+    assert profile.counts["listings"] == n_folders + 1
+    assert profile.counts["folders"] == n_folders
+    assert profile.counts["stats"] == 0
+    assert 0 < profile.seconds["total"]
+    assert 0 < profile.seconds["file_pattern"]
+    assert sum(folders for _, folders, _ in profile._workers.values()) == n_folders + 1
+
+
+def test_profile_cache(folder: Path, tmp_path: Path):
+    """Test the profile of a validation with cached results."""
+    cache_dir = tmp_path / "cache"
+    _, profile = validate_folder(folder, cache_dir=cache_dir, profile=True)
+    assert profile.counts["stats"] == profile.counts["listings"]
+    assert profile.counts["cache_hits"] == 0
+    _, profile_ = validate_folder(folder, cache_dir=cache_dir, profile=True)
+    assert profile_.counts["stats"] == profile.counts["stats"]
+    # the folders modified too recently to be cached safely are listed again
+    assert 0 < profile_.counts["cache_hits"]
+    counts = profile_.counts
+    assert counts["cache_hits"] + counts["listings"] == counts["stats"]
+
+
+def test_profile_export(folder: Path, tmp_path: Path):
+    """Test the export of a profile."""
+    profile = Profile()
+    list(iter_violations(folder, profile=profile))
+    summary = profile.summary()
+    for phase in ("list", "file_pattern", "date", "total", "MainThread"):
+        assert phase in summary
+    profile.save(tmp_path / "profile.json")
+    with open(tmp_path / "profile.json") as fid:
+        assert json.load(fid) == profile.to_dict()
+    profile_ = pickle.loads(pickle.dumps(profile))
+    assert profile_.to_dict() == profile.to_dict()
+    with pytest.raises(TypeError, match="must be an instance of"):
+        validate_folder(folder, profile="yes")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from datetime import date, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -9,6 +10,7 @@ import pytest
 from fcbg_ruff.check._regex import (
     PATTERN_FILE_STEM,
     PATTERN_FOLDER_NAME,
+    _parse_date,
     validate_file_name,
     validate_folder_name,
 )
@@ -144,6 +146,41 @@ def test_validate_file_name(tmp_path: Path, valid_fnames: list[Path]):
     assert errors["secondary"] == [101]
 
 
+@pytest.mark.parametrize(
+    "as_of", [date(2022, 1, 1), datetime(2022, 1, 1, 23, 59), "2022-01-01"]
+)
+def test_validate_file_name_as_of(as_of: date | datetime | str):
+    """Test the validation of the date against a reference date."""
+    fname = "_F1a_test/F1a_220101_test_ABC.txt"
+    assert validate_file_name(fname, as_of=as_of)["primary"] == []
+    assert validate_file_name(fname.replace("220101", "220102"), as_of=as_of)[
+        "primary"
+    ] == [21]
+    assert (
+        validate_file_name(fname.replace("220101", "691231"), as_of=as_of)["primary"]
+        == []
+    )
+
+
+def test_validate_file_name_invalid_date():
+    """Test the validation of dates which can not be parsed."""
+    with pytest.raises(ValueError, match="must be formatted as 'YYYY-MM-DD'"):
+        validate_file_name("F1a_220101_test_ABC.txt", as_of="01/01/2022")
+    with pytest.raises(TypeError, match="'as_of' must be an instance of"):
+        validate_file_name("F1a_220101_test_ABC.txt", as_of=20220101)
+    with pytest.warns(RuntimeWarning, match="could not be parsed"):
+        errors = validate_file_name("_F1a_test/F1a_220230_test_ABC.txt")
+    assert errors["primary"] == []
+    # the parsing follows datetime.strptime, including the pivot of 2-digit years
+    for date_ in ("000229", "240229", "680101", "690101", "991231", "220230"):
+        try:
+            expected = datetime.strptime(date_, "%y%m%d")
+        except ValueError:
+            assert _parse_date(date_) is None
+            continue
+        assert _parse_date(date_) == int(expected.strftime("%Y%m%d"))
+
+
 def test_validate_folder_name(tmp_path: Path, valid_folders: list[Path]):
     """Test folder name validation."""
     for folder in valid_folders:
@@ -181,3 +218,26 @@ def test_validate_folder_name(tmp_path: Path, valid_folders: list[Path]):
     errors = validate_folder_name(folder)
     assert len(errors["primary"]) == 0
     assert len(errors["secondary"]) == 0
+
+
+def test_validate_name_without_file_system(monkeypatch: pytest.MonkeyPatch):
+    """Test that the validation does not access the file system."""
+
+    def _raise(*args, **kwargs):
+        raise AssertionError("Unexpected file system access.")
+
+    monkeypatch.setattr(Path, "stat", _raise)
+    monkeypatch.setattr(Path, "is_file", _raise)
+    monkeypatch.setattr(Path, "is_dir", _raise)
+    for fname in (
+        "_F1a_test/F1a_101010_test_ABC.txt",
+        Path("_F1a_test/F1a_101010_test_ABC.txt"),
+    ):
+        errors = validate_file_name(fname)
+        assert len(errors["primary"]) == 0
+        assert len(errors["secondary"]) == 0
+    assert validate_file_name("_F1a_test/F2a_101010_test_ABC.txt")["primary"] == [11]
+    assert validate_file_name("F1a_101010_test_ABC.txt")["secondary"] == [101]
+    assert validate_folder_name("/mnt/share/_F1_test/_F1a_test/")["primary"] == []
+    assert validate_folder_name("_F1_test/_F2a_test")["primary"] == [11]
+    assert validate_folder_name("_test/_F5_test test")["primary"] == [3]
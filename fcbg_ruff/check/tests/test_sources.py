@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from fcbg_ruff.check import (
+    DictSource,
+    FileSystemSource,
+    PathsSource,
+    iter_violations,
+    validate_folder,
+)
+
+
+def _to_dict(folder: Path) -> dict[str, dict | None]:
+    """Load a tree from the file system in nested dictionaries."""
+    return {
+        entry.name: _to_dict(Path(entry.path)) if entry.is_dir() else None
+        for entry in os.scandir(folder)
+    }
+
+
+def _to_paths(folder: Path) -> list[str]:
+    """List the relative paths of the files and folders of a tree."""
+    paths = []
+    for root, folders, files in os.walk(folder):
+        root = os.path.relpath(root, folder)
+        paths.extend(os.path.join(root, name, "") for name in folders)
+        paths.extend(os.path.join(root, name) for name in files)
+    return paths
+
+
+def test_sources(folder_with_invalid_files, monkeypatch: pytest.MonkeyPatch):
+    """Test that the rules are the same for every source."""
+    folder, _ = folder_with_invalid_files
+    monkeypatch.chdir(folder)
+    sources = [FileSystemSource(), DictSource(_to_dict(folder))]
+    sources.append(PathsSource(_to_paths(folder)))
+    for elt in folder.iterdir():
+        if not elt.is_dir():
+            continue
+        expected = list(iter_violations(elt.name))
+        for source in sources:
+            assert list(iter_violations(elt.name, source=source)) == expected
+        assert validate_folder(Path(elt.name), source=sources[1]) == validate_folder(
+            elt.name
+        )
+    assert validate_folder(".", source=sources[1]) == validate_folder(".")
+
+
+def test_paths_source():
+    """Test the prefix tree built from a listing."""
+    source = PathsSource(
+        [
+            "_F1_a/F1_220101_file_ABC.txt",
+            "_F1_a/_F1a_b/",
+            "./_F1_a/_F1b_c/F1b_220101_file_ABC.txt",
+            "_F1_a/__old/invalid",
+            "_F2_d",
+            "_F2_d/_F2a_e",
+        ]
+    )
+    assert source.is_dir(Path("_F1_a/_F1a_b"))
+    assert source.is_dir(Path("_F2_d"))  # parent of another path
+    assert not source.is_dir(Path("_F1_a/F1_220101_file_ABC.txt"))
+    assert not source.is_dir(Path("_F3_f"))
+    assert validate_folder("_F1_a", source=source) == {"primary": {}, "secondary": {}}
+    violations = validate_folder("_F2_d", source=source)
+    assert violations["primary"] == {Path("_F2_d/_F2a_e"): [1]}
+
+
+def test_invalid_source(tmp_path: Path):
+    """Test the validation of the source arguments."""
+    source = DictSource({"_F1_a": {}})
+    with pytest.raises(FileNotFoundError, match="does not exist"):
+        validate_folder("_F2_a", source=source)
+    with pytest.raises(ValueError, match="only be cached"):
+        validate_folder("_F1_a", source=source, cache_dir=tmp_path)
+    with pytest.raises(TypeError, match="must be an instance of"):
+        validate_folder("_F1_a", source={"_F1_a": {}})
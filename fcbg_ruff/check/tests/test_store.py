@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING
+
+import pytest
+
+from fcbg_ruff.check import ViolationStore, iter_violations, validate_folder
+from fcbg_ruff.check.config import ERRORS_BITS
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_store(folder_with_invalid_files: tuple[Path, list[Path]]):
+    """Test the compact container of violations."""
+    folder, invalid_files = folder_with_invalid_files
+    violations = validate_folder(folder)
+    store = validate_folder(folder, compact=True)
+    assert isinstance(store, ViolationStore)
+    assert store.to_dict() == violations
+    assert list(store) == list(iter_violations(folder))
+    assert len(store) == len(violations["primary"].keys() | violations["secondary"])
+    assert list(store.paths()) == [store.path(k) for k in range(len(store))]
+    assert store.path(-1) == store.path(len(store) - 1)
+    with pytest.raises(IndexError, match="out of range"):
+        store.path(len(store))
+    # counts and filters
+    counts = store.counts()
+    assert counts.keys() == ERRORS_BITS.keys()
+    for code, count in counts.items():
+        selected = store.filter(code)
+        assert len(selected) == count
+        assert (selected.masks & ERRORS_BITS[code] != 0).all()
+    assert invalid_files[0] in list(store.filter(1).paths())
+    assert (
+        store.filter(severity="primary").to_dict()["primary"] == violations["primary"]
+    )
+    secondary = store.filter(severity="secondary").to_dict()["secondary"]
+    assert secondary == violations["secondary"]
+    with pytest.raises(ValueError, match="Invalid value for the 'code'"):
+        store.filter(4)
+    # pickling
+    assert list(pickle.loads(pickle.dumps(store))) == list(store)
+    assert (pickle.loads(pickle.dumps(store)).masks == store.masks).all()
+
+
+def test_store_merge(tmp_path: Path):
+    """Test that the records of a path are merged in a single violation."""
+    store = ViolationStore()
+    store.add(tmp_path / "a", "primary", [11])
+    store.add(tmp_path / "a", "secondary", [101])
+    store.add(tmp_path / "b", "primary", [1])
+    assert len(store) == 2
+    assert store.masks.tolist() == [ERRORS_BITS[11] | ERRORS_BITS[101], ERRORS_BITS[1]]
+    assert list(store) == [
+        (tmp_path / "a", "primary", [11]),
+        (tmp_path / "a", "secondary", [101]),
+        (tmp_path / "b", "primary", [1]),
+    ]
+    assert "2 violation(s) in 1 folder(s)" in repr(store)
+
+
+def test_store_prefix_tree(tmp_path: Path):
+    """Test that each folder name is stored once in the prefix tree."""
+    store = ViolationStore()
+    paths = [
+        tmp_path / "a" / "b" / "c" / "file1",
+        tmp_path / "a" / "b" / "c" / "file2",
+        tmp_path / "a" / "b" / "d" / "file3",
+        tmp_path / "a" / "file4",
+    ]
+    for path in paths:
+        store.add(path, "primary", [1])
+    names = store._folders._names
+    assert len(names) == len(tmp_path.parts) + 4
+    assert sorted(names[-4:]) == ["a", "b", "c", "d"]
+    assert list(store.paths()) == paths
+    assert list(pickle.loads(pickle.dumps(store)).paths()) == paths
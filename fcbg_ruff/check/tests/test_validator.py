@@ -1,48 +1,27 @@
 from __future__ import annotations
 
 import multiprocessing as mp
-import random
+import threading
+import time
+from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 
-from fcbg_ruff.check.validator import _ensure_n_jobs, validate_folder
-from fcbg_ruff.utils._path import walk_files
+from fcbg_ruff.check import DictSource, _regex, validator
+from fcbg_ruff.check._filters import _DEFAULT_FILTERS
+from fcbg_ruff.check.validator import (
+    Validator,
+    _ensure_n_jobs,
+    iter_violations,
+    validate_folder,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
 
 
-@pytest.fixture(scope="function")
-def folder_with_invalid_files(folder: Path) -> tuple[Path, list[Path]]:
-    """Create a mock documentary structure with invalid file names."""
-    files = [elt for elt in walk_files(folder) if elt.parent.name.lower() != "__old"]
-    invalid_files = random.sample(files, 4)
-    # add a purely invalid fname
-    invalid_files[0].rename(invalid_files[0].parent / "invalid_file_name")
-    invalid_files[0] = invalid_files[0].parent / "invalid_file_name"
-    # add a fname with code not matching parent folder
-    fname = invalid_files[1].name.split("_")
-    fname[0] += "a"
-    fname = "_".join(fname)
-    invalid_files[1].rename(invalid_files[1].parent / fname)
-    invalid_files[1] = invalid_files[1].parent / fname
-    # add a fname with invalid characters in the name
-    fname = invalid_files[2].name.split("_")
-    fname[2] += " a"
-    fname = "_".join(fname)
-    invalid_files[2].rename(invalid_files[2].parent / fname)
-    invalid_files[2] = invalid_files[2].parent / fname
-    # add a fname with a date in the past
-    fname = invalid_files[3].name.split("_")
-    fname[1] = f"40{fname[1][2:]}"
-    fname = "_".join(fname)
-    invalid_files[3].rename(invalid_files[3].parent / fname)
-    invalid_files[3] = invalid_files[3].parent / fname
-    return folder, invalid_files
-
-
 @pytest.mark.filterwarnings("ignore:The number of requested jobs.*:RuntimeWarning")
 @pytest.mark.parametrize("n_jobs", [1, 2])
 def test_validate_folder(folder: Path, n_jobs: int):
@@ -74,11 +53,191 @@ def test_validate_invalid_folder(folder_with_invalid_files: Path, n_jobs: int):
     assert violations["primary"][invalid_files[3]] == [21]
 
 
+@pytest.mark.filterwarnings("ignore:The number of requested jobs.*:RuntimeWarning")
+def test_validate_folder_scheduler(
+    folder_with_invalid_files: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that folders are redistributed between workers."""
+    folder, _ = folder_with_invalid_files
+    violations = validate_folder(folder, n_jobs=1)
+    monkeypatch.setattr(validator, "_TASK_MAX_FOLDERS", 1)
+    assert validate_folder(folder, n_jobs=2) == violations
+
+
+def test_schedule_idle_workers(folder: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that every worker gets work from the start of the walk."""
+    walk_task = validator._walk_task
+    lock = threading.Lock()
+    budgets = []
+    running = [0, 0]  # current and maximum number of tasks running concurrently
+
+    def _walk_task(folders, max_folders, *args):
+        with lock:
+            budgets.append(max_folders)
+            running[0] += 1
+            running[1] = max(running)
+        time.sleep(0.02)  # slow listing, e.g. a network share
+        try:
+            return walk_task(folders, max_folders, *args)
+        finally:
+            with lock:
+                running[0] -= 1
+
+    monkeypatch.setattr(validator, "_walk_task", _walk_task)
+    with ThreadPool(4) as pool:
+        records = list(
+            validator._schedule(
+                pool, 4, 8, 64, folder, None, None, None, _DEFAULT_FILTERS, 20220101
+            )
+        )
+    assert sorted(records) == sorted(
+        elt for elt in iter_violations(folder, as_of="2022-01-01") if elt[0] != folder
+    )
+    # the root alone does not feed the idle workers, its listing is handed back
+    assert budgets[0] == 1
+    assert 64 in budgets
+    assert running[1] == 4
+
+
+@pytest.mark.filterwarnings("ignore:The number of requested jobs.*:RuntimeWarning")
+@pytest.mark.parametrize("start_method", [None, "spawn"])
+def test_validator(folder_with_invalid_files: Path, start_method: str | None):
+    """Test the persistent pool of workers."""
+    folder, _ = folder_with_invalid_files
+    folders = [elt for elt in folder.iterdir() if elt.is_dir()]
+    with Validator(n_jobs=2, start_method=start_method, chunksize=2) as validator:
+        for elt in folders:
+            assert validator.validate_folder(elt) == validate_folder(elt)
+    with pytest.raises(RuntimeError, match="closed"):
+        validator.validate_folder(folders[0])
+    with Validator(n_jobs=1) as validator:
+        assert validator.n_jobs == 1
+        assert validator.validate_folder(folder) == validate_folder(folder)
+    with pytest.raises(ValueError, match="Invalid value for the 'start_method'"):
+        Validator(n_jobs=2, start_method="101")
+    with pytest.raises(ValueError, match="chunk size must be an integer"):
+        Validator(n_jobs=2, chunksize=0)
+
+
+def test_validator_lazy_pool(folder: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that the pool is started by the first validation which needs it."""
+    source = DictSource({folder.name: {"_F1_a": {"F1_220101_file_ABC.txt": None}}})
+    with Validator(n_jobs=2, executor="threads") as validator:
+        assert validator._pool is None
+        validator.validate_folder(folder.name, source=source)
+        assert validator._pool is None
+        assert validator.validate_folder(folder) == validate_folder(folder)
+        pool = validator._pool
+        assert pool is not None
+        validator.validate_folder(folder)
+        assert validator._pool is pool
+    assert validator._pool is None
+    # the number of jobs is reduced to the number of CPUs
+    monkeypatch.setattr(mp, "cpu_count", lambda: 1)
+    with pytest.warns(RuntimeWarning, match="reduced to 1"):
+        validator = Validator(n_jobs=2)
+    with validator:
+        assert validator.n_jobs == 1
+        assert validator.validate_folder(folder) == validate_folder(folder)
+        assert validator._pool is None
+
+
+@pytest.mark.parametrize("n_jobs", [2, 64])
+def test_validate_folder_threads(folder_with_invalid_files: Path, n_jobs: int):
+    """Test validation with a pool of threads."""
+    folder, _ = folder_with_invalid_files
+    violations = validate_folder(folder, n_jobs=n_jobs, executor="threads")
+    assert violations == validate_folder(folder, n_jobs=1)
+    with Validator(n_jobs=n_jobs, executor="threads") as validator:
+        assert validator.n_jobs == n_jobs
+        assert validator.executor == "threads"
+        assert validator.validate_folder(folder) == violations
+    with pytest.raises(ValueError, match="Invalid value for the 'executor'"):
+        validate_folder(folder, n_jobs=2, executor="101")
+
+
+def test_validate_folder_threads_not_compacted(
+    folder_with_invalid_files: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that the records of the threads are not compacted in a ViolationStore."""
+    folder, _ = folder_with_invalid_files
+
+    def _raise(*args, **kwargs):
+        raise AssertionError("Unexpected compaction of the records of a thread.")
+
+    monkeypatch.setattr(validator, "ViolationStore", _raise)
+    violations = validate_folder(folder, n_jobs=2, executor="threads")
+    monkeypatch.undo()
+    assert violations == validate_folder(folder, n_jobs=1)
+
+
+def test_validate_folder_no_stat(folder: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that the traversal relies on the cached type of the directory entries."""
+    violations = validate_folder(folder)
+
+    def _raise(*args, **kwargs):
+        raise AssertionError("Unexpected stat call.")
+
+    monkeypatch.setattr(Path, "is_file", _raise)
+    monkeypatch.setattr(Path, "is_dir", _raise)
+    assert validate_folder(folder) == violations
+
+
+def test_validate_folder_match_once(folder: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that each folder name is matched once, its code being propagated."""
+    violations = validate_folder(folder)
+    names = []
+
+    class _Pattern:
+        def fullmatch(self, name):
+            names.append(name)
+            return pattern.fullmatch(name)
+
+    pattern = _regex.PATTERN_FOLDER_NAME
+    monkeypatch.setattr(_regex, "PATTERN_FOLDER_NAME", _Pattern())
+    assert validate_folder(folder) == violations
+    # the names of the parent of the root, of the root and of every folder walked
+    folders = [
+        elt
+        for elt in folder.rglob("*")
+        if elt.is_dir() and "__old" not in elt.relative_to(folder).as_posix().lower()
+    ]
+    assert len(names) == len(folders) + 2
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_validate_folder_warnings(tmp_path: Path, n_jobs: int):
+    """Test that the warnings of the rules are summarized once per validation."""
+    folder = tmp_path / "_F1_test"
+    for code in ("F1a", "F1b"):
+        (folder / f"_{code}_test").mkdir(parents=True)
+        for date in ("220230", "221301", "221332"):
+            (folder / f"_{code}_test" / f"{code}_{date}_test_ABC.txt").touch()
+    with pytest.warns(RuntimeWarning) as record:
+        violations = validate_folder(folder, n_jobs=n_jobs, executor="threads")
+    assert len(record) == 1
+    assert "6 warnings were emitted" in str(record[0].message)
+    assert "(5 similar warning(s))" in str(record[0].message)
+    assert violations == {"primary": dict(), "secondary": dict()}
+
+
 def test_ensure_n_jobs():
     """Test validation of number of jobs."""
     with pytest.raises(ValueError, match="an integer greater or equal to 1"):
-        _ensure_n_jobs(-1, 101)
-    with pytest.warns(RuntimeWarning, match="greater than the number of subfolders"):
-        assert _ensure_n_jobs(101, 1) == 1
+        _ensure_n_jobs(-1)
     with pytest.warns(RuntimeWarning, match="greater than the number of available"):
-        assert _ensure_n_jobs(101, 10101) == mp.cpu_count()
+        assert _ensure_n_jobs(mp.cpu_count() + 1) == mp.cpu_count()
+    assert _ensure_n_jobs(mp.cpu_count() + 1, "threads") == mp.cpu_count() + 1
+
+
+def test_iter_violations(folder_with_invalid_files: Path):
+    """Test iteration over the violations."""
+    folder, invalid_files = folder_with_invalid_files
+    records = list(iter_violations(folder))
+    assert len(records) == len({(path, severity) for path, severity, _ in records})
+    for path, severity, codes in records:
+        assert validate_folder(folder)[severity][path] == codes
+    assert (invalid_files[0], "primary", [1]) in records
+    # stop the iteration early
+    for _ in iter_violations(folder, n_jobs=2, executor="threads"):
+        break
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import shutil
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from fcbg_ruff.check import Watcher, validate_folder
+from fcbg_ruff.check.validator import _collect
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(
+    params=[
+        "polling",
+        pytest.param(
+            "inotify",
+            marks=pytest.mark.skipif(
+                not sys.platform.startswith("linux"), reason="Linux only"
+            ),
+        ),
+    ]
+)
+def backend(request) -> str:
+    """Backend of the watcher."""
+    return request.param
+
+
+def test_watcher(folder: Path, backend: str):
+    """Test that the violations are kept up to date."""
+    subfolder = next(elt for elt in folder.iterdir() if elt.is_dir())
+    with Watcher(folder, backend=backend) as watcher:
+        assert watcher.backend == backend
+        assert _collect(watcher.iter_violations()) == validate_folder(folder)
+        # add an invalid file
+        (subfolder / "invalid_file_name.txt").write_text("101")
+        events = watcher.update(timeout=0)
+        assert events == [
+            ("added", subfolder / "invalid_file_name.txt", "primary", [1])
+        ]
+        # rename a folder, which invalidates its content
+        renamed = subfolder.rename(folder / "_F9_renamed")
+        events = watcher.update(timeout=0)
+        assert (
+            "removed",
+            subfolder / "invalid_file_name.txt",
+            "primary",
+            [1],
+        ) in events
+        assert ("added", renamed / "invalid_file_name.txt", "primary", [1]) in events
+        assert any(
+            event == "added" and code == [11] and path.parent == renamed
+            for event, path, _, code in events
+        )
+        assert _collect(watcher.iter_violations()) == validate_folder(folder)
+        # remove a file and add a new folder in the renamed folder
+        (renamed / "invalid_file_name.txt").unlink()
+        (renamed / "new folder").mkdir()
+        (renamed / "new folder" / "F9_101010_test_ABC.txt").write_text("101")
+        events = watcher.update(timeout=0)
+        assert ("removed", renamed / "invalid_file_name.txt", "primary", [1]) in events
+        assert ("added", renamed / "new folder", "primary", [2]) in events
+        assert _collect(watcher.iter_violations()) == validate_folder(folder)
+        assert watcher.update(timeout=0) == []
+
+
+def test_watcher_ignore(folder: Path, backend: str):
+    """Test that the ignored violations are neither yielded nor reported."""
+    subfolder = next(elt for elt in folder.iterdir() if elt.is_dir())
+    (subfolder / "invalid_file_name.txt").write_text("101")
+    ignore = [".", "*/invalid_*", f"./{subfolder.name}/_*/*"]
+    with Watcher(folder, backend=backend, ignore=ignore) as watcher:
+        assert _collect(watcher.iter_violations()) == validate_folder(
+            folder, ignore=ignore
+        )
+        (subfolder / "invalid_file_name_2.txt").write_text("101")
+        (folder / "invalid name").write_text("101")
+        events = watcher.update(timeout=0)
+        assert events == [("added", folder / "invalid name", "primary", [1])]
+        assert _collect(watcher.iter_violations()) == validate_folder(
+            folder, ignore=ignore
+        )
+
+
+def test_watcher_replaced_folder(folder: Path, backend: str):
+    """Test a folder deleted and created again with the same name between updates."""
+    subfolder = next(elt for elt in folder.iterdir() if elt.is_dir())
+    (subfolder / "invalid_file_name.txt").write_text("101")
+    with Watcher(folder, backend=backend) as watcher:
+        shutil.rmtree(subfolder)
+        subfolder.mkdir()
+        (subfolder / "invalid_name.txt").write_text("101")
+        events = watcher.update(timeout=0)
+        assert (
+            "removed",
+            subfolder / "invalid_file_name.txt",
+            "primary",
+            [1],
+        ) in events
+        assert ("added", subfolder / "invalid_name.txt", "primary", [1]) in events
+        assert _collect(watcher.iter_violations()) == validate_folder(folder)
+        # the new folder is watched
+        (subfolder / "invalid_name_2.txt").write_text("101")
+        events = watcher.update(timeout=0)
+        assert events == [("added", subfolder / "invalid_name_2.txt", "primary", [1])]
+        assert _collect(watcher.iter_violations()) == validate_folder(folder)
+
+
+def test_watcher_invalid_backend(folder: Path):
+    """Test watcher with an invalid backend."""
+    with pytest.raises(ValueError, match="Invalid value for the 'backend'"):
+        Watcher(folder, backend="101")
@@ -1,101 +1,844 @@
 from __future__ import annotations
 
 import multiprocessing as mp
+import os
+from collections import deque
+from contextlib import nullcontext
+from multiprocessing.pool import ThreadPool
+from queue import SimpleQueue
+from time import perf_counter_ns
 from typing import TYPE_CHECKING
 
-from ..utils._checks import ensure_int, ensure_path
+from ..utils._checks import check_type, check_value, ensure_int, ensure_path
 from ..utils._docs import fill_doc
-from ..utils.logs import warn
-from ._regex import validate_file_name, validate_folder_name
+from ..utils.logs import _WarningCollector, warn
+from ._cache import (
+    _cache_fname,
+    _CacheReader,
+    _CacheWriter,
+    _decode,
+    _encode,
+    _settings,
+)
+from ._filters import _DEFAULT_FILTERS, Exclude, _Filters
+from ._profile import Profile
+from ._regex import (
+    _folder_code,
+    _reference_date,
+    _validate_file_name,
+    _validate_folder_name,
+)
+from ._sources import FileSystemSource, TreeSource
+from ._store import ViolationStore
 
 if TYPE_CHECKING:
+    from collections.abc import Generator, Sequence
+    from datetime import date
     from pathlib import Path
+    from typing import Any
+
+
+# maximum number of folders listed by a worker before the folders left on its stack
+# are handed back to the scheduler and redistributed between idle workers.
+_TASK_MAX_FOLDERS: int = 64
+_EXECUTORS: tuple[str, ...] = ("processes", "threads")
 
 
 @fill_doc
 def validate_folder(
-    folder: Path | str, n_jobs: int = 1
-) -> dict[str, dict[Path, list[int]]]:
+    folder: Path | str,
+    n_jobs: int = 1,
+    *,
+    executor: str = "processes",
+    cache_dir: Path | str | None = None,
+    ignore: Sequence[str] | None = None,
+    exclude: Exclude | None = None,
+    source: TreeSource | None = None,
+    as_of: date | str | None = None,
+    compact: bool = False,
+    profile: bool = False,
+) -> (
+    dict[str, dict[Path, list[int]]]
+    | ViolationStore
+    | tuple[dict[str, dict[Path, list[int]]] | ViolationStore, Profile]
+):
     """Validate a folder from the documentary system and its content recursively.
 
     Parameters
     ----------
     folder : Path | str
         Path to the folder to validate.
-    n_jobs : int
-        Number of concurrent workers used for validation. The subfolders are split
-        between workers, thus the most workers you can have is defined by the number of
-        subfolders in 'folder'.
+    %(n_jobs)s
+    %(executor)s
+    %(cache_dir)s
+    %(ignore)s
+    %(exclude)s
+    %(source)s
+    %(as_of)s
+    %(compact)s
+    profile : bool
+        If True, the phases of the validation are timed and counted in a
+        :class:`~fcbg_ruff.check.Profile`, returned along the violations.
 
     Returns
     -------
     %(violations)s
+    profile : Profile
+        Counters and timers of the validation. Only returned if ``profile=True``.
+
+    See Also
+    --------
+    iter_violations
+    """
+    check_type(compact, (bool,), "compact")
+    check_type(profile, (bool,), "profile")
+    profile = Profile() if profile else None
+    records = iter_violations(
+        folder,
+        n_jobs,
+        executor=executor,
+        cache_dir=cache_dir,
+        ignore=ignore,
+        exclude=exclude,
+        source=source,
+        as_of=as_of,
+        profile=profile,
+    )
+    violations = ViolationStore(records) if compact else _collect(records)
+    return violations if profile is None else (violations, profile)
+
+
+@fill_doc
+def iter_violations(
+    folder: Path | str,
+    n_jobs: int = 1,
+    *,
+    executor: str = "processes",
+    cache_dir: Path | str | None = None,
+    ignore: Sequence[str] | None = None,
+    exclude: Exclude | None = None,
+    source: TreeSource | None = None,
+    as_of: date | str | None = None,
+    profile: Profile | None = None,
+) -> Generator[tuple[Path, str, list[int]], None, None]:
+    """Iterate over the violations in a folder from the documentary system.
+
+    The violations are yielded as the tree is walked, thus the memory usage does not
+    depend on the size of the tree or on the number of violations.
+
+    Parameters
+    ----------
+    folder : Path | str
+        Path to the folder to validate.
+    %(n_jobs)s
+    %(executor)s
+    %(cache_dir)s
+    %(ignore)s
+    %(exclude)s
+    %(source)s
+    %(as_of)s
+    %(profile)s
+
+    Yields
+    ------
+    %(violation_record)s
+    """
+    with Validator(n_jobs, executor=executor) as validator:
+        yield from validator.iter_violations(
+            folder,
+            cache_dir=cache_dir,
+            ignore=ignore,
+            exclude=exclude,
+            source=source,
+            as_of=as_of,
+            profile=profile,
+        )
+
+
+@fill_doc
+class Validator:
+    """Pool of persistent workers validating folders from the documentary system.
+
+    The workers are started by the first call to :meth:`~Validator.validate_folder`
+    or :meth:`~Validator.iter_violations` which needs them, and reused by the next
+    calls, which avoids paying for the start of a new process and for the import of
+    the package on every call. A validation of a ``source`` does not start them. The pool should be
+    closed after use, either with :meth:`~Validator.close` or by using the validator
+    as a context manager.
+
+    Parameters
+    ----------
+    n_jobs : int
+        Number of workers in the pool. If 1, including after the reduction to the
+        number of available CPUs, the validation runs in the calling process and no
+        pool is created.
+    %(executor)s
+    start_method : str | None
+        Method used to start the worker processes, e.g. ``"fork"``, ``"forkserver"``
+        or ``"spawn"``. If None, the default start method of the platform is used.
+        Only used with the ``"processes"`` executor.
+    chunksize : int
+        Maximum number of folders sent to a worker process in a single task. With the
+        ``"threads"`` executor, each task lists a single folder.
+
+    Examples
+    --------
+    >>> with Validator(n_jobs=4, start_method="forkserver") as validator:
+    ...     for folder in folders:
+    ...         violations = validator.validate_folder(folder)
     """
-    folder = ensure_path(folder, must_exist=True)
-    n_jobs = ensure_int(n_jobs)
+
+    def __init__(
+        self,
+        n_jobs: int = 1,
+        *,
+        executor: str = "processes",
+        start_method: str | None = None,
+        chunksize: int = 8,
+    ) -> None:
+        n_jobs = ensure_int(n_jobs, "n_jobs")
+        check_value(executor, _EXECUTORS, "executor")
+        self._executor = executor
+        self._n_jobs = _ensure_n_jobs(n_jobs, executor)
+        if start_method is not None:
+            check_value(start_method, mp.get_all_start_methods(), "start_method")
+        self._start_method = start_method
+        self._chunksize = ensure_int(chunksize, "chunksize")
+        if self._chunksize < 1:
+            raise ValueError("The chunk size must be an integer greater or equal to 1.")
+        self._closed = False
+        self._pool = None  # started on first use, see _get_pool
+
+    def __enter__(self) -> Validator:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type: Any, *args) -> None:
+        """Exit the context manager and close the pool."""
+        if exc_type is not None and self._pool is not None:
+            self._pool.terminate()
+        self.close()
+
+    def close(self) -> None:
+        """Close the pool of workers and wait for them to exit."""
+        self._closed = True
+        if self._pool is None:
+            return
+        self._pool.close()
+        self._pool.join()
+        self._pool = None
+
+    def _get_pool(self) -> mp.pool.Pool | ThreadPool | None:
+        """Pool of workers, started on first use, or None with a single job."""
+        if self._pool is None and self._n_jobs != 1:
+            if self._executor == "threads":
+                self._pool = ThreadPool(processes=self._n_jobs)
+            else:
+                context = mp.get_context(self._start_method)
+                self._pool = context.Pool(processes=self._n_jobs)
+        return self._pool
+
+    @fill_doc
+    def validate_folder(
+        self,
+        folder: Path | str,
+        *,
+        cache_dir: Path | str | None = None,
+        ignore: Sequence[str] | None = None,
+        exclude: Exclude | None = None,
+        source: TreeSource | None = None,
+        as_of: date | str | None = None,
+        compact: bool = False,
+        profile: bool = False,
+    ) -> (
+        dict[str, dict[Path, list[int]]]
+        | ViolationStore
+        | tuple[dict[str, dict[Path, list[int]]] | ViolationStore, Profile]
+    ):
+        """Validate a folder from the documentary system and its content recursively.
+
+        Parameters
+        ----------
+        folder : Path | str
+            Path to the folder to validate.
+        %(cache_dir)s
+        %(ignore)s
+        %(exclude)s
+        %(source)s
+        %(as_of)s
+        %(compact)s
+        profile : bool
+            If True, the phases of the validation are timed and counted in a
+            :class:`~fcbg_ruff.check.Profile`, returned along the violations.
+
+        Returns
+        -------
+        %(violations)s
+        profile : Profile
+            Counters and timers of the validation. Only returned if
+            ``profile=True``.
+        """
+        check_type(compact, (bool,), "compact")
+        check_type(profile, (bool,), "profile")
+        profile = Profile() if profile else None
+        records = self.iter_violations(
+            folder,
+            cache_dir=cache_dir,
+            ignore=ignore,
+            exclude=exclude,
+            source=source,
+            as_of=as_of,
+            profile=profile,
+        )
+        violations = ViolationStore(records) if compact else _collect(records)
+        return violations if profile is None else (violations, profile)
+
+    @fill_doc
+    def iter_violations(
+        self,
+        folder: Path | str,
+        *,
+        cache_dir: Path | str | None = None,
+        ignore: Sequence[str] | None = None,
+        exclude: Exclude | None = None,
+        source: TreeSource | None = None,
+        as_of: date | str | None = None,
+        profile: Profile | None = None,
+    ) -> Generator[tuple[Path, str, list[int]], None, None]:
+        """Iterate over the violations in a folder from the documentary system.
+
+        Parameters
+        ----------
+        folder : Path | str
+            Path to the folder to validate.
+        %(cache_dir)s
+        %(ignore)s
+        %(exclude)s
+        %(source)s
+        %(as_of)s
+        %(profile)s
+
+        Yields
+        ------
+        %(violation_record)s
+        """
+        check_type(source, (TreeSource, None), "source")
+        check_type(profile, (Profile, None), "profile")
+        if isinstance(source, FileSystemSource):
+            source = None  # the file system is listed directly
+        folder = ensure_path(folder, must_exist=source is None)
+        if source is not None and not source.is_dir(folder):
+            raise FileNotFoundError(f"The provided path '{folder}' does not exist.")
+        if self._closed:
+            raise RuntimeError("The validator is closed.")
+        filters = _Filters(() if ignore is None else ignore, exclude, folder)
+        today = _reference_date(as_of)
+        if source is not None and cache_dir is not None:
+            raise ValueError(
+                "The results can only be cached when validating the file system."
+            )
+        if cache_dir is None:
+            cache, writer = None, None
+        else:
+            cache_dir = ensure_path(cache_dir, must_exist=False)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            fname = _cache_fname(cache_dir, folder)
+            # the results with a date in the future are never cached, thus only an
+            # explicit reference date invalidates the cache.
+            settings = _settings(
+                ignore=filters.ignore,
+                exclude=repr(filters.exclude),
+                as_of=None if as_of is None else today,
+            )
+            cache, writer = _CacheReader(fname, settings), _CacheWriter(fname, settings)
+        # the warnings of the rules are counted during the walk and summarized once
+        warnings = _WarningCollector()
+        start = perf_counter_ns()
+        try:
+            errors, code = _validate_folder_name(
+                folder.name, _folder_code(folder.parent.name)
+            )
+            if not filters.ignored(os.curdir):
+                yield from _records(folder, errors)
+            if filters.pruned(os.curdir):
+                pass  # every path below the folder is ignored
+            elif source is not None or (pool := self._get_pool()) is None:
+                # an in-memory source is walked in the calling process, listing it is
+                # cheaper than sending it to the workers.
+                yield from _iter_folder(
+                    folder,
+                    code,
+                    cache,
+                    writer,
+                    filters,
+                    today,
+                    source,
+                    profile,
+                    warnings,
+                )
+            elif self._executor == "threads":
+                # threads share memory, thus the scheduling is done folder by folder
+                # to keep as many directory listings in flight as there are workers.
+                yield from _schedule(
+                    pool,
+                    self._n_jobs,
+                    1,
+                    1,
+                    folder,
+                    code,
+                    cache,
+                    writer,
+                    filters,
+                    today,
+                    profile,
+                    warnings,
+                )
+            else:
+                yield from _schedule(
+                    pool,
+                    self._n_jobs,
+                    self._chunksize,
+                    _TASK_MAX_FOLDERS,
+                    folder,
+                    code,
+                    cache,
+                    writer,
+                    filters,
+                    today,
+                    profile,
+                    warnings,
+                )
+        except BaseException:
+            if writer is not None:
+                cache.close()
+                writer.abort()
+            raise
+        if writer is not None:
+            # the database of the previous run can not be replaced while it is open
+            cache.close()
+            writer.commit()
+        if profile is not None:
+            profile._add("total", perf_counter_ns() - start)
+        warnings.emit()
+
+    @property
+    def n_jobs(self) -> int:
+        """Number of workers.
+
+        :type: int
+        """
+        return self._n_jobs
+
+    @property
+    def executor(self) -> str:
+        """Type of workers, ``"processes"`` or ``"threads"``.
+
+        :type: str
+        """
+        return self._executor
+
+
+def _collect(
+    records: Generator[tuple[Path, str, list[int]], None, None],
+) -> dict[str, dict[Path, list[int]]]:
+    """Collect violation records in a dictionary of violations."""
     violations = {"primary": dict(), "secondary": dict()}
-    if n_jobs == 1:
-        _validate_folder(folder, violations)
-    else:
-        folders = []  # list subfolders and validate files
-        for elt in folder.iterdir():
-            if elt.is_file():
-                errors = validate_file_name(elt)
-                for key in ("primary", "secondary"):
-                    if len(errors[key]) != 0:
-                        violations[key][elt] = errors[key]
-            elif elt.is_dir() and elt.name.lower() != "__old":
-                folders.append(elt)
-        # validate subfolders in parallel
-        n_jobs = _ensure_n_jobs(n_jobs, len(folders))
-        with mp.Pool(processes=n_jobs, maxtasksperchild=1) as pool:
-            results = pool.starmap(validate_folder, [(folder, 1) for folder in folders])
-        for result in results:
-            for key in ("primary", "secondary"):
-                violations[key].update(result[key])
+    for path, severity, codes in records:
+        violations[severity][path] = codes
     return violations
 
 
-@fill_doc
-def _validate_folder(
-    folder: Path, violations: dict[str, dict[Path, list[int]]]
-) -> None:
-    """Validate a folder and its content recursively.
+def _iter_folder(
+    folder: Path,
+    code: str | None,
+    cache: _CacheReader | None,
+    writer: _CacheWriter | None,
+    filters: _Filters,
+    today: int,
+    source: TreeSource | None = None,
+    profile: Profile | None = None,
+    warnings: _WarningCollector | None = None,
+) -> Generator[tuple[Path, str, list[int]], None, None]:
+    """Validate the content of a folder, in the calling process.
 
     Parameters
     ----------
     folder : Path
-        Path to the folder to validate.
-    %(violations)s
+        Path to the folder to walk. The folder name itself is not validated.
+    code : str | None
+        Code of the folder, or None if the folder name is invalid.
+    cache : _CacheReader | None
+        Cache of the previous run, or None to disable caching.
+    writer : _CacheWriter | None
+        Cache of the current run, or None to disable caching.
+    filters : _Filters
+        Rules selecting the folders walked and the violations reported.
+    today : int
+        Reference date of the validation, as an integer YYYYMMDD.
+    source : TreeSource | None
+        Source listing the entries of the folders, or None to list the file system.
+    profile : Profile | None
+        Profile filled during the walk, or None to disable profiling.
+    warnings : _WarningCollector | None
+        Collector of the warnings emitted while listing the folders, or None to emit
+        them immediately. The collector is only active while a folder is listed, not
+        while the records are consumed.
+    """
+    if warnings is None:
+        warnings = nullcontext()
+    stack = [(folder, code)]
+    records = []
+    rows = []
+    while len(stack) != 0:
+        start = 0 if profile is None else perf_counter_ns()
+        with warnings:
+            folders = _scan(
+                *stack.pop(), records, rows, cache, filters, today, source, profile
+            )
+        stack.extend(reversed(folders))
+        if profile is not None:
+            profile._worker(0, 1, perf_counter_ns() - start)
+        yield from records
+        records.clear()
+        if writer is not None:
+            writer.add(rows)
+            rows.clear()
+
+
+def _schedule(
+    pool: mp.pool.Pool,
+    n_jobs: int,
+    chunksize: int,
+    max_folders: int,
+    folder: Path,
+    code: str | None,
+    cache: _CacheReader | None,
+    writer: _CacheWriter | None,
+    filters: _Filters,
+    today: int,
+    profile: Profile | None = None,
+    warnings: _WarningCollector | None = None,
+) -> Generator[tuple[Path, str, list[int]], None, None]:
+    """Validate the content of a folder by scheduling folders dynamically on a pool.
+
+    The scheduler holds a queue of folders left to walk, along their code. Each task
+    pulls a chunk of folders from the queue and walks them for at most
+    ``max_folders`` folders, after which the folders left on the worker stack are
+    returned and pushed back on the queue. Large subtrees are thus split between all
+    workers. While the queue holds fewer folders than there are idle workers, e.g.
+    at the start of the walk from the root alone, each task lists a single folder and
+    returns its subfolders right away to feed the idle workers.
+
+    Parameters
+    ----------
+    pool : Pool | ThreadPool
+        Pool of workers.
+    n_jobs : int
+        Number of workers in the pool.
+    chunksize : int
+        Maximum number of folders sent in a single task. The chunk is reduced when
+        the queue is too short to feed every worker.
+    max_folders : int
+        Maximum number of folders listed in a single task, once the queue holds
+        enough folders to feed every idle worker.
+    folder : Path
+        Path to the folder to walk. The folder name itself is not validated.
+    code : str | None
+        Code of the folder, or None if the folder name is invalid.
+    cache : _CacheReader | None
+        Cache of the previous run, or None to disable caching.
+    writer : _CacheWriter | None
+        Cache of the current run, or None to disable caching.
+    filters : _Filters
+        Rules selecting the folders walked and the violations reported.
+    today : int
+        Reference date of the validation, as an integer YYYYMMDD.
+    profile : Profile | None
+        Profile filled with the wait on the workers, the merge of their results and
+        the profiles of their tasks, or None to disable profiling.
+    warnings : _WarningCollector | None
+        Collector in which the warnings of the tasks are merged, or None to emit
+        them as the tasks complete.
     """
-    errors = validate_folder_name(folder)
-    for key in ("primary", "secondary"):
-        if len(errors[key]) != 0:
-            violations[key][folder] = errors[key]
-    for elt in folder.iterdir():
-        if elt.is_dir() and elt.name.lower() == "__old":
-            pass
-        elif elt.is_dir():
-            _validate_folder(elt, violations)
+    # the threads share memory, thus their records are not compacted for pickling
+    compact = not isinstance(pool, ThreadPool)
+    pending = deque([(folder, code)])
+    results = SimpleQueue()
+    n_running = 0
+    while len(pending) != 0 or n_running != 0:
+        while len(pending) != 0 and n_running < n_jobs:
+            size = min(chunksize, max(1, len(pending) // n_jobs))
+            # short tasks while the queue is too short to feed every idle worker
+            budget = max_folders if n_jobs - n_running <= len(pending) else 1
+            chunk = [pending.popleft() for _ in range(size)]
+            pool.apply_async(
+                _walk_task,
+                (
+                    chunk,
+                    budget,
+                    cache,
+                    filters,
+                    today,
+                    profile is not None,
+                    compact,
+                ),
+                callback=results.put,
+                error_callback=results.put,
+            )
+            n_running += 1
+        if profile is None:
+            result = results.get()
         else:
-            errors = validate_file_name(elt)
-            for key in ("primary", "secondary"):
-                if len(errors[key]) != 0:
-                    violations[key][elt] = errors[key]
+            start = perf_counter_ns()
+            result = results.get()
+            profile._add("wait", perf_counter_ns() - start)
+        n_running -= 1
+        if isinstance(result, BaseException):
+            raise result
+        start = 0 if profile is None else perf_counter_ns()
+        records, folders, rows, task_profile, task_warnings = result
+        pending.extend(folders)
+        if warnings is None:
+            task_warnings.emit()
+        else:
+            warnings.merge(task_warnings)
+        if writer is not None:
+            writer.add(rows)
+        if profile is not None:
+            records = list(records)  # decode the records in the merge phase
+            profile._merge(task_profile)
+            profile._add("merge", perf_counter_ns() - start)
+        yield from records
+
+
+def _walk_task(
+    folders: list[tuple[Path, str | None]],
+    max_folders: int,
+    cache: _CacheReader | None,
+    filters: _Filters,
+    today: int,
+    profile: bool = False,
+    compact: bool = True,
+) -> tuple[
+    ViolationStore | list[tuple[Path, str, list[int]]],
+    list[tuple[Path, str | None]],
+    list[tuple[str, int, int, str, str]],
+    Profile | None,
+    _WarningCollector,
+]:
+    """Walk a chunk of folders for at most 'max_folders' folders, in a worker.
+
+    Returns the violations found, the folders left to walk along their code, the
+    rows to write in the cache of the current run, the profile of the task, or None
+    if 'profile' is False, and the warnings collected during the task. If 'compact'
+    is True, the violations are returned in a compact container, cheaper to pickle
+    than the violation records, else the violation records are returned as is, e.g.
+    to a thread which shares the memory of the scheduler.
+    """
+    start = perf_counter_ns()
+    profile = Profile() if profile else None
+    records = []
+    rows = []
+    stack = folders[::-1]
+    n_folders = 0
+    with _WarningCollector() as warnings:
+        while len(stack) != 0 and n_folders < max_folders:
+            stack.extend(
+                reversed(
+                    _scan(
+                        *stack.pop(),
+                        records,
+                        rows,
+                        cache,
+                        filters,
+                        today,
+                        profile=profile,
+                    )
+                )
+            )
+            n_folders += 1
+    if compact:
+        records = ViolationStore(records)
+    if profile is not None:
+        profile._worker(1, n_folders, perf_counter_ns() - start)
+    return records, stack[::-1], rows, profile, warnings
+
 
+def _scan(
+    folder: Path,
+    code: str | None,
+    records: list[tuple[Path, str, list[int]]],
+    rows: list[tuple[str, int, int, str, str]],
+    cache: _CacheReader | None,
+    filters: _Filters | None = None,
+    today: int | None = None,
+    source: TreeSource | None = None,
+    profile: Profile | None = None,
+) -> list[tuple[Path, str | None]]:
+    """Validate the entries of a folder, reusing the cached results if possible.
 
-def _ensure_n_jobs(n_jobs: int, n_folders: int) -> int:
+    Parameters
+    ----------
+    folder : Path
+        Path to the folder to list.
+    code : str | None
+        Code of the folder, or None if the folder name is invalid.
+    records : list
+        List of violation records ``(path, severity, codes)``, extended in-place.
+    rows : list
+        List of rows to write in the cache of the current run, extended in-place.
+    cache : _CacheReader | None
+        Cache of the previous run, or None to disable caching.
+    filters : _Filters | None
+        Rules selecting the folders walked and the violations reported.
+    today : int | None
+        Reference date of the validation, as an integer YYYYMMDD. If None, the date
+        of the day is used.
+    source : TreeSource | None
+        Source listing the entries of the folder, or None to list the file system.
+        The cache is only used with the file system.
+    profile : Profile | None
+        Profile filled during the validation, or None to disable profiling.
+
+    Returns
+    -------
+    folders : list of tuple
+        List of subfolders to descend into along their code, in the order they were
+        listed.
+    """
+    if cache is None:
+        return _scan_folder(folder, code, records, filters, today, source, profile)
+    # the folder is stat before it is listed, thus a change during the listing
+    # invalidates the entry on the next run.
+    start = 0 if profile is None else perf_counter_ns()
+    stat = os.stat(folder)
+    if profile is not None:
+        profile._count("stats")
+        profile._add("stat", perf_counter_ns() - start)
+        start = perf_counter_ns()
+    results = cache.get(str(folder), stat.st_ino, stat.st_mtime_ns)
+    if results is None:
+        records_ = []
+        if profile is not None:
+            profile._add("cache", perf_counter_ns() - start)
+        folders = _scan_folder(folder, code, records_, filters, today, profile=profile)
+        start = 0 if profile is None else perf_counter_ns()
+        row = _encode(folder, stat, records_, folders)
+        if row is not None:
+            rows.append(row)
+    else:
+        records_, folders = _decode(folder, results)
+        rows.append((str(folder), stat.st_ino, stat.st_mtime_ns, *results))
+        if profile is not None:
+            profile._count("cache_hits")
+    if profile is not None:
+        profile._add("cache", perf_counter_ns() - start)
+    records.extend(records_)
+    return folders
+
+
+def _scan_folder(
+    folder: Path,
+    code: str | None,
+    records: list[tuple[Path, str, list[int]]],
+    filters: _Filters | None = None,
+    today: int | None = None,
+    source: TreeSource | None = None,
+    profile: Profile | None = None,
+) -> list[tuple[Path, str | None]]:
+    """Validate the entries of a folder.
+
+    The folder is listed once with :func:`os.scandir` and the type information cached
+    on the :class:`os.DirEntry` is used to separate files from folders, thus no
+    additional stat call is issued per entry on most file systems. The code of the
+    folder was parsed when its own name was validated, thus each name is matched
+    exactly once and the entries are compared to their parent with string
+    comparisons. The entries of an in-memory source expose the same interface as
+    :class:`os.DirEntry` and go through the same rules.
+
+    Parameters
+    ----------
+    folder : Path
+        Path to the folder to list.
+    code : str | None
+        Code of the folder, or None if the folder name is invalid.
+    records : list
+        List of violation records ``(path, severity, codes)``, extended in-place.
+    filters : _Filters | None
+        Rules selecting the folders walked and the violations reported. If None,
+        every violation is reported and every subfolder except the ``"__old"``
+        folders is walked.
+    today : int | None
+        Reference date of the validation, as an integer YYYYMMDD. If None, the date
+        of the day is used.
+    source : TreeSource | None
+        Source listing the entries of the folder, or None to list the file system.
+    profile : Profile | None
+        Profile filled during the validation, or None to disable profiling. The
+        rules are then timed one by one.
+
+    Returns
+    -------
+    folders : list of tuple
+        List of subfolders to descend into along their code, in the order they were
+        listed.
+    """
+    if filters is None:
+        filters = _DEFAULT_FILTERS
+    if today is None:
+        today = _reference_date()
+    if profile is None:
+        validate_file_name, validate_folder_name = (
+            _validate_file_name,
+            _validate_folder_name,
+        )
+    else:
+        validate_file_name, validate_folder_name = (
+            profile._file_name,
+            profile._folder_name,
+        )
+        start, rules = perf_counter_ns(), profile._rules
+    prefix = None if len(filters.ignore) == 0 else filters.prefix(folder)
+    folders = []
+    scandir = os.scandir if source is None else source.scandir
+    with scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                if filters.excluded(entry.name):
+                    continue
+                errors, subcode = validate_folder_name(entry.name, code)
+                if prefix is None or not filters.pruned(prefix + entry.name):
+                    folders.append((folder / entry.name, subcode))
+            else:
+                errors = validate_file_name(entry.name, code, today)
+            if len(errors["primary"]) == 0 and len(errors["secondary"]) == 0:
+                continue
+            if prefix is None or not filters.ignored(prefix + entry.name):
+                records.extend(_records(folder / entry.name, errors))
+    if profile is not None:
+        profile._count("listings")
+        profile._add("list", perf_counter_ns() - start - (profile._rules - rules))
+    return folders
+
+
+def _records(
+    path: Path, errors: dict[str, list[int]]
+) -> list[tuple[Path, str, list[int]]]:
+    """Convert the errors of a path to violation records."""
+    return [
+        (path, severity, errors[severity])
+        for severity in ("primary", "secondary")
+        if len(errors[severity]) != 0
+    ]
+
+
+def _ensure_n_jobs(n_jobs: int, executor: str = "processes") -> int:
     """Ensure the n_jobs argument value is valid."""
     if n_jobs < 1:
         raise ValueError("The number of jobs must be an integer greater or equal to 1.")
-    if n_folders < n_jobs:
-        warn(
-            f"The number of requested jobs {n_jobs} is greater than the number of "
-            f"subfolders {n_folders}. The number of jobs will be reduced to "
-            f"{n_folders}."
-        )
-        n_jobs = n_folders
-    if mp.cpu_count() < n_jobs:
+    # threads spend most of their time waiting on I/O, thus they are not capped by
+    # the number of CPUs.
+    if executor == "processes" and mp.cpu_count() < n_jobs:
         warn(
             f"The number of requested jobs {n_jobs} is greater than the number of "
             f"available CPUs {mp.cpu_count()}. The number of jobs will be reduced "
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import click
+
+
+@click.command(name="bench-gen")
+@click.argument("folder", type=click.Path(file_okay=False))
+@click.option(
+    "--depth",
+    help="Number of nested levels of folders.",
+    type=int,
+    default=4,
+    show_default=True,
+)
+@click.option(
+    "--fanout",
+    help="Number of subfolders in each folder.",
+    type=click.IntRange(1, 26),
+    default=4,
+    show_default=True,
+)
+@click.option(
+    "--files",
+    help="Number of files in each folder.",
+    type=int,
+    default=5,
+    show_default=True,
+)
+@click.option(
+    "--old-ratio",
+    help="Ratio of the folders containing an '__Old' folder.",
+    type=click.FloatRange(0, 1),
+    default=0.3,
+    show_default=True,
+)
+@click.option(
+    "--violation-rate",
+    help="Ratio of the files and folders with an injected violation.",
+    type=click.FloatRange(0, 1),
+    default=0.01,
+    show_default=True,
+)
+@click.option(
+    "--seed",
+    help="Seed of the random generators.",
+    type=int,
+    default=0,
+    show_default=True,
+)
+@click.option("--jobs", help="Number of jobs running in parallel.", type=int, default=1)
+def run(folder, depth, fanout, files, old_ratio, violation_rate, seed, jobs) -> None:
+    """Generate a synthetic documentary structure for benchmarks."""
+    from ..bench import generate_tree
+
+    counts = generate_tree(
+        folder,
+        depth=depth,
+        fanout=fanout,
+        n_files=files,
+        old_ratio=old_ratio,
+        violation_rate=violation_rate,
+        seed=seed,
+        n_jobs=jobs,
+    )
+    click.echo(
+        f"Generated {counts['folders']} folders and {counts['files']} files with "
+        f"{counts['violations']} injected violations in '{folder}'."
+    )
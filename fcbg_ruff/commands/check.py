@@ -1,13 +1,24 @@
-import fnmatch
+import json
+import os
+import shutil
+from datetime import datetime
 from pathlib import Path
+from tempfile import TemporaryFile
+from time import perf_counter_ns
 
 import click
 
-from ..check import validate_folder
+from ..check import (
+    Exclude,
+    Profile,
+    iter_archive_violations,
+    iter_listing_violations,
+    iter_violations,
+)
 
 
 @click.command(name="check")
-@click.argument("folder", type=click.Path(exists=True, file_okay=False))
+@click.argument("folder", type=click.Path())
 @click.option(
     "--output",
     help="Path to the output file.",
@@ -21,24 +32,252 @@ from ..check import validate_folder
     type=str,
     multiple=True,
 )
+@click.option(
+    "--exclude",
+    "-e",
+    help="Do not walk the folders with the provided name.",
+    type=str,
+    multiple=True,
+)
+@click.option(
+    "--iexclude",
+    help="Do not walk the folders with the provided name, regardless of its case, "
+    "in addition to the '__old' folders.",
+    type=str,
+    multiple=True,
+)
+@click.option(
+    "--exclude-pattern",
+    help="Do not walk the folders whose name matches the provided global pattern.",
+    type=str,
+    multiple=True,
+)
 @click.option("--jobs", help="Number of jobs running in parallel.", type=int, default=1)
-def run(folder, output, ignore, jobs) -> None:
-    """Run check() command."""
+@click.option(
+    "--executor",
+    help="Type of workers used when running jobs in parallel.",
+    type=click.Choice(["processes", "threads"]),
+    default="processes",
+    show_default=True,
+)
+@click.option(
+    "--cache-dir",
+    help="Directory where the results are cached to speed-up the next runs.",
+    type=click.Path(file_okay=False),
+)
+@click.option(
+    "--as-of",
+    help="Reference date YYYY-MM-DD against which the dates in the file names are "
+    "validated, for reproducible audits. Defaults to the date of the day.",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+)
+@click.option(
+    "--watch",
+    help="Keep watching the folder and update the output file on changes.",
+    is_flag=True,
+)
+@click.option(
+    "--interval",
+    help="Time between two checks for changes in watch mode, in seconds.",
+    type=float,
+    default=2.0,
+    show_default=True,
+)
+@click.option(
+    "--events",
+    help="Path to a JSONL file where the changes are appended in watch mode.",
+    type=click.Path(exists=False, dir_okay=False),
+)
+@click.option(
+    "--from-listing",
+    help="Validate the folder from a listing of its content produced beforehand, "
+    "without accessing the folder.",
+    type=click.Path(exists=True, dir_okay=False),
+)
+@click.option(
+    "--listing-format",
+    help="Format of the listing, 'find' for the output of find -printf '%y %P\\n' "
+    "and 'paths' for one relative path per line.",
+    type=click.Choice(["find", "paths"]),
+    default="find",
+    show_default=True,
+)
+@click.option(
+    "--profile",
+    help="Time and count the phases of the validation, print a summary table and "
+    "save it to a JSON file next to the output file.",
+    is_flag=True,
+)
+def run(
+    folder,
+    output,
+    ignore,
+    exclude,
+    iexclude,
+    exclude_pattern,
+    jobs,
+    executor,
+    cache_dir,
+    as_of,
+    watch,
+    interval,
+    events,
+    from_listing,
+    listing_format,
+    profile,
+) -> None:
+    """Run check() command.
+
+    FOLDER is a folder, or a ZIP or TAR archive validated without extraction. With
+    --from-listing, FOLDER is the folder from which the listing was produced and does
+    not need to exist.
+    """
     folder = Path(folder)
     output = Path(output)
     if not output.parent.exists():
         raise FileNotFoundError(f"Parent folder '{output.parent}' does not exist.")
-    violations = validate_folder(folder, jobs)
-    # filter out ignored patterns
-    for key in ("primary", "secondary"):
-        violations[key] = {
-            key: value
-            for key, value in violations[key].items()
-            if not any(fnmatch.fnmatch(key.as_posix(), pattern) for pattern in ignore)
-        }
-    # write results
-    with open(output, "w") as f:
-        for key in ("primary", "secondary"):
-            f.write(f"\n{key.capitalize()} violations:\n\n")
-            for elt, value in violations[key].items():
-                f.write(f"{value}\t{elt.relative_to(folder)}\n")
+    exclude = Exclude(exclude, ("__old", *iexclude), exclude_pattern)
+    as_of = None if as_of is None else as_of.date()
+    if from_listing is not None:
+        if watch or cache_dir is not None or profile or jobs != 1:
+            raise click.UsageError(
+                "The options --watch, --cache-dir, --profile and --jobs can not be "
+                "used with --from-listing."
+            )
+        records = iter_listing_violations(
+            from_listing,
+            folder,
+            fmt=listing_format,
+            ignore=ignore,
+            exclude=exclude,
+            as_of=as_of,
+        )
+        _write(output, folder, records)
+        return
+    if not folder.exists():
+        raise click.BadParameter(
+            f"Path '{folder}' does not exist.", param_hint="'FOLDER'"
+        )
+    if folder.is_file():
+        if watch or cache_dir is not None or profile or jobs != 1:
+            raise click.UsageError(
+                "The options --watch, --cache-dir, --profile and --jobs can not be "
+                "used with an archive."
+            )
+        records = iter_archive_violations(
+            folder, ignore=ignore, exclude=exclude, as_of=as_of
+        )
+        # the members are listed from the root of the archive, which has no name
+        try:
+            _write(output, Path(os.curdir), records)
+        except ValueError as error:
+            raise click.BadParameter(str(error), param_hint="'FOLDER'") from None
+        return
+    if watch:
+        if profile or jobs != 1 or cache_dir is not None:
+            raise click.UsageError(
+                "The options --profile, --jobs and --cache-dir can not be used with "
+                "--watch."
+            )
+        _watch(folder, output, ignore, exclude, as_of, interval, events)
+        return
+    profile = Profile() if profile else None
+    records = iter_violations(
+        folder,
+        jobs,
+        executor=executor,
+        cache_dir=cache_dir,
+        ignore=ignore,
+        exclude=exclude,
+        as_of=as_of,
+        profile=profile,
+    )
+    _write(output, folder, records, profile=profile)
+    if profile is not None:
+        fname = output.with_name(f"{output.stem}.profile.json")
+        profile.save(fname)
+        click.echo(profile.summary())
+        click.echo(f"\nProfile saved to '{fname}'.")
+
+
+def _write(output, folder, records, profile=None) -> None:
+    """Write the violation records to the output file.
+
+    The time spent writing is added to the profile if provided.
+    """
+    if profile is not None:
+        records = _timed(records, profile)
+    # write results as they are found, the secondary violations are buffered in a
+    # temporary file until the primary section is complete.
+    prefix = _prefix(folder)
+    with open(output, "w") as f, TemporaryFile("w+") as secondary:
+        f.write("\nPrimary violations:\n\n")
+        for elt, severity, value in records:
+            fid = f if severity == "primary" else secondary
+            fid.write(f"{value}\t{_relpath(elt, folder, prefix)}\n")
+        start = perf_counter_ns()
+        f.write("\nSecondary violations:\n\n")
+        secondary.seek(0)
+        shutil.copyfileobj(secondary, f)
+        if profile is not None:
+            profile._add("output", perf_counter_ns() - start)
+
+
+def _watch(folder, output, ignore, exclude, as_of, interval, events) -> None:
+    """Watch the folder and keep the output file up to date."""
+    from ..check import Watcher
+
+    tmp = output.with_name(f".{output.name}.tmp")
+    prefix = _prefix(folder)
+    with Watcher(folder, ignore=ignore, exclude=exclude, as_of=as_of) as watcher:
+        _write(tmp, folder, watcher.iter_violations())
+        os.replace(tmp, output)
+        click.echo(f"Watching '{folder}' ({watcher.backend}), press Ctrl+C to stop.")
+        try:
+            while True:
+                changes = watcher.update(timeout=interval)
+                if len(changes) == 0:
+                    continue
+                _write(tmp, folder, watcher.iter_violations())
+                os.replace(tmp, output)
+                if events is None:
+                    continue
+                with open(events, "a") as fid:
+                    for event, elt, severity, codes in changes:
+                        record = dict(
+                            time=datetime.now().isoformat(timespec="seconds"),
+                            event=event,
+                            path=Path(_relpath(elt, folder, prefix)).as_posix(),
+                            severity=severity,
+                            codes=codes,
+                        )
+                        fid.write(json.dumps(record) + "\n")
+        except KeyboardInterrupt:
+            pass
+
+
+def _timed(records, profile):
+    """Time the writing of the records, while the generator is suspended."""
+    for record in records:
+        start = perf_counter_ns()
+        yield record
+        profile._add("output", perf_counter_ns() - start)
+
+
+def _prefix(folder: Path) -> str:
+    """Get the prefix of the paths of the entries of a folder."""
+    return "" if str(folder) == os.curdir else os.path.join(str(folder), "")
+
+
+def _relpath(path: Path, folder: Path, prefix: str) -> str:
+    """Express a path from the walk of a folder relative to this folder.
+
+    The paths are joined below the folder during the walk, thus slicing the prefix of
+    the folder off replaces a path computation per entry.
+    """
+    path_ = str(path)
+    if path_ == str(folder):
+        return os.curdir
+    if path_.startswith(prefix):
+        return path_[len(prefix) :]
+    return str(path.relative_to(folder))  # pragma: no cover
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import click
 
+from .bench_gen import run as bench_gen
 from .check import run as check
 from .sys_info import run as sys_info
 
@@ -13,3 +14,4 @@ def run() -> None:  # noqa: D401
 
 run.add_command(sys_info)
 run.add_command(check)
+run.add_command(bench_gen)
@@ -0,0 +1,18 @@
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from ..bench_gen import run
+
+
+def test_bench_gen(tmp_path: Path):
+    """Test the bench-gen command."""
+    runner = CliRunner()
+    result = runner.invoke(
+        run, [str(tmp_path / "tree"), "--depth", "2", "--fanout", "2", "--files", "3"]
+    )
+    assert result.exit_code == 0
+    assert "Generated" in result.output
+    assert len(list((tmp_path / "tree").iterdir())) == 2
+    result = runner.invoke(run, [str(tmp_path / "tree")])
+    assert result.exit_code != 0
@@ -1,4 +1,7 @@
+import json
+import os
 import random
+import shutil
 from pathlib import Path
 
 import pytest
@@ -8,14 +11,17 @@ from ...utils._path import walk_files
 from ..check import run
 
 
-def test_check(folder: Path, tmp_path: Path):
+@pytest.mark.parametrize(
+    "options", [[], ["--jobs", "4", "--executor", "threads"]], ids=["serial", "threads"]
+)
+def test_check(folder: Path, tmp_path: Path, options: list[str]):
     """Test the check command."""
     runner = CliRunner()
     for elt in folder.iterdir():
         if elt.is_file():
             continue
         output = tmp_path / f"{elt.stem}.txt"
-        result = runner.invoke(run, [str(elt), "--output", str(output)])
+        result = runner.invoke(run, [str(elt), "--output", str(output), *options])
         assert result.exit_code == 0
         with open(output) as fid:
             lines = fid.readlines()
@@ -66,3 +72,190 @@ def test_check_ignore(folder_with_invalid_files: Path, tmp_path):
             outputs.extend(fid.readlines())
     assert any(".DS_Store" in elt for elt in outputs)
     assert not any(".Thumbs" in elt for elt in outputs)
+
+    # the patterns also match the paths below the folder as provided
+    elt = next(elt for elt in folder_with_invalid_files.iterdir() if elt.is_dir())
+    output = tmp_path / "output.txt"
+    result = runner.invoke(
+        run, [str(elt), "--output", str(output), "-i", f"{elt.as_posix()}/*"]
+    )
+    assert result.exit_code == 0
+    lines = output.read_text().splitlines()
+    assert [line for line in lines if "\t" in line] == []
+
+
+def test_check_watch(folder: Path, tmp_path_factory, monkeypatch: pytest.MonkeyPatch):
+    """Test the check command in watch mode."""
+    from ...check import Watcher
+
+    update = Watcher.update
+    calls = []
+
+    def _update(self, timeout=None):
+        """Add an invalid file on the first call and stop on the second call."""
+        if len(calls) != 0:
+            raise KeyboardInterrupt
+        calls.append(timeout)
+        (folder / "invalid_file_name.txt").write_text("101")
+        return update(self, timeout=0)
+
+    monkeypatch.setattr(Watcher, "update", _update)
+    tmp_path = tmp_path_factory.mktemp("output")
+    output = tmp_path / "output.txt"
+    events = tmp_path / "events.jsonl"
+    result = CliRunner().invoke(
+        run,
+        [str(folder), "--output", str(output), "--watch", "--events", str(events)],
+    )
+    assert result.exit_code == 0
+    assert "invalid_file_name.txt" in output.read_text()
+    assert '"event": "added", "path": "invalid_file_name.txt"' in events.read_text()
+    for options in (["--profile"], ["--jobs", "2"], ["--cache-dir", str(tmp_path)]):
+        result = CliRunner().invoke(
+            run, [str(folder), "--output", str(output), "--watch", *options]
+        )
+        assert result.exit_code != 0
+        assert "can not be used with --watch" in result.output
+
+
+def test_check_profile(folder: Path, tmp_path: Path):
+    """Test the check command with profiling."""
+    runner = CliRunner()
+    output = tmp_path / "output.txt"
+    result = runner.invoke(run, [str(folder), "--output", str(output), "--profile"])
+    assert result.exit_code == 0
+    assert "file_pattern" in result.output
+    with open(tmp_path / "output.profile.json") as fid:
+        profile = json.load(fid)
+    assert 0 < profile["counts"]["files"]
+    assert 0 < profile["seconds"]["output"]
+    result = runner.invoke(
+        run, [str(folder), "--output", str(output), "--profile", "--watch"]
+    )
+    assert result.exit_code != 0
+
+
+def test_check_as_of(folder: Path, tmp_path: Path):
+    """Test the check command with a reference date."""
+    runner = CliRunner()
+    output = tmp_path / "output.txt"
+    result = runner.invoke(run, [str(folder), "--output", str(output)])
+    assert result.exit_code == 0
+    assert "[21]" not in output.read_text()
+    result = runner.invoke(
+        run, [str(folder), "--output", str(output), "--as-of", "2000-01-01"]
+    )
+    assert result.exit_code == 0
+    assert "[21]" in output.read_text()
+    result = runner.invoke(
+        run, [str(folder), "--output", str(output), "--as-of", "01/01/2000"]
+    )
+    assert result.exit_code != 0
+
+
+def test_check_archive(folder: Path, tmp_path: Path):
+    """Test the check command on an archive."""
+    runner = CliRunner()
+    output = tmp_path / "folder.txt"
+    result = runner.invoke(run, [str(folder), "--output", str(output)])
+    assert result.exit_code == 0
+    archive = shutil.make_archive(tmp_path / "archive", "gztar", folder)
+    result = runner.invoke(run, [archive, "--output", str(tmp_path / "archive.txt")])
+    assert result.exit_code == 0
+    # the root of the archive has no name, its content is validated
+    expected = [
+        line.replace(f"{folder.name}{os.sep}", "", 1)
+        for line in output.read_text().splitlines()
+        if not line.endswith(f"\t{os.curdir}")
+    ]
+    assert (tmp_path / "archive.txt").read_text().splitlines() == expected
+    for options in (["--watch"], ["--profile"], ["--jobs", "2"]):
+        result = runner.invoke(
+            run, [archive, "--output", str(tmp_path / "archive.txt"), *options]
+        )
+        assert result.exit_code != 0
+        assert "can not be used with an archive" in result.output
+    fname = tmp_path / "corrupted.tar"
+    fname.write_bytes(b"\xff" * 1024)
+    result = runner.invoke(run, [str(fname), "--output", str(tmp_path / "out.txt")])
+    assert result.exit_code != 0
+    assert "not a valid TAR archive" in result.output
+    fname = tmp_path / "file.txt"
+    fname.write_text("101")
+    result = runner.invoke(run, [str(fname), "--output", str(tmp_path / "out.txt")])
+    assert result.exit_code != 0
+    assert "not a supported archive" in result.output
+
+
+def test_check_ignore_archive(folder_with_invalid_files: Path, tmp_path_factory):
+    """Test that the ignore patterns apply the same to a folder and an archive."""
+    tmp_path = tmp_path_factory.mktemp("output")
+    archive = shutil.make_archive(
+        tmp_path / "archive", "zip", folder_with_invalid_files
+    )
+    runner = CliRunner()
+    outputs = []
+    for elt in (folder_with_invalid_files, archive):
+        output = tmp_path / f"{Path(elt).stem}.txt"
+        result = runner.invoke(
+            run,
+            [str(elt), "--output", str(output), "-i", ".", "-i", "*/.DS_Store"]
+            + ["-i", f"./{folder_with_invalid_files.name}/*"],
+        )
+        assert result.exit_code == 0
+        outputs.append(output.read_text())
+    assert ".Thumbs" in outputs[0]
+    assert ".DS_Store" not in outputs[0]
+    assert outputs[1] == outputs[0].replace(
+        f"{folder_with_invalid_files.name}{os.sep}", ""
+    )
+
+
+def test_check_from_listing(folder: Path, tmp_path_factory):
+    """Test the check command on a listing of a folder."""
+    tmp_path = tmp_path_factory.mktemp("listing")
+    runner = CliRunner()
+    output = tmp_path / "folder.txt"
+    result = runner.invoke(run, [str(folder), "--output", str(output)])
+    assert result.exit_code == 0
+    listing = tmp_path / "listing.txt"
+    with open(listing, "w", encoding="utf-8") as fid:
+        for root, _, files in os.walk(folder):
+            root = os.path.relpath(root, folder)
+            fid.writelines(
+                f"{os.path.normpath(os.path.join(root, name))}\n" for name in files
+            )
+    # the folder is not accessed, it does not need to exist
+    missing = tmp_path / folder.name
+    result = runner.invoke(
+        run,
+        [
+            str(missing),
+            "--output",
+            str(tmp_path / "listing_output.txt"),
+            "--from-listing",
+            str(listing),
+            "--listing-format",
+            "paths",
+        ],
+    )
+    assert result.exit_code == 0
+    # the violations are written in the order of the listing
+    expected = sorted(output.read_text().splitlines())
+    assert sorted((tmp_path / "listing_output.txt").read_text().splitlines()) == (
+        expected
+    )
+    result = runner.invoke(
+        run,
+        [str(missing), "--output", str(output), "--from-listing", str(listing)],
+    )
+    assert result.exit_code != 0  # the format 'find' is expected by default
+    result = runner.invoke(
+        run,
+        [str(folder), "--output", str(output), "--from-listing", str(listing)]
+        + ["--watch"],
+    )
+    assert result.exit_code != 0
+    result = runner.invoke(run, [str(missing), "--output", str(output)])
+    assert result.exit_code != 0
+    assert "does not exist" in result.output
@@ -9,6 +9,7 @@ from uuid import uuid4
 
 import pytest
 
+from .utils._path import walk_files
 from .utils.logs import logger
 
 if TYPE_CHECKING:
@@ -47,6 +48,35 @@ def folder(tmp_path: Path) -> Path:
     return tmp_path
 
 
+@pytest.fixture(scope="function")
+def folder_with_invalid_files(folder: Path) -> tuple[Path, list[Path]]:
+    """Create a mock documentary structure with invalid file names."""
+    files = [elt for elt in walk_files(folder) if elt.parent.name.lower() != "__old"]
+    invalid_files = random.sample(files, 4)
+    # add a purely invalid fname
+    invalid_files[0].rename(invalid_files[0].parent / "invalid_file_name")
+    invalid_files[0] = invalid_files[0].parent / "invalid_file_name"
+    # add a fname with code not matching parent folder
+    fname = invalid_files[1].name.split("_")
+    fname[0] += "a"
+    fname = "_".join(fname)
+    invalid_files[1].rename(invalid_files[1].parent / fname)
+    invalid_files[1] = invalid_files[1].parent / fname
+    # add a fname with invalid characters in the name
+    fname = invalid_files[2].name.split("_")
+    fname[2] += " a"
+    fname = "_".join(fname)
+    invalid_files[2].rename(invalid_files[2].parent / fname)
+    invalid_files[2] = invalid_files[2].parent / fname
+    # add a fname with a date in the past
+    fname = invalid_files[3].name.split("_")
+    fname[1] = f"40{fname[1][2:]}"
+    fname = "_".join(fname)
+    invalid_files[3].rename(invalid_files[3].parent / fname)
+    invalid_files[3] = invalid_files[3].parent / fname
+    return folder, invalid_files
+
+
 def _create_tree(folder: Path, code: str, depth: int) -> None:
     """Create a directory tree."""
     _create_files(folder, code)
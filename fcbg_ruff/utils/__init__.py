@@ -1,3 +1,12 @@
 """Utilities module."""
 
-from . import config, logs
+from typing import TYPE_CHECKING
+
+from . import logs
+from ._lazy import lazy_attach
+
+# the system information imports psutil and packaging, only used by sys_info
+__getattr__, __dir__, __all__ = lazy_attach(__name__, submodules=("config",))
+
+if TYPE_CHECKING:
+    from . import config
@@ -5,11 +5,10 @@ from __future__ import annotations  # c.f. PEP 563, PEP 649
 import logging
 import operator
 import os
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import numpy as np
-
 from ._docs import fill_doc
 
 if TYPE_CHECKING:
@@ -63,12 +62,27 @@ class _Callable:
         return callable(other)
 
 
+class _NumPyType:
+    """NumPy type, checked without importing NumPy.
+
+    An instance of a NumPy type can not exist before NumPy is imported, thus the check
+    is skipped if NumPy is not imported yet.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __instancecheck__(self, other: Any) -> bool:
+        np = sys.modules.get("numpy")
+        return np is not None and isinstance(other, getattr(np, self._name))
+
+
 _types = {
-    "numeric": (np.floating, float, _IntLike()),
+    "numeric": (_NumPyType("floating"), float, _IntLike()),
     "path-like": (str, Path, os.PathLike),
     "int-like": (_IntLike(),),
     "callable": (_Callable(),),
-    "array-like": (list, tuple, set, np.ndarray),
+    "array-like": (list, tuple, set, _NumPyType("ndarray")),
 }
 
 
@@ -17,29 +17,111 @@ if TYPE_CHECKING:
 docdict: dict[str, str] = dict()
 
 # -- A ---------------------------------------------------------------------------------
+docdict["as_of"] = """
+as_of : date | str | None
+    Reference date of the validation, as a :class:`~datetime.date` or as a string
+    ``"YYYY-MM-DD"``. A file name with a date after the reference date is a
+    violation. If None, the date of the day when the validation starts is used for
+    the entire validation."""
+
 # -- B ---------------------------------------------------------------------------------
 # -- C ---------------------------------------------------------------------------------
+docdict["cache_dir"] = """
+cache_dir : Path | str | None
+    Path to a directory where the validation results of each folder are cached
+    between runs. A folder whose inode and modification time did not change since
+    the previous run is not listed again and its cached results are reused. If None,
+    the results are not cached."""
+
+docdict["compact"] = """
+compact : bool
+    If True, the violations are returned in a
+    :class:`~fcbg_ruff.check.ViolationStore` instead of a dictionary. The container
+    stores the violations in compact columns and creates the Path objects on access,
+    which suits trees with a large number of violations."""
+
 # -- D ---------------------------------------------------------------------------------
 # -- E ---------------------------------------------------------------------------------
 docdict["error_codes"] = """
 error_codes : dict
     Dictionary of error codes, separated between primary and secondary errors."""
 
+docdict["exclude"] = """
+exclude : Exclude | None
+    Folders excluded from the walk, matched on their names, see
+    :class:`~fcbg_ruff.check.Exclude`. An excluded folder is neither validated nor
+    walked. If None, the ``"__old"`` folders are excluded regardless of their case."""
+
+docdict["executor"] = """
+executor : ``"processes"`` | ``"threads"``
+    Type of workers used when ``n_jobs`` is greater than 1. Processes are suited to
+    CPU-bound validation on local disks. Threads are suited to network shares (NFS,
+    SMB) where the validation is bound by the latency of the directory listings; they
+    overlap up to ``n_jobs`` listings and avoid pickling results between processes."""
+
 # -- F ---------------------------------------------------------------------------------
 # -- G ---------------------------------------------------------------------------------
 # -- H ---------------------------------------------------------------------------------
 # -- I ---------------------------------------------------------------------------------
+docdict["ignore"] = """
+ignore : list of str | None
+    Glob patterns of the paths whose violations are not reported, matched with the
+    semantic of :func:`fnmatch.fnmatch` against two POSIX forms of each path:
+
+    - the path as walked, below the validated folder as provided, e.g.
+      ``/mnt/share/_F1a_b/F1a_220101_file_ABC.txt``.
+    - the path relative to the validated folder, prefixed with ``./`` as listed by
+      ``find .``, e.g. ``./_F1a_b/F1a_220101_file_ABC.txt``. The validated folder
+      itself is ``"."``. This form does not depend on the location of the folder,
+      thus a pattern applies the same to a folder, an archive or a listing.
+
+    The violations of a path matching either form are not reported. The patterns are
+    compiled once in a single regular expression. A folder is not walked if every
+    path below it is ignored, e.g. with the pattern ``*/Archive_2010/*``."""
+
 # -- J ---------------------------------------------------------------------------------
 # -- K ---------------------------------------------------------------------------------
 # -- L ---------------------------------------------------------------------------------
 # -- M ---------------------------------------------------------------------------------
+docdict["max_concurrency"] = """
+max_concurrency : int
+    Maximum number of directory listings running concurrently in threads."""
+
 # -- N ---------------------------------------------------------------------------------
+docdict["n_jobs"] = """
+n_jobs : int
+    Number of concurrent workers used for validation. The folders are scheduled
+    dynamically: a worker walks a bounded number of folders and hands the subfolders
+    it did not reach back to a shared queue from which idle workers pull. Parallelism
+    thus scales with the total number of folders in the tree."""
+
 # -- O ---------------------------------------------------------------------------------
 # -- P ---------------------------------------------------------------------------------
+docdict["profile"] = """
+profile : Profile | None
+    Profile filled with the counters and timers of the phases of the validation,
+    see :class:`~fcbg_ruff.check.Profile`. If None, the validation is not
+    profiled."""
+
 # -- Q ---------------------------------------------------------------------------------
 # -- R ---------------------------------------------------------------------------------
 # -- S ---------------------------------------------------------------------------------
+docdict["source"] = """
+source : TreeSource | None
+    Source listing the entries of the tree, e.g. a
+    :class:`~fcbg_ruff.check.DictSource` held in memory or a
+    :class:`~fcbg_ruff.check.PathsSource` built from a listing. The rules are the
+    same for every source. An in-memory source is walked in the
+    calling process and can not be cached. If None, the file system is listed."""
+
 # -- T ---------------------------------------------------------------------------------
+docdict["thread_pool"] = """
+thread_pool : Executor | None
+    Pool of threads running the directory listings, e.g. a
+    :class:`~concurrent.futures.ThreadPoolExecutor` shared by several validations.
+    The pool is not shut down at the end of the validation. If None, a pool of
+    ``max_concurrency`` threads is created for the validation."""
+
 # -- U ---------------------------------------------------------------------------------
 # -- V ---------------------------------------------------------------------------------
 docdict["verbose"] = """
@@ -49,6 +131,14 @@ verbose : int | str | bool | None
     verbosity is set to ``"WARNING"``. If a bool is provided, the verbosity is set to
     ``"WARNING"`` for False and to ``"INFO"`` for True."""
 
+docdict["violation_record"] = """
+path : Path
+    Path to the file or folder violating the naming convention.
+severity : str
+    Severity of the violation, ``"primary"`` or ``"secondary"``.
+codes : list of int
+    Error codes associated to the violation."""
+
 docdict["violations"] = """
 violations : dict
     Dictionary of primary and secondary violations found. The keys are 'primary' and
@@ -0,0 +1,58 @@
+"""Lazy loading of the attributes of a package, with a module-level __getattr__.
+
+Inspired from SPEC 1: https://scientific-python.org/specs/spec-0001/
+"""
+
+from __future__ import annotations  # c.f. PEP 563, PEP 649
+
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+
+def lazy_attach(
+    package: str,
+    submodules: tuple[str, ...] = (),
+    attributes: dict[str, str] | None = None,
+) -> tuple[Callable[[str], Any], Callable[[], list[str]], list[str]]:
+    """Attach submodules and attributes to a package, imported on first access.
+
+    Parameters
+    ----------
+    package : str
+        Name of the package, i.e. ``__name__`` in its ``__init__.py``.
+    submodules : tuple of str
+        Names of the submodules imported on first access.
+    attributes : dict | None
+        Mapping from the name of an attribute to the name of the submodule, relative
+        to the package, which defines it.
+
+    Returns
+    -------
+    __getattr__ : callable
+        Module-level ``__getattr__`` importing an attribute on first access.
+    __dir__ : callable
+        Module-level ``__dir__`` listing the attributes of the package, lazy
+        attributes included.
+    __all__ : list of str
+        Names of the lazy attributes.
+    """
+    attributes = dict() if attributes is None else attributes
+    names = sorted(set(submodules) | set(attributes))
+
+    def __getattr__(name: str) -> Any:
+        if name in submodules:
+            return importlib.import_module(f"{package}.{name}")
+        if name in attributes:
+            module = importlib.import_module(f"{package}.{attributes[name]}")
+            return getattr(module, name)
+        raise AttributeError(f"Module '{package}' has no attribute '{name}'.")
+
+    def __dir__() -> list[str]:
+        return sorted(set(names) | set(vars(sys.modules[package])))
+
+    return __getattr__, __dir__, list(names)
@@ -2,9 +2,10 @@ from __future__ import annotations  # c.f. PEP 563, PEP 649
 
 import inspect
 import logging
-from functools import wraps
+import os
+import threading
+from functools import cache, wraps
 from importlib import import_module
-from pathlib import Path
 from typing import TYPE_CHECKING
 from warnings import warn_explicit
 
@@ -14,9 +15,13 @@ from ._fixes import WrapStdOut
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from pathlib import Path
+    from typing import Any
 
 
 _PACKAGE: str = __package__.split(".")[0]
+# collector of the warnings emitted in bulk by the current thread, if any
+_LOCAL = threading.local()
 
 
 @fill_doc
@@ -42,6 +47,8 @@ def _init_logger(*, verbose: bool | str | int | None = None) -> logging.Logger:
     # add the main handler
     handler = logging.StreamHandler(WrapStdOut())
     handler.setFormatter(_LoggerFormatter())
+    # the warnings emitted with warn() are already displayed by the warnings module
+    handler.addFilter(_not_warned)
     logger.addHandler(handler)
     return logger
 
@@ -208,17 +215,14 @@ def warn(
     """
     if logging.WARNING < logger.level:
         return None
-    root_dirs = [
-        Path(import_module(namespace).__file__).parent
-        for namespace in ignore_namespaces
-    ]
+    root_dirs = _root_dirs(tuple(ignore_namespaces))
     frame = inspect.currentframe()
     while frame:  # at some point it will be None and exit the loop
-        fname = Path(frame.f_code.co_filename)
-        if fname.parent.name == "tests":
+        fname = frame.f_code.co_filename
+        if os.path.basename(os.path.dirname(fname)) == "tests":
             break  # treat tests as outside of the namespace
         lineno = frame.f_lineno
-        if not (any(str(fname).startswith(str(rd)) for rd in root_dirs)):
+        if not fname.startswith(root_dirs):
             break
         frame = frame.f_back
     del frame
@@ -228,16 +232,129 @@ def warn(
     warn_explicit(
         message,
         category,
-        str(fname),
+        fname,
         lineno,
         module,
         globals().get("__warningregistry__", {}),
     )
     # now we emit the warning to the logger, except to the default StreamHandler on
     # stdout registered as the first handler.
-    logger.handlers[0].setLevel(logging.WARNING + 1)
-    logger.warning(message)
-    logger.handlers[0].setLevel(0)
+    logger.warning(message, extra={"_warned": True})
+
+
+@cache
+def _root_dirs(namespaces: tuple[str, ...]) -> tuple[str, ...]:
+    """Get the root directories of namespaces, with a trailing separator."""
+    return tuple(
+        os.path.join(os.path.dirname(import_module(namespace).__file__), "")
+        for namespace in namespaces
+    )
+
+
+def _not_warned(record: logging.LogRecord) -> bool:
+    """Filter out the log records of the warnings emitted with warn()."""
+    return not getattr(record, "_warned", False)
+
+
+def _warn_bulk(
+    template: str, *args: Any, category: type[Warning] = RuntimeWarning
+) -> None:
+    """Emit a warning formatted from a template, or count it if collected.
+
+    Parameters
+    ----------
+    template : str
+        Template of the warning message, formatted with :meth:`str.format`.
+    *args : Any
+        Arguments of the template.
+    category : subclass of Warning
+        The warning class. Defaults to ``RuntimeWarning``.
+    """
+    collector = getattr(_LOCAL, "collector", None)
+    if collector is None:
+        warn(template.format(*args), category)
+    else:
+        collector.add(template, args, category)
+
+
+class _WarningCollector:
+    """Collect the warnings emitted in bulk, counted by message template.
+
+    While the collector is entered as a context manager, the warnings emitted with
+    :func:`_warn_bulk` by the calling thread are counted instead of emitted. Only the
+    first message of each template is formatted. The collector is picklable, thus a
+    worker can return its warnings to be merged and emitted once by the calling
+    process with :meth:`emit`.
+    """
+
+    __slots__ = ("_counts", "_previous")
+
+    def __init__(self) -> None:
+        # (template, category) -> [count, first message]
+        self._counts: dict[tuple[str, type[Warning]], list[int | str]] = dict()
+        self._previous = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the counts."""
+        return {"counts": self._counts}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the counts."""
+        self._counts = state["counts"]
+        self._previous = None
+
+    def __enter__(self) -> _WarningCollector:
+        """Collect the warnings emitted by the calling thread."""
+        self._previous = getattr(_LOCAL, "collector", None)
+        _LOCAL.collector = self
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop collecting the warnings."""
+        _LOCAL.collector = self._previous
+        self._previous = None
+
+    def __len__(self) -> int:
+        """Number of warnings collected."""
+        return sum(count for count, _ in self._counts.values())
+
+    def add(
+        self, template: str, args: tuple[Any, ...], category: type[Warning]
+    ) -> None:
+        """Count a warning."""
+        entry = self._counts.get((template, category))
+        if entry is None:
+            self._counts[(template, category)] = [1, template.format(*args)]
+        else:
+            entry[0] += 1
+
+    def merge(self, other: _WarningCollector) -> None:
+        """Merge the warnings collected by a worker."""
+        for key, (count, message) in other._counts.items():
+            entry = self._counts.get(key)
+            if entry is None:
+                self._counts[key] = [count, message]
+            else:
+                entry[0] += count
+
+    def emit(self) -> None:
+        """Emit a single summary of the warnings collected per category."""
+        categories = dict()
+        for (_, category), (count, message) in self._counts.items():
+            categories.setdefault(category, []).append((count, message))
+        for category, entries in categories.items():
+            if len(entries) == 1 and entries[0][0] == 1:
+                warn(entries[0][1], category)
+                continue
+            total = sum(count for count, _ in entries)
+            lines = [f"{total} warnings were emitted, e.g.:"]
+            lines += [
+                f"- {message}"
+                + ("" if count == 1 else f" ({count - 1} similar warning(s))")
+                for count, message in entries
+            ]
+            warn("\n".join(lines), category)
+        self._counts.clear()
 
 
 logger = _init_logger()
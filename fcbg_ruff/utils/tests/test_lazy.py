@@ -0,0 +1,59 @@
+import subprocess
+import sys
+
+import pytest
+
+import fcbg_ruff
+from fcbg_ruff.utils._lazy import lazy_attach
+
+# modules which are not used by the validation of a folder from the command line
+_HEAVY_MODULES: tuple[str, ...] = ("asyncio", "numpy", "packaging", "psutil", "sqlite3")
+
+
+def _importtime(statement: str) -> dict[str, int]:
+    """Measure the cumulative import time of each module, in microseconds."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = dict()
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import fcbg_ruff.commands.main",
+        "from fcbg_ruff.check import validate_folder",
+        "from fcbg_ruff.check.validator import _walk_task",  # worker processes
+    ],
+)
+def test_importtime(statement: str):
+    """Test that the validation does not import the modules it does not use."""
+    times = _importtime(statement)
+    assert "fcbg_ruff" in times
+    imported = [module for module in _HEAVY_MODULES if module in times]
+    assert imported == [], f"'{statement}' imports {imported}."
+
+
+def test_lazy_attach():
+    """Test the lazy attributes of a package."""
+    assert isinstance(fcbg_ruff.__version__, str)
+    assert callable(fcbg_ruff.sys_info)
+    assert fcbg_ruff.check.validate_names.__name__ == "validate_names"
+    assert "sys_info" in dir(fcbg_ruff)
+    assert "lazy_attach" in dir(fcbg_ruff)  # attribute of the module
+    with pytest.raises(AttributeError, match="has no attribute"):
+        fcbg_ruff.invalid  # noqa: B018
+    __getattr__, __dir__, __all__ = lazy_attach(
+        "fcbg_ruff", submodules=("utils",), attributes={"warn": "utils.logs"}
+    )
+    assert __all__ == ["utils", "warn"]
+    assert __getattr__("warn") is fcbg_ruff.utils.logs.warn
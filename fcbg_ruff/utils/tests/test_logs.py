@@ -1,11 +1,20 @@
 from __future__ import annotations  # c.f. PEP 563, PEP 649
 
 import logging
+import pickle
 from typing import TYPE_CHECKING
 
 import pytest
 
-from fcbg_ruff.utils.logs import _use_log_level, add_file_handler, logger, verbose, warn
+from fcbg_ruff.utils.logs import (
+    _use_log_level,
+    _warn_bulk,
+    _WarningCollector,
+    add_file_handler,
+    logger,
+    verbose,
+    warn,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -138,7 +147,7 @@ def test_file_handler(tmp_path: Path):
     assert "test3" in lines[1]
 
 
-def test_warn(tmp_path: Path):
+def test_warn(tmp_path: Path, capsys: pytest.CaptureFixture):
     """Test warning functions."""
     with _use_log_level("ERROR"):
         warn("This is a warning.", RuntimeWarning)
@@ -151,6 +160,8 @@ def test_warn(tmp_path: Path):
     add_file_handler(fname)
     with pytest.warns(RuntimeWarning, match="Grrrrr"):
         warn("Grrrrr", RuntimeWarning)
+    # the warning is not logged a second time on stdout
+    assert "Grrrrr" not in capsys.readouterr().out
     with _use_log_level("ERROR"):
         warn("WoooW", RuntimeWarning)
     logger.handlers[-1].close()
@@ -158,3 +169,31 @@ def test_warn(tmp_path: Path):
         lines = file.readlines()
     assert len(lines) == 1
     assert "Grrrrr" in lines[0]
+
+
+def test_warning_collector():
+    """Test the collection of warnings emitted in bulk."""
+    collector = _WarningCollector()
+    with collector:
+        for k in range(3):
+            _warn_bulk("Warning {}.", k)
+        _warn_bulk("Other {}.", 0)
+    assert len(collector) == 4
+    collector.merge(pickle.loads(pickle.dumps(collector)))
+    assert len(collector) == 8
+    with pytest.warns(RuntimeWarning) as record:
+        collector.emit()
+    assert len(record) == 1
+    message = str(record[0].message)
+    assert "8 warnings were emitted" in message
+    assert "Warning 0. (5 similar warning(s))" in message
+    assert "Other 0. (1 similar warning(s))" in message
+    assert len(collector) == 0
+    # a single warning is emitted as is, and nothing is collected outside the context
+    with collector:
+        _warn_bulk("Warning {}.", 1)
+    with pytest.warns(RuntimeWarning, match="^Warning 1.$"):
+        collector.emit()
+    with pytest.warns(RuntimeWarning, match="^Warning 2.$"):
+        _warn_bulk("Warning {}.", 2)
+    assert len(collector) == 0